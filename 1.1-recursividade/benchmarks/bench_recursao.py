@@ -0,0 +1,174 @@
+"""
+Benchmark da recursão: funções do notebook x trampolim x laços, com n crescente.
+
+Para cada função de `1.1-Recursividade.ipynb` (soma, intervalo, binário,
+pré-ordem em listas aninhadas), mede a versão original (`originais`), a em
+trampolim e a iterativa, e confere que os resultados são iguais. Onde o
+original passa do limite de recursão, a coluna mostra "estouro". Depois
+compara a primalidade de todos os números até N (notebook, √n e crivos) e o
+ganho da memoização com LRU em consultas repetidas, para vários limites.
+
+Uso:
+    python benchmarks/bench_recursao.py
+    python benchmarks/bench_recursao.py --tamanhos 100 10000 1000000 --repeticoes 3
+"""
+from __future__ import annotations
+import argparse
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from recursao import iterativo, originais, primos, trampolim
+from recursao.arvore import ArvoreBinaria
+from recursao.memo import memoizar
+
+
+def medir(funcao, repeticoes: int):
+    """(mediana em ms, resultado) de `repeticoes` chamadas; (None, None) se estourar a pilha."""
+    tempos = []
+    resultado = None
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        try:
+            resultado = funcao()
+        except RecursionError:
+            return None, None
+        tempos.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(tempos), resultado
+
+
+def com_saida(funcao, *args):
+    """Chama uma função do notebook que imprimia e retorna a lista do que seria impresso."""
+    saida = []
+    funcao(*args, saida)
+    return saida
+
+
+def cadeia(n: int) -> list:
+    """Árvore em listas aninhadas com n nós, todos pela esquerda (altura n)."""
+    arv = None
+    for valor in range(n, 0, -1):
+        arv = [valor, arv, None]
+    return arv
+
+
+def balanceada(n: int) -> list:
+    """Árvore de busca balanceada com os valores 1..n, em listas aninhadas."""
+    return ArvoreBinaria.de_ordenados(list(range(1, n + 1))).para_listas()
+
+
+def casos(n: int):
+    """(nome, notebook, trampolim, iterativo) de cada função para o tamanho n."""
+    numero = (1 << n) - 1   # n dígitos binários
+    arvores = {"cadeia": cadeia(n), "balanceada": balanceada(n)}
+    linhas = [
+        ("soma", lambda: originais.soma(n), lambda: trampolim.soma(n), lambda: iterativo.soma(n)),
+        ("intervalo", lambda: com_saida(originais.intervalo, 1, n),
+         lambda: trampolim.intervalo(1, n), lambda: iterativo.intervalo(1, n)),
+        ("intervalo_invertido", lambda: com_saida(originais.intervalo_invertido, 1, n),
+         lambda: trampolim.intervalo_invertido(1, n), lambda: iterativo.intervalo_invertido(1, n)),
+        ("binario (n bits)", lambda: originais.decimal_para_binario(numero),
+         lambda: trampolim.decimal_para_binario(numero), lambda: iterativo.decimal_para_binario(numero)),
+    ]
+    for forma, arv in arvores.items():
+        compacta = ArvoreBinaria.de_listas(arv)
+        linhas.append((f"pre_ordem {forma}", lambda arv=arv: com_saida(originais.pre_ordem, arv),
+                       lambda arv=arv: trampolim.pre_ordem(arv), lambda arv=arv: iterativo.pre_ordem(arv)))
+        linhas.append(("  arvore compacta", None, None, compacta.pre_ordem))
+    return linhas
+
+
+def formatar(ms) -> str:
+    return "estouro" if ms is None else f"{ms:.3f}"
+
+
+def tabela_funcoes(tamanhos, repeticoes: int) -> None:
+    print(f"{'função':<22} | {'n':>9} | {'notebook ms':>11} | {'trampolim ms':>12} | {'iterativo ms':>12}")
+    for n in tamanhos:
+        for nome, notebook, tramp, iterat in casos(n):
+            t_it, esperado = medir(iterat, repeticoes)
+            colunas = []
+            for funcao in (notebook, tramp):
+                if funcao is None:
+                    colunas.append("-")
+                    continue
+                ms, resultado = medir(funcao, repeticoes)
+                if ms is not None and resultado != esperado:
+                    raise SystemExit(f"{nome}, n={n}: resultado diferente da versão iterativa")
+                colunas.append(formatar(ms))
+            print(f"{nome:<22} | {n:>9,} | {colunas[0]:>11} | {colunas[1]:>12} | {formatar(t_it):>12}")
+
+
+def tabela_primos(limites, repeticoes: int) -> None:
+    print(f"\n{'primos até N':>12} | {'notebook ms':>11} | {'trampolim √n':>12} | "
+          f"{'6k±1 √n ms':>10} | {'crivo ms':>8} | {'segmentado ms':>13} | {'primos':>8}")
+    for limite in limites:
+        numeros = range(limite + 1)
+        resultados = {}
+        for nome, funcao in [
+            ("notebook", lambda: [n for n in numeros if originais.eh_primo(n)]),
+            ("trampolim", lambda: [n for n in numeros if trampolim.eh_primo(n)]),
+            ("6k", lambda: [n for n in numeros if primos.eh_primo(n)]),
+            ("crivo", lambda: primos.primos_ate(limite)),
+            ("segmentado", lambda: primos.primos_no_intervalo(0, limite)),
+        ]:
+            # o original faz ~N²/ln N divisões e o trampolim um passo por divisor: só até um limite
+            if (nome == "notebook" and limite > 5_000) or (nome == "trampolim" and limite > 100_000):
+                resultados[nome] = (None, None)
+                continue
+            resultados[nome] = medir(funcao, repeticoes)
+        esperado = resultados["crivo"][1]
+        for nome, (ms, lista) in resultados.items():
+            if ms is not None and lista != esperado:
+                raise SystemExit(f"primos até {limite}: {nome} diverge do crivo")
+        notebook = "pulado" if limite > 5_000 else formatar(resultados["notebook"][0])
+        tramp = "pulado" if limite > 100_000 else formatar(resultados["trampolim"][0])
+        print(f"{limite:>12,} | {notebook:>11} | {tramp:>12} | "
+              f"{formatar(resultados['6k'][0]):>10} | {formatar(resultados['crivo'][0]):>8} | "
+              f"{formatar(resultados['segmentado'][0]):>13} | {len(esperado):>8,}")
+
+
+def tabela_memo(consultas: int, distintos: int, semente: int) -> None:
+    rng = random.Random(semente)
+    pool = [rng.randrange(10**8, 10**9) | 1 for _ in range(distintos)]
+    # distribuição enviesada (log-uniforme): os primeiros do pool são os mais consultados
+    pedidos = [pool[int(distintos ** rng.random()) - 1] for _ in range(consultas)]
+    print(f"\n{consultas:,} consultas de eh_primo (trampolim, n ~ 10^9) sobre {distintos:,} números")
+    print(f"{'maximo':>8} | {'ms':>9} | {'acertos':>8} | {'despejos':>9} | {'entradas':>9}")
+    t0 = time.perf_counter()
+    for n in pedidos:
+        trampolim.eh_primo(n)
+    print(f"{'sem memo':>8} | {(time.perf_counter() - t0) * 1000:9.1f} | {'-':>8} | {'-':>9} | {'-':>9}")
+    for maximo in (16, 128, 1024, None):
+        memoizada = memoizar(maximo)(trampolim.eh_primo)
+        t0 = time.perf_counter()
+        for n in pedidos:
+            memoizada(n)
+        ms = (time.perf_counter() - t0) * 1000
+        info = memoizada.info()
+        taxa = info.acertos / consultas
+        print(f"{str(maximo):>8} | {ms:9.1f} | {taxa:8.1%} | {info.despejos:>9,} | {info.tamanho:>9,}")
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Recursão: notebook x trampolim x laços.")
+    ap.add_argument("--tamanhos", nargs="+", type=int, default=[100, 900, 10_000, 100_000])
+    ap.add_argument("--primos", nargs="+", type=int, default=[1_000, 5_000, 100_000, 1_000_000])
+    ap.add_argument("--consultas", type=int, default=5_000)
+    ap.add_argument("--distintos", type=int, default=2_000)
+    ap.add_argument("--repeticoes", type=int, default=5)
+    ap.add_argument("--semente", type=int, default=0)
+    args = ap.parse_args()
+
+    print(f"limite de recursão: {sys.getrecursionlimit()}")
+    tabela_funcoes(args.tamanhos, args.repeticoes)
+    tabela_primos(args.primos, max(1, args.repeticoes // 2))
+    tabela_memo(args.consultas, args.distintos, args.semente)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+"""
+Pacote recursao
+===============
+Funções dos exercícios de `1.1-Recursividade.ipynb` em versões que aguentam
+entradas grandes.
+
+- originais: as funções do notebook, como estão lá (com `print` trocado por uma lista).
+- trampolim: recursão sem crescer a pilha (`trampolim` e `continuar`) e as
+  funções do notebook reescritas assim.
+- iterativo: as mesmas funções com laços, sem recursão.
+- memo: decorador de memoização com LRU limitado e contadores.
+- primos: primalidade por divisão até √n (6k ± 1) e crivos para intervalos.
+- arvore: árvore binária em arrays (índices dos filhos) com travessias iterativas.
+
+Só a biblioteca padrão é usada. O benchmark contra as versões do notebook está
+em `benchmarks/bench_recursao.py`.
+"""
+__all__ = ["originais", "trampolim", "iterativo", "memo", "primos", "arvore"]
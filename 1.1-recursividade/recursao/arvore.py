@@ -0,0 +1,177 @@
+"""
+Árvore binária compacta: nós em arrays, filhos por índice, travessias iterativas.
+
+No notebook, cada nó é uma lista [valor, esquerda, direita]: três ponteiros e
+um objeto lista por nó, e a travessia recursiva desce um nível de pilha por
+nível da árvore. Aqui cada nó é um índice: `valores[i]` guarda o valor e
+`esq[i]` e `dir[i]` (arrays de inteiros) guardam os índices dos filhos, com
+-1 para vazio. As travessias usam uma pilha explícita (ou uma fila, por
+nível), então uma árvore degenerada com um milhão de níveis é percorrida
+sem `RecursionError`.
+
+    arv = ArvoreBinaria.de_listas([4, [2, [1, None, None], [3, None, None]], [5, None, None]])
+    arv.pre_ordem()    # [4, 2, 1, 3, 5]
+"""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import Any, List, Optional
+
+VAZIO = -1
+
+
+class ArvoreBinaria:
+    """Árvore binária guardada em três arrays paralelos; a raiz é o nó 0."""
+    __slots__ = ("valores", "esq", "dir")
+
+    def __init__(self):
+        self.valores: List[Any] = []
+        self.esq = array('q')
+        self.dir = array('q')
+
+    def __len__(self) -> int:
+        return len(self.valores)
+
+    def adicionar(self, valor: Any, esq: int = VAZIO, dir: int = VAZIO) -> int:
+        """Cria um nó e retorna o índice dele."""
+        self.valores.append(valor)
+        self.esq.append(esq)
+        self.dir.append(dir)
+        return len(self.valores) - 1
+
+    @classmethod
+    def de_listas(cls, arv: Optional[list]) -> "ArvoreBinaria":
+        """Converte listas aninhadas [valor, esquerda, direita] (sem recursão).
+
+        Os nós ficam numerados em pré-ordem.
+        """
+        nova = cls()
+        if arv is None:
+            return nova
+        pilha = [(arv, VAZIO, 0)]   # (subárvore, índice do pai, 1 = esquerda, 2 = direita)
+        while pilha:
+            no, pai, lado = pilha.pop()
+            i = nova.adicionar(no[0])
+            if lado == 1:
+                nova.esq[pai] = i
+            elif lado == 2:
+                nova.dir[pai] = i
+            if no[2] is not None:
+                pilha.append((no[2], i, 2))
+            if no[1] is not None:
+                pilha.append((no[1], i, 1))
+        return nova
+
+    @classmethod
+    def de_ordenados(cls, valores: List[Any]) -> "ArvoreBinaria":
+        """Árvore de busca balanceada com os valores (já ordenados)."""
+        nova = cls()
+        if not valores:
+            return nova
+        # (início, fim, índice do pai, lado); o meio de cada trecho vira o nó
+        pilha = [(0, len(valores), VAZIO, 0)]
+        while pilha:
+            inicio, fim, pai, lado = pilha.pop()
+            meio = (inicio + fim) // 2
+            i = nova.adicionar(valores[meio])
+            if lado == 1:
+                nova.esq[pai] = i
+            elif lado == 2:
+                nova.dir[pai] = i
+            if meio + 1 < fim:
+                pilha.append((meio + 1, fim, i, 2))
+            if inicio < meio:
+                pilha.append((inicio, meio, i, 1))
+        return nova
+
+    # ------------------------------------------------------------------ #
+    # travessias (pilha ou fila explícita no lugar da recursão)
+    # ------------------------------------------------------------------ #
+    def pre_ordem(self) -> List[Any]:
+        """Valores em pré-ordem (raiz, esquerda, direita)."""
+        valores, esq, dir = self.valores, self.esq, self.dir
+        saida = []
+        pilha = [0] if valores else []
+        while pilha:
+            i = pilha.pop()
+            saida.append(valores[i])
+            d, e = dir[i], esq[i]
+            if d != VAZIO:
+                pilha.append(d)
+            if e != VAZIO:
+                pilha.append(e)
+        return saida
+
+    def em_ordem(self) -> List[Any]:
+        """Valores em ordem simétrica (esquerda, raiz, direita)."""
+        valores, esq, dir = self.valores, self.esq, self.dir
+        saida = []
+        pilha = []
+        i = 0 if valores else VAZIO
+        while pilha or i != VAZIO:
+            while i != VAZIO:       # desce pela esquerda guardando o caminho
+                pilha.append(i)
+                i = esq[i]
+            i = pilha.pop()
+            saida.append(valores[i])
+            i = dir[i]
+        return saida
+
+    def pos_ordem(self) -> List[Any]:
+        """Valores em pós-ordem (esquerda, direita, raiz)."""
+        # raiz, direita, esquerda na ida; invertido, fica esquerda, direita, raiz
+        valores, esq, dir = self.valores, self.esq, self.dir
+        saida = []
+        pilha = [0] if valores else []
+        while pilha:
+            i = pilha.pop()
+            saida.append(valores[i])
+            e, d = esq[i], dir[i]
+            if e != VAZIO:
+                pilha.append(e)
+            if d != VAZIO:
+                pilha.append(d)
+        saida.reverse()
+        return saida
+
+    def por_nivel(self) -> List[Any]:
+        """Valores nível a nível, da esquerda para a direita."""
+        valores, esq, dir = self.valores, self.esq, self.dir
+        saida = []
+        fila = deque([0] if valores else [])
+        while fila:
+            i = fila.popleft()
+            saida.append(valores[i])
+            e, d = esq[i], dir[i]
+            if e != VAZIO:
+                fila.append(e)
+            if d != VAZIO:
+                fila.append(d)
+        return saida
+
+    def altura(self) -> int:
+        """Número de níveis (0 para a árvore vazia)."""
+        esq, dir = self.esq, self.dir
+        altura = 0
+        pilha = [(0, 1)] if self.valores else []
+        while pilha:
+            i, nivel = pilha.pop()
+            altura = max(altura, nivel)
+            if esq[i] != VAZIO:
+                pilha.append((esq[i], nivel + 1))
+            if dir[i] != VAZIO:
+                pilha.append((dir[i], nivel + 1))
+        return altura
+
+    def para_listas(self) -> Optional[list]:
+        """De volta para listas aninhadas [valor, esquerda, direita] (sem recursão)."""
+        if not self.valores:
+            return None
+        listas = [[v, None, None] for v in self.valores]
+        for i, (e, d) in enumerate(zip(self.esq, self.dir)):
+            if e != VAZIO:
+                listas[i][1] = listas[e]
+            if d != VAZIO:
+                listas[i][2] = listas[d]
+        return listas[0]
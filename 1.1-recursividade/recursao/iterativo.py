@@ -0,0 +1,68 @@
+"""
+Funções do notebook com laços, sem recursão.
+
+Mesmos resultados das versões de `trampolim` (e do notebook, nas entradas
+que ele aceita), sem limite de profundidade e sem o custo de uma chamada por
+passo. A primalidade fica em `primos`, que também tem os crivos.
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+
+from .primos import eh_primo  # Q4: divisão até √n
+
+
+def intervalo(a: int, b: int) -> List[int]:
+    """Q1: intervalo fechado de a até b.
+
+    Raises:
+        ValueError: se a > b.
+    """
+    if a > b:
+        raise ValueError("Valores inválidos")
+    return list(range(a, b + 1))
+
+
+def intervalo_invertido(a: int, b: int) -> List[int]:
+    """Q2: intervalo fechado de b até a.
+
+    Raises:
+        ValueError: se a > b.
+    """
+    if a > b:
+        raise ValueError("Valores inválidos")
+    return list(range(b, a - 1, -1))
+
+
+def soma(n: int) -> int:
+    """Q3: soma de 1 até n.
+
+    Raises:
+        ValueError: se n < 1.
+    """
+    if n < 1:
+        raise ValueError("n deve ser maior ou igual a 1")
+    return sum(range(1, n + 1))
+
+
+def decimal_para_binario(n: int) -> str:
+    """Q5: binário de n (0 vira "0" e negativos levam "-").
+
+    Um laço de divisões por 2 em Python fica quadrático para inteiros
+    grandes (cada divisão copia o número); `format` faz a mesma conversão
+    em C, em tempo linear no número de dígitos.
+    """
+    return format(n, "b")
+
+
+def pre_ordem(arv: Optional[list]) -> list:
+    """Extra: pré-ordem de uma árvore em listas aninhadas, com uma pilha explícita."""
+    saida = []
+    pilha = [arv]
+    while pilha:
+        no = pilha.pop()
+        if no is not None:
+            saida.append(no[0])
+            pilha.append(no[2])   # a direita sai depois da esquerda
+            pilha.append(no[1])
+    return saida
@@ -0,0 +1,80 @@
+"""
+Memoização com LRU limitado.
+
+`memoizar(maximo)` guarda os resultados das últimas `maximo` chamadas
+distintas num `OrderedDict`: um acerto move a entrada para o fim, e quando
+o limite é passado sai a menos usada. Sem limite (`maximo=None`), a memória
+cresce com o número de argumentos diferentes, o que numa busca longa (todos
+os n de um intervalo, por exemplo) vira um vazamento.
+
+    @memoizar(maximo=1024)
+    def eh_primo(n): ...
+
+    eh_primo.info()     # EstatisticasMemo(acertos=..., falhas=..., ...)
+    eh_primo.limpar()
+
+Os argumentos precisam ser hasháveis. Numa função recursiva, as chamadas
+internas também passam pelo cache; a primeira chamada com n grande ainda
+desce n níveis de pilha (veja `trampolim`).
+"""
+from __future__ import annotations
+
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import wraps
+from typing import Callable, Optional
+
+_SEM_VALOR = object()
+
+
+@dataclass
+class EstatisticasMemo:
+    """Contadores de uma função memoizada."""
+    acertos: int = 0
+    falhas: int = 0
+    despejos: int = 0
+    tamanho: int = 0
+    maximo: Optional[int] = None
+
+
+def memoizar(maximo: Optional[int] = 128) -> Callable[[Callable], Callable]:
+    """Decorador: guarda os resultados das últimas `maximo` chamadas (None = sem limite).
+
+    Raises:
+        ValueError: se `maximo` for menor que 1.
+    """
+    if maximo is not None and maximo < 1:
+        raise ValueError("maximo deve ser pelo menos 1 (ou None, sem limite)")
+
+    def decorador(funcao: Callable) -> Callable:
+        entradas: "OrderedDict[tuple, object]" = OrderedDict()
+        stats = EstatisticasMemo(maximo=maximo)
+
+        @wraps(funcao)
+        def memoizada(*args, **kwargs):
+            chave = args + (_SEM_VALOR, *sorted(kwargs.items())) if kwargs else args
+            valor = entradas.get(chave, _SEM_VALOR)
+            if valor is not _SEM_VALOR:
+                entradas.move_to_end(chave)
+                stats.acertos += 1
+                return valor
+            stats.falhas += 1
+            valor = funcao(*args, **kwargs)
+            entradas[chave] = valor
+            if maximo is not None and len(entradas) > maximo:
+                entradas.popitem(last=False)
+                stats.despejos += 1
+            return valor
+
+        def info() -> EstatisticasMemo:
+            stats.tamanho = len(entradas)
+            return EstatisticasMemo(**vars(stats))
+
+        def limpar() -> None:
+            entradas.clear()
+            stats.acertos = stats.falhas = stats.despejos = 0
+
+        memoizada.info = info
+        memoizada.limpar = limpar
+        return memoizada
+    return decorador
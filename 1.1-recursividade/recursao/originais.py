@@ -0,0 +1,74 @@
+"""
+Funções do notebook `1.1-Recursividade.ipynb`, como estão lá.
+
+Servem de referência para conferir resultados e de base de comparação nos
+benchmarks. As que imprimiam (`intervalo`, `intervalo_invertido`,
+`pre_ordem`) recebem uma lista `saida` e acrescentam nela o que seria
+impresso; a recursão é a mesma. Todas fazem uma chamada por nível, então
+passam do limite de recursão do Python (cerca de 1000 níveis) com entradas
+grandes: `soma(n)`, `intervalo(a, b)` com b - a grande, `eh_primo(n)` (desce
+de n - 1 até 1) e árvores profundas. `eh_primo` ainda testa até n - 2
+divisores, e `decimal_para_binario` copia a string em cada nível.
+"""
+from __future__ import annotations
+
+from typing import List, Optional
+
+RAIZ_IDX, ESQ_IDX, DIR_IDX = 0, 1, 2
+
+
+def intervalo(a: int, b: int, saida: List) -> None:
+    """Q1: intervalo fechado de a até b."""
+    if a > b:
+        saida.append("Valores inválidos")
+    else:
+        saida.append(a)
+        if a < b:
+            intervalo(a + 1, b, saida)
+
+
+def intervalo_invertido(a: int, b: int, saida: List) -> None:
+    """Q2: intervalo fechado de b até a."""
+    if a > b:
+        saida.append("Valores inválidos")
+    else:
+        if a < b:
+            intervalo_invertido(a + 1, b, saida)
+        saida.append(a)
+
+
+def soma(n: int) -> int:
+    """Q3: soma de 1 até n."""
+    if n == 1:
+        return 1
+    return n + soma(n - 1)
+
+
+def eh_primo(n: int, d: Optional[int] = None) -> bool:
+    """Q4: testa os divisores de n - 1 até 2."""
+    if n < 2:
+        return False
+    if d is None:
+        d = n - 1
+    if d == 1:
+        return True
+    if n % d == 0:
+        return False
+    return eh_primo(n, d - 1)
+
+
+def decimal_para_binario(n: int) -> str:
+    """Q5: binário por divisões sucessivas ("" para 0)."""
+    if n == 0:
+        return ""
+    else:
+        return decimal_para_binario(n // 2) + str(n % 2)
+
+
+def pre_ordem(arv: Optional[list], saida: List) -> None:
+    """Extra: pré-ordem de uma árvore em listas aninhadas [raiz, esquerda, direita]."""
+    if arv is None:
+        return
+    saida.append(arv[RAIZ_IDX])
+    pre_ordem(arv[ESQ_IDX], saida)
+    pre_ordem(arv[DIR_IDX], saida)
@@ -0,0 +1,66 @@
+"""
+Primalidade: um número por divisão até √n, muitos de uma vez por crivo.
+
+O notebook testa os divisores de n - 1 até 2 (n - 2 divisões para um primo).
+Aqui:
+
+- `eh_primo`: só 2, 3 e os candidatos da forma 6k ± 1 até √n (cerca de
+  √n / 3 divisões);
+- `crivo`: crivo de Eratóstenes num `bytearray` (1 byte por número), riscando
+  os múltiplos de cada primo com uma atribuição de fatia;
+- `primos_no_intervalo`: crivo segmentado, que só guarda o trecho [a, b] e os
+  primos até √b, para intervalos longe do zero.
+"""
+from __future__ import annotations
+
+from itertools import compress
+from math import isqrt
+from typing import List
+
+
+def eh_primo(n: int) -> bool:
+    """True se n é primo."""
+    if n < 4:
+        return n >= 2
+    if n % 2 == 0 or n % 3 == 0:
+        return False
+    for d in range(5, isqrt(n) + 1, 6):
+        if n % d == 0 or n % (d + 2) == 0:
+            return False
+    return True
+
+
+def crivo(limite: int) -> bytearray:
+    """Marcas de 0 a `limite`: crivo[i] == 1 se i é primo."""
+    if limite < 2:
+        return bytearray(max(limite + 1, 0))
+    marcas = bytearray([1]) * (limite + 1)
+    marcas[0] = marcas[1] = 0
+    for p in range(2, isqrt(limite) + 1):
+        if marcas[p]:
+            # múltiplos menores que p * p já foram riscados por primos menores
+            marcas[p * p::p] = bytes(len(range(p * p, limite + 1, p)))
+    return marcas
+
+
+def primos_ate(limite: int) -> List[int]:
+    """Primos de 2 até `limite`."""
+    return list(compress(range(limite + 1), crivo(limite)))
+
+
+def primos_no_intervalo(a: int, b: int) -> List[int]:
+    """Primos em [a, b], com um crivo só do trecho (memória proporcional a b - a + √b)."""
+    a = max(a, 2)
+    if a > b:
+        return []
+    trecho = bytearray([1]) * (b - a + 1)
+    for p in primos_ate(isqrt(b)):
+        primeiro = max(p * p, (a + p - 1) // p * p)
+        if primeiro <= b:
+            trecho[primeiro - a::p] = bytes(len(range(primeiro, b + 1, p)))
+    return list(compress(range(a, b + 1), trecho))
+
+
+def contar_primos(a: int, b: int) -> int:
+    """Quantos primos há em [a, b]."""
+    return len(primos_no_intervalo(a, b))
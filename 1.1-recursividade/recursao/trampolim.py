@@ -0,0 +1,174 @@
+"""
+Recursão em trampolim: funções recursivas que não crescem a pilha.
+
+Uma função decorada com `trampolim` não chama a si mesma: devolve
+`continuar(funcao, *args)`, que só anota a próxima chamada. O decorador roda
+um laço que executa as chamadas anotadas uma depois da outra até vir um
+valor comum. A recursão fica escrita como no notebook (caso base e chamada
+recursiva), mas a profundidade não tem limite:
+
+    @trampolim
+    def soma_ate(n, acumulado=0):
+        if n == 0:
+            return acumulado
+        return continuar(soma_ate, n - 1, acumulado + n)
+
+Só chamadas em posição de cauda (a última coisa que a função faz) podem
+virar `continuar`. Por isso as versões abaixo levam um acumulador: a conta
+que o notebook fazia na volta da recursão (`n + soma(n - 1)`) é feita na ida.
+Funções decoradas podem se chamar umas às outras com `continuar`.
+
+Cada passo custa a criação de um objeto e uma volta no laço, então as
+versões em trampolim são mais lentas que as de `iterativo` e servem quando
+a forma recursiva importa.
+"""
+from __future__ import annotations
+
+from functools import wraps
+from typing import Callable, List, Optional
+
+
+class _Continuacao:
+    """Próxima chamada de uma função em trampolim."""
+    __slots__ = ("funcao", "args")
+
+    def __init__(self, funcao: Callable, args: tuple):
+        self.funcao = funcao
+        self.args = args
+
+
+def continuar(funcao: Callable, *args) -> _Continuacao:
+    """Anota a chamada `funcao(*args)` para o trampolim executar (use com `return`)."""
+    # a função decorada guarda a original em __wrapped__; o laço chama a original
+    return _Continuacao(getattr(funcao, "__wrapped__", funcao), args)
+
+
+def trampolim(funcao: Callable) -> Callable:
+    """Decorador: executa as chamadas devolvidas por `continuar` num laço, sem recursão."""
+    @wraps(funcao)
+    def executar(*args, **kwargs):
+        resultado = funcao(*args, **kwargs)
+        while type(resultado) is _Continuacao:
+            resultado = resultado.funcao(*resultado.args)
+        return resultado
+    return executar
+
+
+# ---------------------------------------------------------------------- #
+# funções do notebook em trampolim
+# ---------------------------------------------------------------------- #
+@trampolim
+def _intervalo(a: int, b: int, saida: List[int]) -> List[int]:
+    saida.append(a)
+    if a < b:
+        return continuar(_intervalo, a + 1, b, saida)
+    return saida
+
+
+def intervalo(a: int, b: int) -> List[int]:
+    """Q1: intervalo fechado de a até b.
+
+    Raises:
+        ValueError: se a > b ("Valores inválidos" no notebook).
+    """
+    if a > b:
+        raise ValueError("Valores inválidos")
+    return _intervalo(a, b, [])
+
+
+@trampolim
+def _intervalo_invertido(a: int, b: int, saida: List[int]) -> List[int]:
+    # o notebook imprime na volta da recursão; na ida, isso é começar pelo fim
+    saida.append(b)
+    if a < b:
+        return continuar(_intervalo_invertido, a, b - 1, saida)
+    return saida
+
+
+def intervalo_invertido(a: int, b: int) -> List[int]:
+    """Q2: intervalo fechado de b até a.
+
+    Raises:
+        ValueError: se a > b.
+    """
+    if a > b:
+        raise ValueError("Valores inválidos")
+    return _intervalo_invertido(a, b, [])
+
+
+@trampolim
+def _soma(n: int, acumulado: int) -> int:
+    if n == 0:
+        return acumulado
+    return continuar(_soma, n - 1, acumulado + n)
+
+
+def soma(n: int) -> int:
+    """Q3: soma de 1 até n, com a conta feita na ida.
+
+    Raises:
+        ValueError: se n < 1.
+    """
+    if n < 1:
+        raise ValueError("n deve ser maior ou igual a 1")
+    return _soma(n, 0)
+
+
+@trampolim
+def _sem_divisor(n: int, d: int) -> bool:
+    if d * d > n:
+        return True
+    if n % d == 0:
+        return False
+    return continuar(_sem_divisor, n, d + 1)
+
+
+def eh_primo(n: int) -> bool:
+    """Q4: a recursão do notebook, mas subindo de 2 até √n.
+
+    Um divisor maior que √n vem sempre junto de um menor, então os outros
+    não precisam ser testados.
+    """
+    if n < 2:
+        return False
+    return _sem_divisor(n, 2)
+
+
+@trampolim
+def _digitos(n: int, digitos: List[str]) -> List[str]:
+    if n == 0:
+        return digitos
+    digitos.append("1" if n & 1 else "0")
+    return continuar(_digitos, n >> 1, digitos)
+
+
+def decimal_para_binario(n: int) -> str:
+    """Q5: binário por divisões sucessivas.
+
+    Os restos saem do menos para o mais significativo e são juntados uma vez
+    no fim, em vez de concatenar uma string nova em cada nível. Diferente do
+    notebook, 0 vira "0" e negativos levam "-".
+    """
+    if n < 0:
+        return "-" + decimal_para_binario(-n)
+    if n == 0:
+        return "0"
+    return "".join(reversed(_digitos(n, [])))
+
+
+@trampolim
+def _pre_ordem(pendentes: list, saida: list) -> list:
+    # `pendentes` faz o papel da pilha de chamadas: subárvores ainda por visitar
+    if not pendentes:
+        return saida
+    arv = pendentes.pop()
+    if arv is not None:
+        saida.append(arv[0])
+        pendentes.append(arv[2])
+        pendentes.append(arv[1])
+    return continuar(_pre_ordem, pendentes, saida)
+
+
+def pre_ordem(arv: Optional[list]) -> list:
+    """Extra: pré-ordem de uma árvore em listas aninhadas [raiz, esquerda, direita]."""
+    return _pre_ordem([arv], [])
@@ -0,0 +1,98 @@
+"""
+Benchmark de vazão: leitura inteira x modo fluxo, em MB/s e pico de memória.
+
+Gera um log sintético de `--mb` MB e o exibe com cada função nos dois modos,
+escrevendo num terminal simulado (com cores) que descarta a saída. A vazão
+é medida numa execução sem tracemalloc; o pico de memória, noutra com ele.
+No layout, o modo fluxo lê só as linhas que cabem na tela, então a vazão
+dele é a do tamanho do arquivo inteiro, não a de bytes lidos.
+
+Uso:
+    python benchmarks/bench_fluxo.py
+    python benchmarks/bench_fluxo.py --mb 50 --sem-memoria
+"""
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from rich.console import Console
+
+from personalizador import estilo, layout, painel, terminal
+
+FUNCOES = {
+    "estilo.texto_bold": estilo.texto_bold,
+    "painel.painel_colorido": painel.painel_colorido,
+    "layout.exibir_layout": layout.exibir_layout,
+}
+
+NIVEIS = ["INFO", "DEBUG", "WARN", "ERROR"]
+
+
+def gerar_log(caminho: str, mb: float, semente: int = 0) -> int:
+    """Escreve um log sintético de ~`mb` MB em `caminho` e retorna o tamanho em bytes."""
+    rng = random.Random(semente)
+    palavras = ["conexão", "usuário", "pedido", "cache", "tempo", "erro", "fila", "disco", "rede"]
+    alvo = int(mb * 2**20)
+    n = 0
+    with open(caminho, "w", encoding="utf-8") as f:
+        while n < alvo:
+            linhas = [f"2024-05-{rng.randint(1, 28):02d} {rng.choice(NIVEIS):5} "
+                      + " ".join(rng.choices(palavras, k=rng.randint(3, 14))) + "\n"
+                      for _ in range(1000)]
+            bloco = "".join(linhas)
+            f.write(bloco)
+            n += len(bloco.encode("utf-8"))
+    return os.path.getsize(caminho)
+
+
+def medir(funcao, caminho: str, fluxo: bool, memoria: bool):
+    """(segundos, pico de memória em bytes ou None) para exibir o arquivo."""
+    saida = open(os.devnull, "w", encoding="utf-8")
+    anterior = terminal.definir_console(Console(file=saida, force_terminal=True, width=100,
+                                                height=40, color_system="truecolor"))
+    try:
+        if memoria:
+            tracemalloc.start()
+        t0 = time.perf_counter()
+        funcao(caminho, True, fluxo)
+        dt = time.perf_counter() - t0
+        pico = None
+        if memoria:
+            pico = tracemalloc.get_traced_memory()[1]
+            tracemalloc.stop()
+    finally:
+        terminal.definir_console(anterior)
+        saida.close()
+    return dt, pico
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Vazão do modo fluxo x leitura inteira.")
+    ap.add_argument("--mb", type=float, default=4, help="Tamanho do log gerado, em MB.")
+    ap.add_argument("--sem-memoria", action="store_true", help="Não mede o pico de memória.")
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "log.txt")
+        tamanho = gerar_log(caminho, args.mb)
+        mb = tamanho / 2**20
+        print(f"log de {mb:.1f} MB")
+        print(f"{'função':>24} | {'modo':>7} | {'MB/s':>8} | {'tempo s':>8} | {'pico MB':>8}")
+        for nome, funcao in FUNCOES.items():
+            for fluxo in (False, True):
+                dt, _ = medir(funcao, caminho, fluxo, memoria=False)
+                _, pico = (None, None) if args.sem_memoria else medir(funcao, caminho, fluxo, memoria=True)
+                pico_txt = "-" if pico is None else f"{pico / 2**20:.1f}"
+                modo = "fluxo" if fluxo else "inteiro"
+                print(f"{nome:>24} | {modo:>7} | {mb / dt:8.1f} | {dt:8.3f} | {pico_txt:>8}")
+
+
+if __name__ == "__main__":
+    main()
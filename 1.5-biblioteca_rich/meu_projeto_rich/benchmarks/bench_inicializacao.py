@@ -0,0 +1,74 @@
+"""
+Benchmark de inicialização do personalizador: do processo novo até a primeira saída.
+
+Roda `python main.py <texto> -m <módulo> -f <função>` para cada módulo e
+mede o tempo até o primeiro byte na saída padrão (mediana de várias
+execuções), comparando com um alvo. Uma execução extra com
+`python -X importtime` soma o tempo de importação dos módulos de topo.
+
+Uso:
+    python benchmarks/bench_inicializacao.py
+    python benchmarks/bench_inicializacao.py --repeticoes 20 --alvo 120
+"""
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+
+CASOS = {
+    "python (vazio)": ["-c", "print()"],
+    "--help": ["main.py", "--help"],
+    "estilo": ["main.py", "oi", "-m", "estilo", "-f", "texto_bold"],
+    "painel": ["main.py", "oi", "-m", "painel", "-f", "painel_simples"],
+    "layout": ["main.py", "oi", "-m", "layout", "-f", "exibir_layout"],
+}
+# progresso fica de fora: fora de um terminal o Rich só escreve a barra no fim
+
+
+def primeira_saida(argumentos) -> float:
+    """Segundos do início do processo até o primeiro byte na saída padrão."""
+    t0 = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, *argumentos], cwd=RAIZ,
+                            stdout=subprocess.PIPE, stderr=subprocess.STDOUT)
+    proc.stdout.read(1)
+    dt = time.perf_counter() - t0
+    proc.stdout.read()
+    proc.wait()
+    return dt
+
+
+def importacoes(argumentos):
+    """Tempo total (s) de importação dos módulos de topo, segundo `-X importtime`."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", *argumentos], cwd=RAIZ,
+                          stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    total = 0
+    # formato: "import time: <próprio> | <cumulativo> | <nome indentado pela profundidade>"
+    for linha in proc.stderr.decode("utf-8", errors="ignore").splitlines():
+        partes = linha.split("|")
+        if linha.startswith("import time:") and len(partes) == 3 and "cumulative" not in linha:
+            if not partes[2][1:].startswith(" "):
+                total += int(partes[1])
+    return total / 1e6
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Tempo até a primeira saída de cada módulo.")
+    ap.add_argument("--repeticoes", type=int, default=10)
+    ap.add_argument("--alvo", type=float, default=120.0,
+                    help="Alvo de tempo até a primeira saída, em ms.")
+    args = ap.parse_args()
+
+    print(f"{'modo':>15} | {'1ª saída ms':>11} | {'import ms':>9} | alvo")
+    for nome, argumentos in CASOS.items():
+        primeira_saida(argumentos)  # aquece o cache de disco e os .pyc
+        mediana = statistics.median(primeira_saida(argumentos) for _ in range(args.repeticoes)) * 1000
+        ok = "ok" if mediana <= args.alvo else "ACIMA"
+        print(f"{nome:>15} | {mediana:11.1f} | {importacoes(argumentos) * 1000:9.1f} | {ok}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark do modo em lote: um processo para tudo x um processo por arquivo.
+
+Gera `--docs` arquivos pequenos e os renderiza com `lote.executar` em cada
+formato de exportação e em pools de threads e de processos. Para comparar,
+roda `main.py` uma vez por arquivo (processo novo a cada item) numa amostra
+de `--amostra` arquivos e extrapola para o total.
+
+Uso:
+    python benchmarks/bench_lote.py
+    python benchmarks/bench_lote.py --docs 1000 --funcao painel.painel_colorido
+"""
+import argparse
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from rich.console import Console
+
+from personalizador import lote, terminal
+
+RAIZ = Path(__file__).resolve().parents[1]
+
+
+def gerar_docs(pasta: str, n: int, semente: int = 0) -> list:
+    """Cria `n` documentos de 10 a 60 linhas e retorna seus caminhos."""
+    rng = random.Random(semente)
+    palavras = ["relatório", "dados", "tempo", "painel", "estilo", "cor", "texto", "linha", "rich"]
+    caminhos = []
+    for i in range(n):
+        caminho = os.path.join(pasta, f"doc{i:05d}.txt")
+        linhas = (" ".join(rng.choices(palavras, k=rng.randint(4, 12))) for _ in range(rng.randint(10, 60)))
+        Path(caminho).write_text("\n".join(linhas), encoding="utf-8")
+        caminhos.append(caminho)
+    return caminhos
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Modo em lote x um processo por arquivo.")
+    ap.add_argument("--docs", type=int, default=300)
+    ap.add_argument("--funcao", default="painel.painel_simples", help="modulo.funcao aplicada a todos")
+    ap.add_argument("--workers", type=int, default=4)
+    ap.add_argument("--amostra", type=int, default=10, help="Arquivos rodados um processo por vez.")
+    args = ap.parse_args()
+    modulo, funcao = args.funcao.split(".")
+
+    # a barra de progresso do lote vai para um terminal descartável
+    nulo = open(os.devnull, "w", encoding="utf-8")
+    terminal.definir_console(Console(file=nulo))
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminhos = gerar_docs(pasta, args.docs)
+        itens = [(c, modulo, funcao) for c in caminhos]
+        print(f"{args.docs} documentos, {args.funcao}, {os.cpu_count()} CPU(s)")
+        print(f"{'modo':>26} | {'tempo s':>8} | {'docs/s':>8} | {'ms/doc':>7}")
+
+        def linha(nome, dt, n):
+            print(f"{nome:>26} | {dt:8.2f} | {n / dt:8.0f} | {dt / n * 1000:7.2f}")
+
+        # aquece: importações do Rich e de cada formato de exportação
+        for formato in lote.FORMATOS:
+            lote.executar(lote.montar_tarefas(itens[:1], os.path.join(pasta, "aquece"), formato))
+
+        for formato in lote.FORMATOS:
+            tarefas = lote.montar_tarefas(itens, os.path.join(pasta, formato), formato)
+            t0 = time.perf_counter()
+            resultados = lote.executar(tarefas, workers=1)
+            linha(f"lote 1 thread ({formato})", time.perf_counter() - t0, len(resultados))
+
+        tarefas = lote.montar_tarefas(itens, os.path.join(pasta, "pool"), "html")
+        for processos in (False, True):
+            t0 = time.perf_counter()
+            resultados = lote.executar(tarefas, workers=args.workers, processos=processos)
+            tipo = "processos" if processos else "threads"
+            linha(f"lote {args.workers} {tipo} (html)", time.perf_counter() - t0, len(resultados))
+
+        amostra = caminhos[:args.amostra]
+        t0 = time.perf_counter()
+        for caminho in amostra:
+            subprocess.run([sys.executable, "main.py", caminho, "-a", "-m", modulo, "-f", funcao],
+                           cwd=RAIZ, stdout=subprocess.DEVNULL, check=True)
+        linha("1 processo por doc (tela)", time.perf_counter() - t0, len(amostra))
+    nulo.close()
+
+
+if __name__ == "__main__":
+    main()
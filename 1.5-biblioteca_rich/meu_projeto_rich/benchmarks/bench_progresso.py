@@ -0,0 +1,96 @@
+"""
+Benchmark do custo da barra de progresso por item acompanhado.
+
+Percorre `--itens` itens sem barra, com `rich.progress.track` (que conta
+os itens e atualiza a barra numa thread) e com `progresso_iteravel` (avanços
+acumulados e repassados no máximo `TAXA` vezes por segundo), num terminal
+simulado que descarta a saída. Para comparar, mede `Progress.advance`
+chamado a cada item e também `Limitador.avancar` (usado por
+`progresso_arquivo` e `progresso_tarefas`) chamado a cada item. O custo por
+item é o tempo a mais que o laço sem barra.
+
+Uso:
+    python benchmarks/bench_progresso.py
+    python benchmarks/bench_progresso.py --itens 5000000
+"""
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from rich.console import Console
+from rich.progress import track
+
+from personalizador import progresso, terminal
+
+
+def medir(iteravel_de) -> float:
+    """Segundos para percorrer o iterável devolvido por `iteravel_de()`."""
+    t0 = time.perf_counter()
+    for _ in iteravel_de():
+        pass
+    return time.perf_counter() - t0
+
+
+def avanco_por_item(iteravel):
+    """Percorre o iterável chamando `Progress.advance` a cada item (sem limitar)."""
+    with progresso._barra("itens") as barra:
+        tarefa = barra.add_task("advance", total=None)
+        for item in iteravel:
+            yield item
+            barra.advance(tarefa)
+
+
+def com_limitador(iteravel):
+    """Percorre o iterável chamando `Limitador.avancar` a cada item."""
+    with progresso._barra("itens") as barra:
+        limitador = progresso.Limitador(barra, barra.add_task("avancar", total=None))
+        for item in iteravel:
+            yield item
+            limitador.avancar()
+        limitador.descarregar()
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Custo por item da barra de progresso.")
+    ap.add_argument("--itens", type=int, default=1_000_000)
+    args = ap.parse_args()
+    n = args.itens
+
+    saida = open(os.devnull, "w", encoding="utf-8")
+    console = Console(file=saida, force_terminal=True, width=100)
+    terminal.definir_console(console)
+
+    # conta quantas vezes a barra de fato recebe avanços
+    atualizacoes = [0]
+    descarregar = progresso.Limitador.descarregar
+    def contar(self):
+        atualizacoes[0] += self.feito != self._enviado
+        descarregar(self)
+    progresso.Limitador.descarregar = contar
+
+    casos = {
+        "sem barra": lambda: range(n),
+        "rich track": lambda: track(range(n), console=console),
+        "advance por item": lambda: avanco_por_item(range(n)),
+        "progresso_iteravel": lambda: progresso.progresso_iteravel(range(n)),
+        "Limitador.avancar": lambda: com_limitador(range(n)),
+    }
+    base = None
+    print(f"{n:,} itens")
+    print(f"{'laço':>20} | {'tempo s':>8} | {'ns/item':>8} | {'custo ns/item':>13} | atualizações")
+    for nome, iteravel_de in casos.items():
+        atualizacoes[0] = 0
+        dt = medir(iteravel_de)
+        base = dt if base is None else base
+        extra = (dt - base) / n * 1e9
+        enviadas = {"rich track": "-", "advance por item": f"{n:,}"}.get(nome, f"{atualizacoes[0]:,}")
+        print(f"{nome:>20} | {dt:8.3f} | {dt / n * 1e9:8.1f} | {extra:13.1f} | {enviadas}")
+    saida.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,31 +1,48 @@
 import argparse
-from personalizador import layout, painel, progresso, estilo
+import importlib
 
-modulos = {
-    "layout": layout,
-    "painel": painel,
-    "progresso": progresso,
-    "estilo": estilo
-}
-
-funcoes = {
-    "layout": ["exibir_layout", "layout_colorido"],
-    "painel": ["painel_simples", "painel_colorido"],
-    "progresso": ["progresso_simples", "progresso_colorido"],
-    "estilo": ["texto_bold", "texto_italic_color"]
-}
+# os módulos (e o Rich) só são importados depois de ler os argumentos,
+# e apenas o módulo escolhido
+from personalizador import FUNCOES as funcoes
 
 parser = argparse.ArgumentParser(description="Exibe textos formatados com Rich.")
-parser.add_argument("entrada", type=str, help="Texto ou caminho do arquivo a ser exibido")
-parser.add_argument("-a", "--arquivo", action="store_true", help="Indica que a entrada é um arquivo")
-parser.add_argument("-m", "--modulo", choices=list(modulos.keys()), required=True, help="Módulo a utilizar: layout, painel, progresso, estilo")
-parser.add_argument("-f", "--funcao", required=True, help="Função do módulo. Opções:\n" + "\n".join([f"{k}: {', '.join(v)}" for k,v in funcoes.items()]))
+parser.add_argument("entrada", nargs="?", help="Texto ou caminho do arquivo a ser exibido")
+parser.add_argument("-a", "--arquivo", action="store_true", help="Indica que a entrada é um arquivo ('-' para a entrada padrão)")
+parser.add_argument("--fluxo", action="store_true", help="Lê o arquivo em blocos e exibe à medida que lê (memória limitada)")
+parser.add_argument("-m", "--modulo", choices=list(funcoes.keys()), help="Módulo a utilizar: layout, painel, progresso, estilo")
+parser.add_argument("-f", "--funcao", help="Função do módulo. Opções:\n" + "\n".join([f"{k}: {', '.join(v)}" for k,v in funcoes.items()]))
+lote_args = parser.add_argument_group("modo em lote", "Renderiza vários arquivos num só processo e grava cada um em --saida.")
+lote_args.add_argument("--lote", metavar="MANIFESTO", help="Manifesto com uma linha 'arquivo modulo funcao' por item")
+lote_args.add_argument("--glob", metavar="PADRAO", help="Arquivos a renderizar com -m/-f (ex.: 'docs/**/*.txt')")
+lote_args.add_argument("--saida", default="saida_lote", help="Pasta dos arquivos gerados")
+lote_args.add_argument("--formato", choices=["texto", "ansi", "html", "svg"], default="html", help="Formato de exportação")
+lote_args.add_argument("--workers", type=int, default=None, help="Threads (ou processos) do pool")
+lote_args.add_argument("--processos", action="store_true", help="Usa um pool de processos em vez de threads")
+lote_args.add_argument("--relatorio", metavar="CSV", help="Grava o tempo de cada item em CSV")
+lote_args.add_argument("--largura", type=int, default=100, help="Largura do console de exportação")
 
 args = parser.parse_args()
 
-mod = modulos[args.modulo]
-if args.funcao in funcoes[args.modulo]:
+if args.lote or args.glob:
+    import time
+    from personalizador import lote
+    if args.glob and not (args.modulo and args.funcao):
+        parser.error("--glob requer -m e -f")
+    try:
+        itens = lote.ler_manifesto(args.lote) if args.lote else lote.por_glob(args.glob, args.modulo, args.funcao)
+    except ValueError as exc:
+        parser.error(str(exc))
+    t0 = time.perf_counter()
+    resultados = lote.executar(lote.montar_tarefas(itens, args.saida, args.formato, args.largura),
+                               args.workers, args.processos)
+    lote.resumir(resultados, time.perf_counter() - t0)
+    if args.relatorio:
+        lote.gravar_relatorio(resultados, args.relatorio)
+elif args.entrada is None or not (args.modulo and args.funcao):
+    parser.error("informe a entrada, -m e -f (ou --lote/--glob)")
+elif args.funcao in funcoes[args.modulo]:
+    mod = importlib.import_module(f"personalizador.{args.modulo}")
     func = getattr(mod, args.funcao)
-    func(args.entrada, args.arquivo)
+    func(args.entrada, args.arquivo, args.fluxo)
 else:
     print(f"Função inválida para o módulo {args.modulo}.")
@@ -0,0 +1,24 @@
+"""
+Pacote personalizador
+=====================
+Funções que exibem textos formatados com Rich.
+
+- estilo: texto em negrito, itálico e cor.
+- layout: texto em layouts divididos em painéis.
+- painel: texto dentro de painéis.
+- progresso: barras de progresso de trabalho real (arquivos, iteráveis, pools).
+- lote: renderiza muitos arquivos num só processo e exporta texto/ANSI/HTML/SVG.
+- terminal: Console compartilhado e leitura da entrada (inteira ou em fluxo).
+
+Os submódulos não são importados aqui, para o Rich só carregar quando usado.
+"""
+
+# funções de exibição de cada módulo: recebem (texto, isArquivo, fluxo)
+FUNCOES = {
+    "layout": ["exibir_layout", "layout_colorido"],
+    "painel": ["painel_simples", "painel_colorido"],
+    "progresso": ["progresso_simples", "progresso_colorido"],
+    "estilo": ["texto_bold", "texto_italic_color"],
+}
+
+__all__ = ["estilo", "layout", "painel", "progresso", "lote", "terminal", "FUNCOES"]
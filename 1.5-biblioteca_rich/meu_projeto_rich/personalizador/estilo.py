@@ -1,23 +1,40 @@
 """
 Módulo estilo do pacote personalizador.
 Funções que aplicam estilos ao texto.
+
+Com `fluxo=True` o texto é lido em blocos e escrito à medida que chega: os
+códigos ANSI do estilo são gerados pelo Rich uma vez e aplicados a cada
+linha, sem montar um `Text` com o arquivo inteiro.
 """
 
-from rich.console import Console
-from rich.text import Text
+from .terminal import obter_console, ler_entrada, ler_blocos, codigos_estilo
 
-console = Console()
+def _estilizar_fluxo(texto: str, isArquivo: bool, estilo: str):
+    """Escreve o texto bloco a bloco, com `estilo` aplicado a cada linha."""
+    console = obter_console()
+    prefixo, sufixo = codigos_estilo(console, estilo)
+    quebra = sufixo + "\n" + prefixo
+    arquivo = console.file
+    ultimo = "\n"
+    arquivo.write(prefixo)
+    for bloco in ler_blocos(texto, isArquivo):
+        arquivo.write(bloco.replace("\n", quebra) if prefixo else bloco)
+        ultimo = bloco[-1]
+    arquivo.write(sufixo if ultimo == "\n" else sufixo + "\n")
+    arquivo.flush()
 
-def texto_bold(texto: str, isArquivo: bool = False):
+def texto_bold(texto: str, isArquivo: bool = False, fluxo: bool = False):
     """Exibe o texto em negrito."""
-    if isArquivo:
-        with open(texto, 'r') as f:
-            texto = f.read()
-    console.print(Text(texto, style="bold"))
+    if fluxo:
+        return _estilizar_fluxo(texto, isArquivo, "bold")
+    texto = ler_entrada(texto, isArquivo)
+    from rich.text import Text
+    obter_console().print(Text(texto, style="bold"))
 
-def texto_italic_color(texto: str, isArquivo: bool = False):
+def texto_italic_color(texto: str, isArquivo: bool = False, fluxo: bool = False):
     """Exibe o texto em itálico e cor."""
-    if isArquivo:
-        with open(texto, 'r') as f:
-            texto = f.read()
-    console.print(Text(texto, style="italic magenta"))
+    if fluxo:
+        return _estilizar_fluxo(texto, isArquivo, "italic magenta")
+    texto = ler_entrada(texto, isArquivo)
+    from rich.text import Text
+    obter_console().print(Text(texto, style="italic magenta"))
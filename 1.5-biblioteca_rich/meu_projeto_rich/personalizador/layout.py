@@ -1,45 +1,54 @@
 """
 Módulo layout do pacote personalizador.
 Fornece funções que exibem texto usando layouts do Rich.
+
+O layout ocupa a altura do terminal e corta o que não cabe. Com `fluxo=True`
+só as primeiras linhas da entrada, as que podem aparecer na tela, são lidas;
+o resto do arquivo (ou da entrada padrão) nem chega a ser lido.
 """
 
-from rich.console import Console
-from rich.layout import Layout
+from itertools import islice
+
+from .terminal import obter_console, ler_entrada, ler_linhas
 
-console = Console()
+def _inicio(texto: str, isArquivo: bool) -> str:
+    """Só as linhas iniciais da entrada que cabem na tela."""
+    console = obter_console()
+    linhas = ler_linhas(texto, isArquivo, limite=console.width * console.height)
+    return "\n".join(islice(linhas, console.height))
 
-def exibir_layout(texto: str, isArquivo: bool = False):
+def exibir_layout(texto: str, isArquivo: bool = False, fluxo: bool = False):
     """
     Exibe o texto em um layout simples dividido em painéis.
     
     Args:
         texto (str): Texto ou caminho de arquivo.
         isArquivo (bool): True se texto for caminho de arquivo.
+        fluxo (bool): True para ler só o início da entrada.
     """
-    if isArquivo:
-        with open(texto, 'r') as f:
-            texto = f.read()
+    texto = _inicio(texto, isArquivo) if fluxo else ler_entrada(texto, isArquivo)
+    from rich.layout import Layout
     layout = Layout()
     layout.split_column(
         Layout(texto, name="principal"),
         Layout("Footer", name="rodape")
     )
-    console.print(layout)
+    obter_console().print(layout)
 
-def layout_colorido(texto: str, isArquivo: bool = False):
+def layout_colorido(texto: str, isArquivo: bool = False, fluxo: bool = False):
     """
     Exibe o texto em layout colorido.
     
     Args:
         texto (str): Texto ou caminho de arquivo.
         isArquivo (bool): True se texto for caminho de arquivo.
+        fluxo (bool): True para ler só o início da entrada.
     """
-    if isArquivo:
-        with open(texto, 'r') as f:
-            texto = f.read()
+    texto = _inicio(texto, isArquivo) if fluxo else ler_entrada(texto, isArquivo)
+    from rich.layout import Layout
     layout = Layout()
     layout.split_row(
         Layout(f"[bold red]{texto}[/bold red]", name="esquerda"),
         Layout(f"[green]Painel direito[/green]", name="direita")
     )
-    console.print(layout)
+    obter_console().print(layout)
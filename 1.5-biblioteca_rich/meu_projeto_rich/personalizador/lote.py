@@ -0,0 +1,167 @@
+"""
+Módulo lote do pacote personalizador.
+Renderiza muitos arquivos, cada um com seu módulo e função, num só processo.
+
+As entradas vêm de um manifesto (uma linha por item: `arquivo modulo funcao`,
+linhas vazias e iniciadas por '#' são ignoradas) ou de um padrão glob com um
+único módulo e função. Cada item é renderizado num Console que grava a saída
+(`record=True`) e exportado para um arquivo de texto, ANSI, HTML ou SVG.
+
+Os itens rodam num pool de threads ou de processos (`progresso_tarefas`).
+Cada thread (ou processo) cria um Console gravador na primeira tarefa e o
+reaproveita nas seguintes, limpando a gravação a cada exportação. O tempo de
+cada item é medido e pode ser gravado em CSV.
+"""
+
+import csv
+import glob
+import importlib
+import io
+import threading
+import time
+from dataclasses import dataclass, asdict, fields
+from pathlib import Path
+
+from . import FUNCOES, terminal
+from .progresso import progresso_tarefas
+
+FORMATOS = {"texto": "txt", "ansi": "ansi", "html": "html", "svg": "svg"}
+
+_consoles = threading.local()
+
+@dataclass
+class Resultado:
+    """Resultado de um item do lote."""
+    entrada: str
+    modulo: str
+    funcao: str
+    saida: str
+    segundos: float
+    erro: str = ""
+
+def _validar(modulo: str, funcao: str):
+    """Retorna a função `funcao` de `personalizador.<modulo>`, ou levanta ValueError."""
+    if modulo not in FUNCOES:
+        raise ValueError(f"Módulo inválido: {modulo}. Opções: {', '.join(FUNCOES)}")
+    if funcao not in FUNCOES[modulo]:
+        raise ValueError(f"Função inválida para o módulo {modulo}: {funcao}. "
+                         f"Opções: {', '.join(FUNCOES[modulo])}")
+    return getattr(importlib.import_module(f"personalizador.{modulo}"), funcao)
+
+def ler_manifesto(caminho: str) -> list:
+    """
+    Lê um manifesto com uma linha `arquivo modulo funcao` por item.
+
+    Caminhos relativos são relativos à pasta do manifesto; o caminho do
+    arquivo pode ter espaços (módulo e função são as duas últimas palavras).
+
+    Returns:
+        list: Tuplas (arquivo, modulo, funcao).
+    """
+    pasta = Path(caminho).parent
+    itens = []
+    with open(caminho, 'r', encoding="utf-8") as f:
+        for n, linha in enumerate(f, 1):
+            linha = linha.strip()
+            if not linha or linha.startswith("#"):
+                continue
+            partes = linha.rsplit(None, 2)
+            if len(partes) != 3:
+                raise ValueError(f"{caminho}:{n}: esperado 'arquivo modulo funcao'")
+            arquivo, modulo, funcao = partes
+            _validar(modulo, funcao)
+            itens.append((str(pasta / arquivo), modulo, funcao))
+    return itens
+
+def por_glob(padrao: str, modulo: str, funcao: str) -> list:
+    """Itens (arquivo, modulo, funcao) para cada arquivo que casa com `padrao` (aceita '**')."""
+    _validar(modulo, funcao)
+    return [(arquivo, modulo, funcao) for arquivo in sorted(glob.glob(padrao, recursive=True))
+            if Path(arquivo).is_file()]
+
+def montar_tarefas(itens, pasta: str, formato: str = "html", largura: int = 100, altura: int = 40) -> list:
+    """Tarefas de `renderizar` com um nome de saída único em `pasta` para cada item."""
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato inválido: {formato}. Opções: {', '.join(FORMATOS)}")
+    Path(pasta).mkdir(parents=True, exist_ok=True)
+    usados = set()
+    tarefas = []
+    for arquivo, modulo, funcao in itens:
+        base = f"{Path(arquivo).stem}.{funcao}"
+        nome, n = base, 1
+        while nome in usados:
+            n += 1
+            nome = f"{base}-{n}"
+        usados.add(nome)
+        saida = str(Path(pasta) / f"{nome}.{FORMATOS[formato]}")
+        tarefas.append((arquivo, modulo, funcao, saida, formato, largura, altura))
+    return tarefas
+
+def _console_gravador(largura: int, altura: int):
+    """Console gravador da thread atual, criado na primeira tarefa e reaproveitado."""
+    console = getattr(_consoles, "console", None)
+    if console is None or (console.width, console.height) != (largura, altura):
+        from rich.console import Console
+        console = Console(file=io.StringIO(), record=True, force_terminal=True,
+                          color_system="truecolor", width=largura, height=altura)
+        _consoles.console = console
+        terminal.usar_console_local(console)
+    return console
+
+def _exportar(console, formato: str, titulo: str) -> str:
+    """Exporta (e limpa) o que o Console gravou."""
+    if formato == "texto":
+        return console.export_text()
+    if formato == "ansi":
+        return console.export_text(styles=True)
+    if formato == "html":
+        return console.export_html(inline_styles=True)
+    return console.export_svg(title=titulo)
+
+def renderizar(tarefa) -> Resultado:
+    """Renderiza um item e grava a exportação; erros viram `Resultado.erro` em vez de parar o lote."""
+    arquivo, modulo, funcao, saida, formato, largura, altura = tarefa
+    t0 = time.perf_counter()
+    console = _console_gravador(largura, altura)
+    try:
+        _validar(modulo, funcao)(arquivo, True)
+        conteudo = _exportar(console, formato, Path(arquivo).name)
+        with open(saida, 'w', encoding="utf-8") as f:
+            f.write(conteudo)
+        erro = ""
+    except Exception as exc:
+        console.export_text()  # descarta a gravação parcial
+        erro = f"{type(exc).__name__}: {exc}"
+    finally:
+        console.file.seek(0)
+        console.file.truncate()
+    return Resultado(arquivo, modulo, funcao, saida, time.perf_counter() - t0, erro)
+
+def executar(tarefas, workers: int = None, processos: bool = False) -> list:
+    """Renderiza as tarefas num pool (threads ou processos) com barra de progresso."""
+    return progresso_tarefas(renderizar, tarefas, workers, processos, descricao="Renderizando")
+
+def gravar_relatorio(resultados, caminho: str):
+    """Grava o tempo de cada item em CSV."""
+    with open(caminho, 'w', encoding="utf-8", newline="") as f:
+        escritor = csv.DictWriter(f, fieldnames=[c.name for c in fields(Resultado)])
+        escritor.writeheader()
+        for r in resultados:
+            escritor.writerow(asdict(r))
+
+def resumir(resultados, segundos: float, mais_lentos: int = 5):
+    """Mostra o total, a vazão, os erros e os itens mais lentos."""
+    from rich.table import Table
+    console = terminal.obter_console()
+    erros = [r for r in resultados if r.erro]
+    console.print(f"[bold]{len(resultados)} itens em {segundos:.2f} s "
+                  f"({len(resultados) / max(segundos, 1e-9):.0f} itens/s), {len(erros)} com erro[/bold]")
+    tabela = Table(title="Mais lentos")
+    tabela.add_column("Entrada")
+    tabela.add_column("Função")
+    tabela.add_column("ms", justify="right")
+    for r in sorted(resultados, key=lambda r: -r.segundos)[:mais_lentos]:
+        tabela.add_row(r.entrada, f"{r.modulo}.{r.funcao}", f"{r.segundos * 1000:.1f}")
+    console.print(tabela)
+    for r in erros:
+        console.print(f"[red]{r.entrada} ({r.modulo}.{r.funcao}): {r.erro}[/red]")
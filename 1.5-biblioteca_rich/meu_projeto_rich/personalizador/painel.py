@@ -1,23 +1,60 @@
 """
 Módulo painel do pacote personalizador.
 Funções para exibir painéis estilizados.
+
+Com `fluxo=True` o painel é escrito linha a linha: a borda de cima (com o
+título) e a de baixo são desenhadas pelo Rich uma vez, e cada linha do
+arquivo sai entre as bordas laterais assim que é lida, quebrada na largura
+do painel. Nesse modo o texto não é interpretado como marcação do Rich
+(colchetes de um log aparecem como estão).
 """
 
-from rich.console import Console
-from rich.panel import Panel
+from .terminal import obter_console, ler_entrada, ler_linhas, codigos_estilo
+
+LINHAS_POR_ESCRITA = 4096
 
-console = Console()
+def _painel_fluxo(texto: str, isArquivo: bool, estilo: str = "", titulo=None):
+    """Escreve o texto dentro de um painel, uma linha por vez."""
+    from rich import box
+    from rich.cells import cell_len, chop_cells
+    from rich.panel import Panel
+    console = obter_console()
+    with console.capture() as cap:
+        console.print(Panel("", title=titulo))
+    topo, _, base = cap.get().splitlines()
+    interna = console.width - 4  # bordas e espaçamento de um caractere de cada lado
+    prefixo, sufixo = codigos_estilo(console, estilo) if estilo else ("", "")
+    esquerda = box.ROUNDED.mid_left + " " + prefixo
+    direita = " " + box.ROUNDED.mid_right + "\n"
+    arquivo = console.file
+    partes = [topo + "\n"]
+    for linha in ler_linhas(texto, isArquivo):
+        linha = linha.expandtabs()
+        celulas = len(linha) if linha.isascii() else cell_len(linha)
+        if celulas <= interna:
+            partes.append(esquerda + linha + sufixo + " " * (interna - celulas) + direita)
+        else:
+            for pedaco in chop_cells(linha, interna) or [""]:
+                partes.append(esquerda + pedaco + sufixo + " " * (interna - cell_len(pedaco)) + direita)
+        if len(partes) >= LINHAS_POR_ESCRITA:
+            arquivo.write("".join(partes))
+            partes.clear()
+    partes.append(base + "\n")
+    arquivo.write("".join(partes))
+    arquivo.flush()
 
-def painel_simples(texto: str, isArquivo: bool = False):
+def painel_simples(texto: str, isArquivo: bool = False, fluxo: bool = False):
     """Exibe o texto dentro de um painel simples."""
-    if isArquivo:
-        with open(texto, 'r') as f:
-            texto = f.read()
-    console.print(Panel(texto))
+    if fluxo:
+        return _painel_fluxo(texto, isArquivo)
+    texto = ler_entrada(texto, isArquivo)
+    from rich.panel import Panel
+    obter_console().print(Panel(texto))
 
-def painel_colorido(texto: str, isArquivo: bool = False):
+def painel_colorido(texto: str, isArquivo: bool = False, fluxo: bool = False):
     """Exibe o texto dentro de um painel com cores e estilo."""
-    if isArquivo:
-        with open(texto, 'r') as f:
-            texto = f.read()
-    console.print(Panel(f"[bold cyan]{texto}[/bold cyan]", title="[red]Título[/red]"))
+    if fluxo:
+        return _painel_fluxo(texto, isArquivo, "bold cyan", "[red]Título[/red]")
+    texto = ler_entrada(texto, isArquivo)
+    from rich.panel import Panel
+    obter_console().print(Panel(f"[bold cyan]{texto}[/bold cyan]", title="[red]Título[/red]"))
@@ -1,26 +1,224 @@
 """
 Módulo progresso do pacote personalizador.
-Funções que mostram barras de progresso.
+Funções que mostram barras de progresso de trabalho real.
+
+- progresso_arquivo: lê um arquivo (ou "-" para a entrada padrão) em blocos,
+  com a barra em bytes, vazão em MB/s e tempo restante.
+- progresso_iteravel: acompanha qualquer iterável ou gerador (linhas,
+  registros...), com vazão em itens/s e tempo restante se o total for conhecido.
+- progresso_tarefas: roda uma função sobre vários itens num pool de threads
+  ou de processos e avança a barra a cada tarefa concluída.
+
+Atualizar a barra a cada item custaria mais que o próprio item em laços
+rápidos. Os avanços são acumulados e repassados ao Rich no máximo `TAXA`
+vezes por segundo; o relógio só é consultado a cada `passo` itens. O passo
+vem da vazão medida desde a consulta anterior (os itens de meio intervalo),
+limitado a `MAX_PASSO`: se o laço ficar lento de repente, a barra atrasa no
+máximo `MAX_PASSO` itens antes de o passo se ajustar à nova vazão.
 """
 
-from rich.console import Console
-from rich.progress import track
+import os
 import time
 
-console = Console()
+from .terminal import obter_console, ler_linhas, abrir_binario, BLOCO
 
-def progresso_simples(texto: str, isArquivo: bool = False):
-    """Mostra uma barra de progresso enquanto imprime o texto."""
-    if isArquivo:
-        with open(texto, 'r') as f:
-            texto = f.read()
-    for _ in track(range(10), description=texto):
-        time.sleep(0.1)
+TAXA = 10       # atualizações da barra por segundo
+MAX_PASSO = 64  # avanços entre consultas ao relógio, no máximo
+
+class Limitador:
+    """Acumula avanços de uma tarefa e os repassa ao Progress no máximo `taxa` vezes por segundo."""
+
+    def __init__(self, progresso, tarefa, taxa: float = TAXA):
+        self.progresso = progresso
+        self.tarefa = tarefa
+        self.intervalo = 1 / taxa
+        self.feito = 0      # trabalho registrado
+        self.passo = 1      # avanços entre consultas ao relógio
+        self._enviado = 0   # trabalho já repassado ao Progress
+        self._avancos = 0
+        self._marca = 1
+        self._ultima = time.perf_counter()            # última consulta ao relógio
+        self._avancos_ultima = 0                      # avanços até ela
+        self._proximo = self._ultima + self.intervalo
+
+    def avancar(self, n: float = 1):
+        """Registra `n` unidades de trabalho feitas."""
+        self.feito += n
+        self._avancos += 1
+        if self._avancos >= self._marca:
+            self._marca = self._avancos + self.conferir()
+
+    def conferir(self, avancos: int = None) -> int:
+        """
+        Consulta o relógio e, se o intervalo passou, repassa o trabalho acumulado.
+
+        Args:
+            avancos (int): Avanços feitos até agora, para quem os conta sem
+                `avancar` (como `progresso_iteravel`).
+
+        Returns:
+            int: Quantos avanços esperar até a próxima consulta.
+        """
+        if avancos is not None:
+            self._avancos = avancos
+        agora = time.perf_counter()
+        decorrido = agora - self._ultima
+        vistos = self._avancos - self._avancos_ultima
+        self._ultima, self._avancos_ultima = agora, self._avancos
+        if agora >= self._proximo:
+            self.descarregar()
+            self._proximo = agora + self.intervalo
+        # próxima consulta depois de meio intervalo na vazão medida agora
+        por_segundo = vistos / decorrido if decorrido > 0 else MAX_PASSO / self.intervalo
+        self.passo = max(1, min(MAX_PASSO, int(por_segundo * self.intervalo / 2)))
+        return self.passo
+
+    def descarregar(self):
+        """Repassa ao Progress o trabalho acumulado."""
+        if self.feito != self._enviado:
+            self.progresso.update(self.tarefa, completed=self.feito)
+            self._enviado = self.feito
+
+def _coluna_vazao(unidade: str):
+    """
+    Coluna com a vazão da tarefa em `unidade`/s ("bytes" sai em kB/s, MB/s...).
+
+    Com avanços limitados a poucos por segundo, tarefas curtas não chegam a
+    ter as duas amostras que o Rich usa para a velocidade; nesse caso a
+    coluna mostra a média desde o início.
+    """
+    from rich.filesize import decimal
+    from rich.progress import ProgressColumn
+    from rich.text import Text
+
+    class ColunaVazao(ProgressColumn):
+        def render(self, task):
+            vazao = task.finished_speed or task.speed
+            if vazao is None and task.elapsed:
+                vazao = task.completed / task.elapsed
+            if vazao is None:
+                return Text("?", style="progress.data.speed")
+            texto = f"{decimal(int(vazao))}/s" if unidade == "bytes" else f"{vazao:,.0f} {unidade}/s"
+            return Text(texto, style="progress.data.speed")
 
-def progresso_colorido(texto: str, isArquivo: bool = False):
-    """Mostra barra de progresso colorida."""
+    return ColunaVazao()
+
+def _barra(unidade: str = "bytes"):
+    """Progress com descrição, barra, quantidade, vazão e tempo restante."""
+    from rich.progress import (Progress, TextColumn, BarColumn, TaskProgressColumn, DownloadColumn,
+                               MofNCompleteColumn, TimeRemainingColumn, TimeElapsedColumn)
+    quantidade = DownloadColumn() if unidade == "bytes" else MofNCompleteColumn()
+    return Progress(TextColumn("[progress.description]{task.description}"), BarColumn(),
+                    TaskProgressColumn(), quantidade, _coluna_vazao(unidade),
+                    TimeRemainingColumn(), TimeElapsedColumn(),
+                    console=obter_console(), refresh_per_second=TAXA)
+
+def progresso_arquivo(caminho: str, processar=None, descricao: str = None, bloco: int = BLOCO) -> int:
+    """
+    Lê o arquivo em blocos mostrando bytes lidos, MB/s e tempo restante.
+
+    Args:
+        caminho (str): Arquivo a ler ("-" para a entrada padrão, sem tamanho conhecido).
+        processar: Função chamada com cada bloco de bytes lido (opcional).
+        descricao (str): Texto da barra (padrão: o caminho).
+        bloco (int): Bytes lidos por vez.
+
+    Returns:
+        int: Total de bytes lidos.
+    """
+    total = None if caminho == "-" else os.path.getsize(caminho)
+    lidos = 0
+    with _barra("bytes") as progresso, abrir_binario(caminho) as f:
+        tarefa = progresso.add_task(descricao or caminho, total=total)
+        limitador = Limitador(progresso, tarefa)
+        for dados in iter(lambda: f.read(bloco), b""):
+            if processar is not None:
+                processar(dados)
+            lidos += len(dados)
+            limitador.avancar(len(dados))
+        limitador.descarregar()
+        progresso.update(tarefa, total=lidos)
+    return lidos
+
+def progresso_iteravel(iteravel, total: int = None, descricao: str = "Processando",
+                       unidade: str = "itens"):
+    """
+    Gera os itens de `iteravel` avançando uma barra a cada item.
+
+    Args:
+        iteravel: Lista, gerador ou qualquer iterável.
+        total (int): Número de itens (padrão: len(iteravel), se houver).
+        descricao (str): Texto da barra.
+        unidade (str): Nome dos itens na coluna de vazão (ex.: "linhas").
+    """
+    if total is None and hasattr(iteravel, "__len__"):
+        total = len(iteravel)
+    with _barra(unidade) as progresso:
+        tarefa = progresso.add_task(descricao, total=total)
+        limitador = Limitador(progresso, tarefa)
+        # laço quente: por item, só um incremento e uma comparação
+        n = 0
+        marca = 1
+        for item in iteravel:
+            yield item
+            n += 1
+            if n >= marca:
+                limitador.feito = n
+                marca = n + limitador.conferir(n)
+        limitador.feito = n
+        limitador.descarregar()
+        progresso.update(tarefa, total=n)
+
+def progresso_tarefas(funcao, itens, workers: int = None, processos: bool = False,
+                      descricao: str = "Tarefas") -> list:
+    """
+    Aplica `funcao` a cada item num pool e avança a barra a cada tarefa concluída.
+
+    Args:
+        funcao: Função de um argumento (no pool de processos, precisa ser importável).
+        itens: Argumentos, um por tarefa.
+        workers (int): Threads ou processos (padrão do executor).
+        processos (bool): True para ProcessPoolExecutor (trabalho de CPU).
+        descricao (str): Texto da barra.
+
+    Returns:
+        list: Resultados na ordem dos itens.
+    """
+    from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+    itens = list(itens)
+    Executor = ProcessPoolExecutor if processos else ThreadPoolExecutor
+    resultados = [None] * len(itens)
+    with _barra("tarefas") as progresso, Executor(max_workers=workers) as executor:
+        tarefa = progresso.add_task(descricao, total=len(itens))
+        limitador = Limitador(progresso, tarefa)
+        futuros = {executor.submit(funcao, item): i for i, item in enumerate(itens)}
+        for futuro in as_completed(futuros):
+            resultados[futuros[futuro]] = futuro.result()
+            limitador.avancar()
+        limitador.descarregar()
+    return resultados
+
+def _contar_linhas(texto: str, isArquivo: bool, descricao: str):
+    """Percorre a entrada com progresso real (bytes de arquivo ou linhas de texto)."""
     if isArquivo:
-        with open(texto, 'r') as f:
-            texto = f.read()
-    for _ in track(range(10), description=f"[cyan]{texto}[/cyan]"):
-        time.sleep(0.1)
+        contagem = {"linhas": 0}
+        def contar(dados):
+            contagem["linhas"] += dados.count(b"\n")
+        lidos = progresso_arquivo(texto, contar, descricao)
+        return contagem["linhas"], lidos
+    linhas = sum(1 for _ in progresso_iteravel(ler_linhas(texto), descricao=descricao, unidade="linhas"))
+    return linhas, len(texto.encode("utf-8"))
+
+def progresso_simples(texto: str, isArquivo: bool = False, fluxo: bool = False):
+    """
+    Mostra uma barra de progresso enquanto percorre o texto ou o arquivo.
+
+    O arquivo é sempre lido em blocos (`fluxo` é aceito por compatibilidade).
+    """
+    linhas, lidos = _contar_linhas(texto, isArquivo, texto if isArquivo else "Lendo")
+    obter_console().print(f"{linhas} linhas, {lidos} bytes")
+
+def progresso_colorido(texto: str, isArquivo: bool = False, fluxo: bool = False):
+    """Mostra barra de progresso colorida enquanto percorre o texto ou o arquivo."""
+    linhas, lidos = _contar_linhas(texto, isArquivo, f"[cyan]{texto if isArquivo else 'Lendo'}[/cyan]")
+    obter_console().print(f"[cyan]{linhas} linhas, {lidos} bytes[/cyan]")
@@ -0,0 +1,121 @@
+"""
+Módulo terminal do pacote personalizador.
+Console do Rich compartilhado, criado só no primeiro uso, e leitura da entrada.
+
+A entrada pode ser lida de uma vez (`ler_entrada`) ou em fluxo
+(`ler_blocos`, `ler_linhas`): o arquivo é lido em blocos de `BLOCO` bytes,
+então arquivos de centenas de MB aparecem na tela desde o início e com
+memória limitada. Com `isArquivo`, o caminho "-" é a entrada padrão.
+
+Cada thread pode ter o próprio Console (`usar_console_local`), como no modo
+em lote, em que cada thread grava a saída num Console separado.
+"""
+
+import codecs
+import sys
+import threading
+from contextlib import contextmanager
+
+BLOCO = 1 << 20  # bytes lidos por vez no modo fluxo
+
+_console = None
+_local = threading.local()
+
+def obter_console():
+    """Retorna o Console da thread, se houver, ou o compartilhado, criando-o na primeira chamada."""
+    global _console
+    local = getattr(_local, "console", None)
+    if local is not None:
+        return local
+    if _console is None:
+        from rich.console import Console
+        _console = Console()
+    return _console
+
+def definir_console(console):
+    """Troca o Console compartilhado (ex.: por um que grava em arquivo) e retorna o anterior."""
+    global _console
+    anterior, _console = _console, console
+    return anterior
+
+def usar_console_local(console):
+    """Faz a thread atual usar `console` em vez do compartilhado (None volta ao compartilhado)."""
+    _local.console = console
+
+@contextmanager
+def abrir_binario(caminho: str):
+    """Abre o arquivo para leitura binária ("-" é a entrada padrão, que não é fechada)."""
+    if caminho == "-":
+        yield sys.stdin.buffer
+    else:
+        with open(caminho, 'rb') as f:
+            yield f
+
+def ler_entrada(texto: str, isArquivo: bool = False) -> str:
+    """
+    Retorna o texto a exibir.
+
+    Args:
+        texto (str): Texto ou caminho de arquivo ("-" para a entrada padrão).
+        isArquivo (bool): True se texto for caminho de arquivo.
+    """
+    if isArquivo:
+        if texto == "-":
+            return sys.stdin.read()
+        with open(texto, 'r') as f:
+            return f.read()
+    return texto
+
+def ler_blocos(texto: str, isArquivo: bool = False, tamanho: int = BLOCO):
+    """
+    Gera o texto em pedaços, lendo o arquivo `tamanho` bytes por vez.
+
+    O UTF-8 é decodificado de forma incremental (um caractere partido entre
+    dois blocos não se perde) e bytes inválidos viram '�'.
+    """
+    if not isArquivo:
+        if texto:
+            yield texto
+        return
+    decodificador = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    with abrir_binario(texto) as f:
+        # read1 devolve o que já chegou (num pipe, não espera encher o bloco)
+        ler = getattr(f, "read1", f.read)
+        while True:
+            dados = ler(tamanho)
+            if not dados:
+                break
+            pedaco = decodificador.decode(dados)
+            if pedaco:
+                yield pedaco
+    resto = decodificador.decode(b"", final=True)
+    if resto:
+        yield resto
+
+def ler_linhas(texto: str, isArquivo: bool = False, limite: int = BLOCO):
+    """
+    Gera as linhas do texto, sem a quebra de linha.
+
+    Linhas com mais de `limite` caracteres saem em pedaços de `limite`, para
+    que um arquivo sem quebras de linha não seja lido inteiro para a memória.
+    """
+    pendente = ""
+    for bloco in ler_blocos(texto, isArquivo):
+        linhas = (pendente + bloco).split("\n")
+        pendente = linhas.pop()
+        for linha in linhas:
+            yield linha[:-1] if linha.endswith("\r") else linha
+        while len(pendente) > limite:
+            yield pendente[:limite]
+            pendente = pendente[limite:]
+    if pendente:
+        yield pendente
+
+def codigos_estilo(console, estilo: str):
+    """Códigos ANSI que o Rich emite antes e depois de um texto com `estilo` (vazios fora de um terminal)."""
+    from rich.text import Text
+    with console.capture() as cap:
+        console.print(Text("x", style=estilo), end="")
+    ansi = cap.get()
+    i = ansi.index("x")
+    return ansi[:i], ansi[i + 1:]
@@ -6,10 +6,28 @@ Módulos do jogo "Aventura no Labirinto".
 
 Este pacote contém:
 
-- labirinto: geração, impressão e solução recursiva do labirinto.
-- jogador: controle do jogador, leitura de teclado e pontuação.
+- labirinto: geração, impressão e solução do labirinto.
+- geradores: algoritmos de geração (backtracking, Kruskal, Prim, Wilson, Eller).
+- solucionador: menor caminho por BFS, A*, BFS bidirecional e grafo.
+- rota: rota de coleta de todos os itens (Held-Karp / 2-opt).
+- grafo: grafo comprimido de corredores (bifurcações, becos, itens) em cache.
+- mundo: mundo infinito gerado em blocos sob demanda, com LRU e disco opcional.
+- renderizador: desenho incremental (só células alteradas) e câmera com minimapa.
+- serializacao: formato binário compacto (1 bit/célula) com leitura via mmap.
+- cache: LRU de níveis e soluções por (tamanho, semente, algoritmo), com disco opcional.
+- analise: métricas vetorizadas com NumPy (becos, grau, corredores, distâncias).
+- enxame: milhares de bots simulados com arrays NumPy (mapa de calor, tempo até a saída).
+- lote: geração e solução em massa, em paralelo, com estatísticas em CSV/JSONL.
+- jogador: estado do jogador, movimento e pontuação.
+- entrada: leitura de teclado (pynput, TTY ou input()) e laço de jogo assíncrono.
+- reproducao: gravação de partidas (semente + movimentos) e simulação rápida.
+- gravacao: quadros da partida como diferenças por célula, exportados em asciicast, HTML e SVG.
+- animacao: agendador de animações com quadros por segundo fixos e duração total.
+- perfil: tempos e contadores por fase (gerar, resolver, render, entrada, espera) para --profile.
+- servidor: partidas simultâneas por TCP/socket Unix sobre labirintos compartilhados.
 - utils: utilidades para CLI, impressão com rich e efeitos.
+- terminal: Console do Rich compartilhado e teclado (pynput), criados só no primeiro uso.
 
 Requer Python 3.10+ (match-case).
 """
-__all__ = ["labirinto", "jogador", "utils"]
+__all__ = ["labirinto", "geradores", "solucionador", "rota", "grafo", "mundo", "renderizador", "serializacao", "cache", "analise", "enxame", "lote", "jogador", "entrada", "reproducao", "gravacao", "animacao", "perfil", "servidor", "utils", "terminal"]
@@ -0,0 +1,227 @@
+"""
+Métricas de labirintos vetorizadas com NumPy, para ajuste de níveis.
+
+Cada labirinto é convertido uma única vez numa máscara booleana de células
+livres (`para_array`); a partir dela tudo é feito com operações de array:
+
+- vizinhos livres de cada célula por deslocamentos da máscara;
+- becos sem saída (grau 1) e histograma de grau (0 a 4);
+- comprimento dos corredores (trechos de células de grau 2 entre bifurcações
+  ou becos), rotulando componentes com propagação de mínimo e salto de ponteiros;
+- campo de distâncias a partir da entrada por BFS em frentes (a frente
+  inteira avança um passo por iteração).
+
+Todas as funções aceitam uma pilha `(n, altura, largura)` de labirintos do
+mesmo tamanho (`empilhar`), de modo que milhares de labirintos são medidos
+com poucas chamadas ao NumPy.
+
+`dificuldade` resume o labirinto num número (tortuosidade do menor caminho
+ponderada pela fração de becos) e `semente_por_dificuldade` usa esse número
+para escolher, entre várias sementes, uma de dificuldade medida.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import List, Sequence, Tuple
+
+from .labirinto import Labirinto, criar_labirinto, PAREDE
+
+try:
+    import numpy as np
+except Exception:  # pragma: no cover
+    np = None  # o jogo funciona sem NumPy; só este módulo precisa dele
+
+Cell = Tuple[int, int]
+
+# quantil da dificuldade medida usado para cada nível
+QUANTIS = {"facil": 0.2, "medio": 0.5, "dificil": 0.9}
+
+
+def _exigir_numpy() -> None:
+    if np is None:
+        raise ImportError("O módulo de análise requer NumPy (pip install numpy)")
+
+
+def para_array(lab: Labirinto) -> "np.ndarray":
+    """Máscara `(altura, largura)` de células livres (tudo que não é parede)."""
+    _exigir_numpy()
+    codigos = np.frombuffer(bytes(lab.grade.dados), dtype=np.uint8)
+    return (codigos != PAREDE).reshape(lab.altura, lab.largura)
+
+
+def empilhar(labs: Sequence[Labirinto]) -> "np.ndarray":
+    """Pilha `(n, altura, largura)` das máscaras de labirintos do mesmo tamanho.
+
+    Raises:
+        ValueError: se os labirintos tiverem tamanhos diferentes.
+    """
+    _exigir_numpy()
+    tamanhos = {(lab.altura, lab.largura) for lab in labs}
+    if len(tamanhos) > 1:
+        raise ValueError(f"Labirintos de tamanhos diferentes: {sorted(tamanhos)}")
+    return np.stack([para_array(lab) for lab in labs])
+
+
+def _deslocar(a: "np.ndarray", dr: int, dc: int, vazio=0) -> "np.ndarray":
+    """`a` deslocado de (dr, dc) nos dois últimos eixos; a borda recebe `vazio`."""
+    saida = np.full_like(a, vazio)
+    h, w = a.shape[-2:]
+    saida[..., max(dr, 0):h + min(dr, 0), max(dc, 0):w + min(dc, 0)] = \
+        a[..., max(-dr, 0):h + min(-dr, 0), max(-dc, 0):w + min(-dc, 0)]
+    return saida
+
+
+_DIRECOES = ((-1, 0), (1, 0), (0, -1), (0, 1))
+
+
+def contar_vizinhos(livres: "np.ndarray") -> "np.ndarray":
+    """Número de vizinhos livres (0 a 4) de cada célula livre; 0 nas paredes."""
+    _exigir_numpy()
+    grau = np.zeros(livres.shape, dtype=np.uint8)
+    for dr, dc in _DIRECOES:
+        grau += _deslocar(livres, dr, dc, False)
+    grau[~livres] = 0
+    return grau
+
+
+def contar_becos(livres: "np.ndarray") -> "np.ndarray":
+    """Becos sem saída (células livres de grau 1) por labirinto."""
+    return (contar_vizinhos(livres) == 1).sum(axis=(-2, -1))
+
+
+def histograma_grau(livres: "np.ndarray") -> "np.ndarray":
+    """Quantas células livres têm grau 0, 1, 2, 3 e 4, por labirinto (último eixo)."""
+    grau = contar_vizinhos(livres)
+    return np.stack([((grau == g) & livres).sum(axis=(-2, -1)) for g in range(5)], axis=-1)
+
+
+def comprimentos_corredores(livres: "np.ndarray") -> List["np.ndarray"]:
+    """Comprimento (em células de grau 2) de cada corredor, um array por labirinto.
+
+    Corredores são componentes conexas de células de grau 2. Cada célula de
+    corredor começa como a própria raiz; a cada rodada, as raízes das duas
+    pontas de cada ligação adotam a menor das duas e os rótulos saltam para a
+    raiz da raiz até estabilizar (fusão e compressão à la Shiloach-Vishkin),
+    o que converge em poucas rodadas mesmo em corredores longos.
+    """
+    _exigir_numpy()
+    pilha = livres if livres.ndim == 3 else livres[None]
+    corredor = contar_vizinhos(pilha) == 2
+    # numera só as células de corredor e lista as ligações entre elas
+    indice = np.full(corredor.shape, -1, dtype=np.int64)
+    indice[corredor] = np.arange(int(corredor.sum()))
+    horizontais = corredor[..., :, :-1] & corredor[..., :, 1:]
+    verticais = corredor[..., :-1, :] & corredor[..., 1:, :]
+    u = np.concatenate([indice[..., :, :-1][horizontais], indice[..., :-1, :][verticais]])
+    v = np.concatenate([indice[..., :, 1:][horizontais], indice[..., 1:, :][verticais]])
+    rotulo = np.arange(len(indice[corredor]))
+    while True:
+        ru, rv = rotulo[u], rotulo[v]
+        if np.array_equal(ru, rv):
+            break
+        menor = np.minimum(ru, rv)
+        np.minimum.at(rotulo, ru, menor)
+        np.minimum.at(rotulo, rv, menor)
+        while True:
+            saltado = rotulo[rotulo]
+            if np.array_equal(saltado, rotulo):
+                break
+            rotulo = saltado
+    # cada rótulo pertence a um único labirinto da pilha
+    labirinto = np.nonzero(corredor)[0]
+    raizes, tamanhos = np.unique(rotulo, return_counts=True)
+    dono = labirinto[raizes]
+    return [tamanhos[dono == i] for i in range(len(pilha))]
+
+
+def campo_distancias(livres: "np.ndarray", origens: Sequence[Cell]) -> "np.ndarray":
+    """Distância em passos de cada célula até a origem do seu labirinto (-1 = inalcançável).
+
+    Args:
+        livres: máscara `(altura, largura)` ou pilha `(n, altura, largura)`.
+        origens: uma posição de partida por labirinto da pilha.
+    """
+    _exigir_numpy()
+    pilha = livres if livres.ndim == 3 else livres[None]
+    dist = np.full(pilha.shape, -1, dtype=np.int32)
+    frente = np.zeros(pilha.shape, dtype=bool)
+    for i, (r, c) in enumerate(origens):
+        frente[i, r, c] = pilha[i, r, c]
+    visto = frente.copy()
+    passo = 0
+    while frente.any():
+        dist[frente] = passo
+        proxima = np.zeros_like(frente)
+        for dr, dc in _DIRECOES:
+            proxima |= _deslocar(frente, dr, dc, False)
+        frente = proxima & pilha & ~visto
+        visto |= frente
+        passo += 1
+    return dist if livres.ndim == 3 else dist[0]
+
+
+@dataclass
+class Metricas:
+    """Métricas de uma pilha de labirintos (um valor por labirinto em cada array)."""
+    becos: "np.ndarray"
+    juncoes: "np.ndarray"            # células de grau 3 ou 4
+    caminho: "np.ndarray"            # passos da entrada à saída (-1 se não houver)
+    distancia_max: "np.ndarray"      # célula mais distante da entrada
+    corredor_medio: "np.ndarray"     # comprimento médio dos corredores
+    livres: "np.ndarray"             # células livres
+    dificuldade: "np.ndarray"
+
+
+def medir(labs: Sequence[Labirinto]) -> Metricas:
+    """Mede uma lista de labirintos do mesmo tamanho de uma só vez."""
+    pilha = empilhar(labs)
+    grau = contar_vizinhos(pilha)
+    dist = campo_distancias(pilha, [lab.entrada for lab in labs])
+    caminho = np.array([dist[i, lab.saida[0], lab.saida[1]] for i, lab in enumerate(labs)])
+    corredores = comprimentos_corredores(pilha)
+    livres = pilha.sum(axis=(1, 2))
+    becos = (grau == 1).sum(axis=(1, 2))
+    reta = np.array([abs(lab.saida[0] - lab.entrada[0]) + abs(lab.saida[1] - lab.entrada[1])
+                     for lab in labs])
+    return Metricas(
+        becos=becos,
+        juncoes=(grau >= 3).sum(axis=(1, 2)),
+        caminho=caminho,
+        distancia_max=dist.reshape(len(labs), -1).max(axis=1),
+        corredor_medio=np.array([c.mean() if c.size else 0.0 for c in corredores]),
+        livres=livres,
+        dificuldade=dificuldade(caminho, reta, becos, livres),
+    )
+
+
+def dificuldade(caminho, reta, becos, livres) -> "np.ndarray":
+    """Dificuldade medida: tortuosidade do menor caminho x (1 + fração de becos).
+
+    A tortuosidade (passos reais / distância em linha reta) cresce com os
+    desvios do caminho; becos são armadilhas para quem explora sem mapa.
+    Labirintos sem solução recebem infinito.
+    """
+    caminho = np.asarray(caminho, dtype=float)
+    tortuosidade = caminho / np.maximum(np.asarray(reta, dtype=float), 1)
+    valor = tortuosidade * (1 + np.asarray(becos) / np.maximum(np.asarray(livres), 1))
+    return np.where(caminho < 0, np.inf, valor)
+
+
+def semente_por_dificuldade(largura: int, altura: int, nivel: str, algoritmo: str = "backtracking",
+                            itens: int = 5, amostras: int = 64, semente_inicial: int = 0) -> int:
+    """Escolhe, entre `amostras` sementes consecutivas, a de dificuldade medida do `nivel`.
+
+    Gera os labirintos candidatos, mede-os em lote e devolve a semente cuja
+    dificuldade fica no quantil de `QUANTIS[nivel]` (ex.: 0.9 para "dificil").
+
+    Raises:
+        ValueError: se o nível não existir.
+    """
+    if nivel not in QUANTIS:
+        raise ValueError(f"Nível desconhecido: {nivel!r}. Opções: {', '.join(QUANTIS)}")
+    sementes = range(semente_inicial, semente_inicial + amostras)
+    labs = [criar_labirinto(largura, altura, sementes=s, itens=itens, algoritmo=algoritmo)
+            for s in sementes]
+    valores = medir(labs).dificuldade
+    alvo = np.quantile(valores, QUANTIS[nivel])
+    return sementes[int(np.argmin(np.abs(valores - alvo)))]
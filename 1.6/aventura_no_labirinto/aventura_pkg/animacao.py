@@ -0,0 +1,104 @@
+"""
+Agendador de animações com orçamento por quadro.
+
+Uma animação é uma sequência de passos (células de um caminho, linhas de
+uma comemoração) com horário marcado: o passo k acontece em k / velocidade
+segundos ou, com duração fixa, em k * duracao / passos. Os quadros saem no
+máximo `fps` vezes por segundo, e cada quadro aplica todos os passos já
+vencidos antes de desenhar uma única vez. Quando desenhar custa mais que o
+intervalo entre quadros, os quadros seguintes juntam vários passos. Assim a
+animação termina no horário previsto, qualquer que seja o tamanho do
+caminho ou do labirinto.
+
+    agendador = Agendador(fps=30, duracao=5.0)
+    est = agendador.executar(len(passos), avancar, desenhar)
+    est.quadros, est.juntados, est.custo_ms(95)
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass, field
+from typing import Callable, List, Optional
+
+from .perfil import medir
+
+FPS = 30  # quadros por segundo, no máximo
+
+
+@dataclass
+class EstatisticasAnimacao:
+    """Contadores de uma animação e custo de cada desenho."""
+    passos: int = 0
+    quadros: int = 0
+    segundos: float = 0.0
+    custos: List[float] = field(default_factory=list, repr=False)  # segundos por desenho
+
+    @property
+    def juntados(self) -> int:
+        """Passos que não ganharam quadro próprio (foram desenhados junto com outros)."""
+        return self.passos - self.quadros
+
+    def custo_ms(self, percentil: float = 50) -> float:
+        """Custo de desenhar um quadro, em ms, no percentil pedido."""
+        if not self.custos:
+            return 0.0
+        ordenados = sorted(self.custos)
+        return ordenados[min(len(ordenados) - 1, int(len(ordenados) * percentil / 100))] * 1000
+
+
+class Agendador:
+    """Distribui os passos de uma animação em quadros de no máximo `fps` por segundo.
+
+    Args:
+        fps: quadros por segundo, no máximo.
+        velocidade: passos por segundo (0 = um passo por quadro, sem pausa).
+        duracao: duração total em segundos; se dada, vale no lugar de `velocidade`
+            (0 = todos os passos num único quadro).
+    """
+
+    def __init__(self, fps: float = FPS, velocidade: float = 0.0, duracao: Optional[float] = None):
+        self.fps = fps
+        self.velocidade = velocidade
+        self.duracao = duracao
+
+    def intervalo_passo(self, passos: int) -> float:
+        """Segundos entre dois passos (0 = sem horário marcado)."""
+        if self.duracao is not None and passos > 0:
+            return max(self.duracao, 0.0) / passos
+        return 1.0 / self.velocidade if self.velocidade > 0 else 0.0
+
+    def executar(self, passos: int, avancar: Callable[[int], object],
+                 desenhar: Callable[[], object]) -> EstatisticasAnimacao:
+        """Roda a animação: `avancar(n)` aplica os próximos n passos e `desenhar()` mostra o quadro.
+
+        O quadro inicial (antes do primeiro passo) fica a cargo de quem chama.
+        """
+        est = EstatisticasAnimacao(passos=max(passos, 0))
+        por_passo = self.intervalo_passo(passos)
+        por_quadro = 1.0 / self.fps if self.fps > 0 and por_passo else 0.0
+        relogio = time.perf_counter
+        t0 = proximo_quadro = relogio()
+        feitos = 0
+        while feitos < passos:
+            if por_passo:
+                # espera o próximo quadro livre e o próximo passo vencido
+                espera = max(proximo_quadro, t0 + (feitos + 1) * por_passo) - relogio()
+                if espera > 0:
+                    with medir("espera"):
+                        time.sleep(espera)
+                vencidos = int((relogio() - t0) / por_passo)
+                devidos = min(passos, max(feitos + 1, vencidos))
+            else:
+                # duração zero: tudo num quadro; sem horário: um passo por quadro
+                devidos = passos if self.duracao is not None else feitos + 1
+            avancar(devidos - feitos)
+            feitos = devidos
+            inicio = relogio()
+            desenhar()
+            fim = relogio()
+            est.custos.append(fim - inicio)
+            est.quadros += 1
+            # atrasado, o próximo quadro sai logo, sem acumular uma rajada de quadros
+            proximo_quadro = max(proximo_quadro + por_quadro, fim) if por_quadro else fim
+        est.segundos = relogio() - t0
+        return est
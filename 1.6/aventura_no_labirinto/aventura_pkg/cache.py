@@ -0,0 +1,157 @@
+"""
+Cache de níveis: labirintos gerados e suas soluções, por (tamanho, semente, algoritmo).
+
+Gerar um labirinto é determinístico dada a chave (largura, altura, semente,
+algoritmo, itens), então repetir ou compartilhar um nível não precisa
+gerá-lo de novo. Os labirintos ficam guardados no formato binário de
+`serializacao` (1 bit por célula) num LRU em memória com orçamento em bytes
+e, opcionalmente, num diretório em disco. Cada acesso devolve um labirinto
+independente: coletar itens nele não altera o que está no cache.
+"""
+from __future__ import annotations
+
+import random
+from array import array
+from collections import OrderedDict
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from .labirinto import Labirinto, criar_labirinto
+from .serializacao import para_bytes, de_bytes
+from .solucionador import resolver
+
+Cell = Tuple[int, int]
+Chave = Tuple[int, int, int, str, int]
+
+# custo fixo estimado de cada entrada (chave, nó do OrderedDict, objeto bytes)
+_CUSTO_ENTRADA = 200
+
+
+@dataclass
+class EstatisticasCache:
+    """Contadores do cache."""
+    acertos: int = 0
+    acertos_disco: int = 0
+    falhas: int = 0
+    despejos: int = 0
+    bytes_usados: int = 0
+
+
+def normalizar_chave(largura: int, altura: int, semente: int,
+                     algoritmo: str = "backtracking", itens: int = 5) -> Chave:
+    """Chave canônica, com as mesmas correções de tamanho de `criar_labirinto`."""
+    largura = max(largura, 7) | 1
+    altura = max(altura, 7) | 1
+    return (largura, altura, semente, algoritmo, itens)
+
+
+class CacheNiveis:
+    """LRU de labirintos e soluções com orçamento em bytes e camada em disco opcional.
+
+    Args:
+        orcamento_bytes: limite de memória das entradas guardadas.
+        diretorio: se informado, cada entrada também é gravada ali e lida de
+            volta quando sai da memória.
+    """
+
+    def __init__(self, orcamento_bytes: int = 64 * 2**20, diretorio: Optional[Union[str, Path]] = None):
+        self.orcamento_bytes = orcamento_bytes
+        self.diretorio = Path(diretorio) if diretorio is not None else None
+        if self.diretorio is not None:
+            self.diretorio.mkdir(parents=True, exist_ok=True)
+        self._entradas: "OrderedDict[Tuple[str, Chave], bytes]" = OrderedDict()
+        self.stats = EstatisticasCache()
+
+    # ------------------------------------------------------------------ #
+    # armazenamento
+    # ------------------------------------------------------------------ #
+    def _arquivo(self, tipo: str, chave: Chave) -> Path:
+        largura, altura, semente, algoritmo, itens = chave
+        return self.diretorio / f"{largura}x{altura}-{algoritmo}-i{itens}-s{semente}.{tipo}"
+
+    def _obter(self, tipo: str, chave: Chave) -> Optional[bytes]:
+        entrada = self._entradas.get((tipo, chave))
+        if entrada is not None:
+            self._entradas.move_to_end((tipo, chave))
+            self.stats.acertos += 1
+            return entrada
+        if self.diretorio is not None:
+            arquivo = self._arquivo(tipo, chave)
+            if arquivo.exists():
+                entrada = arquivo.read_bytes()
+                self._guardar(tipo, chave, entrada, gravar=False)
+                self.stats.acertos_disco += 1
+                return entrada
+        self.stats.falhas += 1
+        return None
+
+    def _guardar(self, tipo: str, chave: Chave, valor: bytes, gravar: bool = True) -> None:
+        if gravar and self.diretorio is not None:
+            self._arquivo(tipo, chave).write_bytes(valor)
+        custo = len(valor) + _CUSTO_ENTRADA
+        if custo > self.orcamento_bytes:
+            return  # maior que o cache inteiro: não vale expulsar tudo
+        anterior = self._entradas.pop((tipo, chave), None)
+        if anterior is not None:
+            self.stats.bytes_usados -= len(anterior) + _CUSTO_ENTRADA
+        self._entradas[(tipo, chave)] = valor
+        self.stats.bytes_usados += custo
+        while self.stats.bytes_usados > self.orcamento_bytes:
+            _, velho = self._entradas.popitem(last=False)
+            self.stats.bytes_usados -= len(velho) + _CUSTO_ENTRADA
+            self.stats.despejos += 1
+
+    # ------------------------------------------------------------------ #
+    # API
+    # ------------------------------------------------------------------ #
+    def labirinto(self, largura: int, altura: int, semente: Optional[int] = None,
+                  algoritmo: str = "backtracking", itens: int = 5) -> Labirinto:
+        """Retorna o labirinto da chave, gerando-o só na primeira vez.
+
+        Sem `semente`, sorteia uma (o labirinto fica reprodutível por
+        `lab.semente`). O labirinto devolvido é uma cópia independente.
+        """
+        if semente is None:
+            semente = random.randrange(2**31)
+        chave = normalizar_chave(largura, altura, semente, algoritmo, itens)
+        blob = self._obter("lab", chave)
+        if blob is None:
+            lab = criar_labirinto(largura, altura, sementes=semente, itens=itens, algoritmo=algoritmo)
+            blob = para_bytes(lab)
+            self._guardar("lab", chave, blob)
+            return lab
+        return de_bytes(blob)
+
+    def solucao(self, largura: int, altura: int, semente: int, algoritmo: str = "backtracking",
+                itens: int = 5, metodo: str = "bfs") -> Optional[List[Cell]]:
+        """Menor caminho da entrada à saída do labirinto da chave, com cache.
+
+        O caminho é guardado como índices lineares de 4 bytes por passo.
+        """
+        chave = normalizar_chave(largura, altura, semente, algoritmo, itens)
+        tipo = f"sol-{metodo}"
+        blob = self._obter(tipo, chave)
+        largura = chave[0]
+        if blob is not None:
+            if not blob:
+                return None
+            passos = array('I')
+            passos.frombytes(blob)
+            return [divmod(k, largura) for k in passos]
+        caminho = resolver(self.labirinto(largura, altura, semente, algoritmo, itens), metodo=metodo)
+        passos = array('I', (r * largura + c for r, c in caminho or ()))
+        self._guardar(tipo, chave, passos.tobytes())
+        return caminho
+
+    def estatisticas(self) -> Dict[str, int]:
+        """Contadores de acertos (memória e disco), falhas, despejos e bytes usados."""
+        return asdict(self.stats)
+
+    def limpar(self) -> None:
+        """Esvazia a camada em memória (o disco é mantido)."""
+        self._entradas.clear()
+        self.stats.bytes_usados = 0
+
+    def __len__(self) -> int:
+        return len(self._entradas)
@@ -0,0 +1,295 @@
+"""
+Laço de jogo assíncrono com uma fonte de entrada persistente.
+
+Uma única fonte de entrada fica ativa durante toda a partida (em vez de um
+`keyboard.Listener` criado e destruído a cada tecla) e empurra eventos
+numa `asyncio.Queue`; o laço de jogo roda num tique fixo, aplica todos os
+comandos pendentes e só então redesenha, de modo que entrada e renderização
+ficam desacopladas.
+
+Fontes disponíveis (escolhidas por `fonte_padrao`, nesta ordem):
+
+- FontePynput: um `keyboard.Listener` para a partida inteira.
+- FonteTTY: leitura crua do terminal (modo cbreak) via `loop.add_reader`,
+  para Linux/macOS sem pynput.
+- FonteInput: linhas de `input()` numa thread, como último recurso.
+
+`FonteRoteirizada` reproduz uma sequência de teclas e serve para testes e
+para medir a latência entre a tecla e o quadro desenhado.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import sys
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+from .jogador import Jogador, _tentar_mover, mostrar_dica
+from .reproducao import Sessao
+from .terminal import obter_console, obter_teclado
+from .perfil import medir
+
+try:
+    import termios
+    import tty
+except ImportError:  # pragma: no cover (Windows)
+    termios = tty = None
+
+Cell = Tuple[int, int]
+Comando = Union[Tuple[int, int], str]   # deslocamento, "sair" ou "dica"
+
+TECLAS: Dict[str, Comando] = {
+    'w': (-1, 0), 's': (1, 0), 'a': (0, -1), 'd': (0, 1),
+    'Key.up': (-1, 0), 'Key.down': (1, 0), 'Key.left': (0, -1), 'Key.right': (0, 1),
+    'q': "sair", 'Key.esc': "sair",
+    'h': "dica",
+}
+
+# sequências de escape das setas no terminal
+_SEQUENCIAS_TTY = {
+    "\x1b[A": 'Key.up', "\x1b[B": 'Key.down', "\x1b[C": 'Key.right', "\x1b[D": 'Key.left',
+    "\x1bOA": 'Key.up', "\x1bOB": 'Key.down', "\x1bOC": 'Key.right', "\x1bOD": 'Key.left',
+}
+# começos de sequência que podem ser completados pela próxima leitura
+_PREFIXOS_TTY = {seq[:n] for seq in _SEQUENCIAS_TTY for n in range(1, len(seq))}
+ESPERA_ESC = 0.05   # segundos até um ESC sem continuação valer como a tecla ESC
+
+
+@dataclass
+class Evento:
+    """Comando lido do teclado e o instante (perf_counter) em que chegou."""
+    comando: Comando
+    instante: float
+
+
+class FonteEntrada:
+    """Base das fontes: entregam `Evento`s em `fila` até `parar` ser chamado."""
+
+    def iniciar(self, loop: asyncio.AbstractEventLoop, fila: "asyncio.Queue[Evento]") -> None:
+        self._loop = loop
+        self._fila = fila
+
+    def parar(self) -> None:
+        pass
+
+    def _tecla(self, tecla: str) -> None:
+        """Converte a tecla em comando e o põe na fila (pode ser chamada de outra thread)."""
+        comando = TECLAS.get(tecla)
+        if comando is None:
+            return
+        evento = Evento(comando, time.perf_counter())
+        if threading.current_thread() is threading.main_thread():
+            self._fila.put_nowait(evento)
+        else:
+            self._loop.call_soon_threadsafe(self._fila.put_nowait, evento)
+
+
+class FontePynput(FonteEntrada):
+    """Um único `keyboard.Listener` para a partida inteira."""
+
+    def iniciar(self, loop, fila) -> None:
+        super().iniciar(loop, fila)
+        self._listener = obter_teclado().Listener(on_press=self._ao_pressionar)
+        self._listener.start()
+        self._listener.wait()
+
+    def _ao_pressionar(self, key) -> None:
+        try:
+            tecla = key.char.lower()
+        except AttributeError:
+            tecla = str(key)
+        self._tecla(tecla)
+
+    def parar(self) -> None:
+        self._listener.stop()
+
+
+class FonteTTY(FonteEntrada):
+    """Leitura crua do terminal (modo cbreak, sem eco) integrada ao laço asyncio.
+
+    Uma seta pode chegar dividida entre duas leituras ("\\x1b" e depois "[A").
+    Um começo de sequência no fim da leitura fica guardado até a próxima; se
+    nada chegar em `ESPERA_ESC` segundos, um ESC sozinho vale como a tecla ESC.
+    """
+
+    def iniciar(self, loop, fila) -> None:
+        super().iniciar(loop, fila)
+        self._pendente = ""
+        self._espera: Optional[asyncio.TimerHandle] = None
+        self._fd = sys.stdin.fileno()
+        self._modo_original = termios.tcgetattr(self._fd)
+        tty.setcbreak(self._fd)
+        loop.add_reader(self._fd, self._ler)
+
+    def _ler(self) -> None:
+        if self._espera is not None:
+            self._espera.cancel()
+            self._espera = None
+        texto = self._pendente + os.read(self._fd, 64).decode("utf-8", errors="ignore")
+        self._pendente = ""
+        i = 0
+        while i < len(texto):
+            if texto[i:] in _PREFIXOS_TTY:
+                # sequência incompleta: o resto chega na próxima leitura
+                self._pendente = texto[i:]
+                self._espera = self._loop.call_later(ESPERA_ESC, self._esc_sozinho)
+                return
+            for seq, tecla in _SEQUENCIAS_TTY.items():
+                if texto.startswith(seq, i):
+                    self._tecla(tecla)
+                    i += len(seq)
+                    break
+            else:
+                ch = texto[i]
+                self._tecla('Key.esc' if ch == "\x1b" else ch.lower())
+                i += 1
+
+    def _esc_sozinho(self) -> None:
+        """Nada completou a sequência pendente: ESC e o que vier depois são teclas soltas."""
+        self._espera = None
+        pendente, self._pendente = self._pendente, ""
+        for ch in pendente:
+            self._tecla('Key.esc' if ch == "\x1b" else ch.lower())
+
+    def parar(self) -> None:
+        if self._espera is not None:
+            self._espera.cancel()
+        self._loop.remove_reader(self._fd)
+        termios.tcsetattr(self._fd, termios.TCSADRAIN, self._modo_original)
+
+
+class FonteInput(FonteEntrada):
+    """Último recurso: lê linhas com `input()` numa thread (cada letra é um comando).
+
+    Como `input()` não pode ser interrompido, a thread só termina ao ler a
+    linha seguinte ao fim da partida, que é descartada.
+    """
+
+    def iniciar(self, loop, fila) -> None:
+        super().iniciar(loop, fila)
+        self._ativa = True
+        console = obter_console()
+        if console:
+            console.print("[dim]Controles: W/A/S/D ou Q para sair[/]")
+        else:
+            print("Controles: W/A/S/D ou Q para sair")
+        threading.Thread(target=self._ler, daemon=True).start()
+
+    def _ler(self) -> None:
+        while self._ativa:
+            try:
+                linha = input("-> ")
+            except EOFError:
+                linha = 'q'
+            if not self._ativa:
+                return
+            for ch in linha.strip().lower():
+                self._tecla(ch)
+                if TECLAS.get(ch) == "sair":
+                    return  # não disputa a próxima linha com o menu
+
+    def parar(self) -> None:
+        self._ativa = False
+
+
+class FonteRoteirizada(FonteEntrada):
+    """Reproduz `teclas` com `intervalo` segundos entre elas (para testes e benchmarks)."""
+
+    def __init__(self, teclas: Iterable[str], intervalo: float = 0.0):
+        self.teclas = list(teclas)
+        self.intervalo = intervalo
+
+    def iniciar(self, loop, fila) -> None:
+        super().iniciar(loop, fila)
+        self._tarefa = loop.create_task(self._tocar())
+
+    async def _tocar(self) -> None:
+        for tecla in self.teclas:
+            await asyncio.sleep(self.intervalo)
+            self._tecla(tecla)
+
+    def parar(self) -> None:
+        self._tarefa.cancel()
+
+
+def fonte_padrao() -> FonteEntrada:
+    """Escolhe a melhor fonte disponível: pynput, terminal cru ou `input()`."""
+    if obter_teclado() is not None:
+        return FontePynput()
+    if termios is not None and sys.stdin.isatty():
+        return FonteTTY()
+    return FonteInput()
+
+
+@dataclass
+class ResultadoPartida:
+    """Como a partida terminou e as latências tecla -> quadro (segundos)."""
+    motivo: str                       # "vitoria" ou "sair"
+    quadros: int = 0
+    latencias: List[float] = field(default_factory=list)
+
+
+async def jogar(lab, jogador: Jogador, desenhar: Callable[[Cell], object],
+                fonte: Optional[FonteEntrada] = None, fps: float = 60.0,
+                sessao: Optional[Sessao] = None) -> ResultadoPartida:
+    """Roda uma partida até o jogador chegar à saída ou pedir para sair.
+
+    A cada tique (1/fps s) todos os comandos pendentes são aplicados e, se o
+    estado mudou, `desenhar(jogador.pos)` é chamado uma única vez.
+
+    Args:
+        lab: labirinto da partida.
+        jogador: estado do jogador (é alterado).
+        desenhar: função que desenha um quadro com o jogador na posição dada.
+        fonte: fonte de entrada (padrão: `fonte_padrao()`).
+        fps: tiques por segundo do laço.
+        sessao: se informada, cada movimento aplicado é registrado nela
+            (veja `reproducao`).
+    """
+    fonte = fonte if fonte is not None else fonte_padrao()
+    loop = asyncio.get_running_loop()
+    fila: "asyncio.Queue[Evento]" = asyncio.Queue()
+    resultado = ResultadoPartida("sair")
+    tique = 1.0 / fps
+    desenhar(jogador.pos)
+    resultado.quadros += 1
+    fonte.iniciar(loop, fila)
+    try:
+        proximo = loop.time()
+        while True:
+            # espera o primeiro evento (sem girar em falso) e depois o resto do tique
+            with medir("entrada"):
+                pendentes = [await fila.get()]
+            while not fila.empty():
+                pendentes.append(fila.get_nowait())
+            mudou = False
+            for evento in pendentes:
+                comando = evento.comando
+                if comando == "sair":
+                    resultado.motivo = "sair"
+                    return resultado
+                if comando == "dica":
+                    mostrar_dica(lab, jogador)
+                    continue
+                _tentar_mover(lab, jogador, comando)
+                if sessao is not None:
+                    sessao.registrar(comando)
+                mudou = True
+                if jogador.pos == lab.saida:
+                    break
+            if mudou:
+                desenhar(jogador.pos)
+                resultado.quadros += 1
+                agora = time.perf_counter()
+                resultado.latencias.extend(agora - e.instante for e in pendentes)
+            if jogador.pos == lab.saida:
+                resultado.motivo = "vitoria"
+                return resultado
+            proximo = max(proximo + tique, loop.time())
+            with medir("espera"):
+                await asyncio.sleep(proximo - loop.time())
+    finally:
+        fonte.parar()
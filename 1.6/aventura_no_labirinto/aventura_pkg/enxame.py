@@ -0,0 +1,260 @@
+"""
+Enxame de bots vetorizado com NumPy, para medir a dificuldade de um labirinto.
+
+Milhares de bots andam pelo mesmo labirinto, cada um com os próprios itens
+(como as sessões do `servidor`). O estado fica em arrays, um elemento por bot
+(estrutura de arrays): posição como índice linear, pontos, movimentos, itens
+coletados e o passo em que chegou à saída. Cada passo move todos os bots de
+uma vez:
+
+- a máscara de paredes é calculada uma vez, com uma borda extra de parede, e
+  o deslocamento de cada direção vira uma soma ao índice;
+- as regras de `jogador.pontuar` são aplicadas em forma vetorial: -1 ao bater
+  na parede, +1 ao andar, +10 pelo primeiro item de cada célula (uma matriz
+  bots x itens guarda o que cada bot já coletou) e +50 ao chegar à saída;
+- quem chega à saída para, como na partida normal.
+
+Políticas: "aleatorio" (direção sorteada a cada passo, batendo em paredes) e
+"parede" (segue a parede pela direita ou pela esquerda, sorteado por bot).
+
+`simular_objetos` roda as mesmas políticas e sorteios com um `Jogador` e
+`_tentar_mover` por bot e deve dar exatamente o mesmo resultado; serve de
+referência e de base de comparação em `benchmarks/bench_enxame.py`.
+
+O resultado traz o mapa de calor das visitas (`mapa_calor`) e a distribuição
+dos tempos até a saída (`ResultadoEnxame.resumo`).
+"""
+from __future__ import annotations
+
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+from .labirinto import Labirinto
+from .analise import para_array, _exigir_numpy, np
+
+Cell = Tuple[int, int]
+
+POLITICAS = ("aleatorio", "parede")
+
+# direções em sentido horário: cima, direita, baixo, esquerda
+DIRECOES: Tuple[Cell, ...] = ((-1, 0), (0, 1), (1, 0), (0, -1))
+
+# do menos ao mais visitado (escala logarítmica); paredes saem como '#'
+_TONS = " .:-=+*%@"
+
+
+@dataclass
+class ResultadoEnxame:
+    """Estado final dos bots (um elemento por bot) e visitas por célula."""
+    pontos: "np.ndarray"
+    movimentos: "np.ndarray"
+    itens: "np.ndarray"
+    chegada: "np.ndarray"     # passo em que chegou à saída (-1 se não chegou)
+    visitas: "np.ndarray"     # (altura, largura): bots que passaram em cada célula, somando passos
+    passos: int               # passos simulados (pode parar antes se todos chegarem)
+    segundos: float = 0.0
+
+    @property
+    def bots(self) -> int:
+        return len(self.pontos)
+
+    def tempos_saida(self) -> "np.ndarray":
+        """Passos até a saída dos bots que chegaram."""
+        return self.chegada[self.chegada >= 0]
+
+    def cobertura(self, lab: Labirinto) -> float:
+        """Fração das células livres visitadas por pelo menos um bot."""
+        livres = para_array(lab)
+        return float((self.visitas[livres] > 0).mean())
+
+    def resumo(self) -> Dict[str, float]:
+        """Taxa de chegada, percentis do tempo até a saída e médias de pontos e itens."""
+        tempos = self.tempos_saida()
+        linha = {"bots": self.bots, "passos": self.passos, "chegaram": len(tempos) / self.bots}
+        for p in (10, 50, 90):
+            linha[f"p{p}"] = float(np.percentile(tempos, p)) if len(tempos) else float("nan")
+        linha["pontos_medio"] = float(self.pontos.mean())
+        linha["itens_medio"] = float(self.itens.mean())
+        return linha
+
+    def iguais(self, outro: "ResultadoEnxame") -> bool:
+        """True se os dois resultados têm o mesmo estado final e as mesmas visitas."""
+        return all(np.array_equal(getattr(self, nome), getattr(outro, nome))
+                   for nome in ("pontos", "movimentos", "itens", "chegada", "visitas"))
+
+
+def _preparar(lab: Labirinto):
+    """Máscara de células livres com borda de parede (achatada) e índices em coordenadas com borda."""
+    livre = np.pad(para_array(lab), 1, constant_values=False)
+    largura = lab.largura + 2
+    deslocamentos = np.array([dr * largura + dc for dr, dc in DIRECOES], dtype=np.int64)
+    # índice do item em cada célula (-1 onde não há item)
+    id_item = np.full(livre.size, -1, dtype=np.int64)
+    for i, (r, c) in enumerate(sorted(lab.itens)):
+        id_item[(r + 1) * largura + c + 1] = i
+    inicio = (lab.entrada[0] + 1) * largura + lab.entrada[1] + 1
+    saida = (lab.saida[0] + 1) * largura + lab.saida[1] + 1 if lab.saida is not None else -1
+    return livre.ravel(), largura, deslocamentos, id_item, inicio, saida
+
+
+def _visitas(contagem: "np.ndarray", lab: Labirinto) -> "np.ndarray":
+    """Contagem achatada (com borda) -> mapa (altura, largura) sem a borda."""
+    return contagem.reshape(lab.altura + 2, lab.largura + 2)[1:-1, 1:-1].copy()
+
+
+def _sorteios_iniciais(rng, bots: int, politica: str):
+    """Direção inicial e mão (1 = direita, -1 = esquerda) de cada bot seguidor de parede."""
+    if politica == "parede":
+        return rng.integers(0, 4, bots), rng.choice(np.array([1, -1]), bots)
+    return None, None
+
+
+def _validar(politica: str) -> None:
+    if politica not in POLITICAS:
+        raise ValueError(f"Política desconhecida: {politica!r}. Opções: {', '.join(POLITICAS)}")
+
+
+def simular_enxame(lab: Labirinto, bots: int = 1000, passos: int = 2000,
+                   politica: str = "aleatorio", semente: int = 0) -> ResultadoEnxame:
+    """Simula `bots` bots por até `passos` passos, todos de uma vez a cada passo.
+
+    Raises:
+        ValueError: se `politica` não estiver em `POLITICAS`.
+    """
+    _exigir_numpy()
+    _validar(politica)
+    t0 = time.perf_counter()
+    livre, largura, deslocamentos, id_item, inicio, saida = _preparar(lab)
+    rng = np.random.default_rng(semente)
+    direcao, mao = _sorteios_iniciais(rng, bots, politica)
+    if politica == "parede":
+        # ordem de tentativa: virar para o lado da mão, seguir, virar para o outro, voltar
+        giros = np.stack([mao, np.zeros_like(mao), -mao, np.full_like(mao, 2)], axis=1)
+
+    pos = np.full(bots, inicio, dtype=np.int64)
+    pontos = np.zeros(bots, dtype=np.int64)
+    movimentos = np.zeros(bots, dtype=np.int64)
+    itens = np.zeros(bots, dtype=np.int64)
+    chegada = np.full(bots, -1, dtype=np.int64)
+    coletados = np.zeros((bots, max(len(lab.itens), 1)), dtype=bool)
+    ativo = np.ones(bots, dtype=bool)
+    contagem = np.zeros(livre.size, dtype=np.int64)
+    linhas = np.arange(bots)
+
+    feitos = 0
+    for passo in range(passos):
+        if not ativo.any():
+            break
+        if politica == "aleatorio":
+            d = rng.integers(0, 4, bots)
+        else:
+            candidatas = (direcao[:, None] + giros) % 4
+            livres = livre[pos[:, None] + deslocamentos[candidatas]]
+            d = candidatas[linhas, livres.argmax(axis=1)]   # a primeira livre (ou a primeira, se nenhuma)
+            direcao = np.where(ativo, d, direcao)
+        alvo = pos + deslocamentos[d]
+        anda = ativo & livre[alvo]
+        bate = ativo & ~anda
+        pontos += anda
+        pontos -= bate
+        movimentos += ativo
+        pos = np.where(anda, alvo, pos)
+
+        quem = np.flatnonzero(anda & (id_item[pos] >= 0))
+        if quem.size:
+            ids = id_item[pos[quem]]
+            novos = ~coletados[quem, ids]
+            quem, ids = quem[novos], ids[novos]
+            coletados[quem, ids] = True
+            pontos[quem] += 10
+            itens[quem] += 1
+
+        chegou = anda & (pos == saida)
+        pontos[chegou] += 50
+        chegada[chegou] = passo + 1
+
+        parcial = np.bincount(pos[ativo])
+        contagem[:parcial.size] += parcial
+        ativo &= ~chegou
+        feitos = passo + 1
+
+    return ResultadoEnxame(pontos, movimentos, itens, chegada, _visitas(contagem, lab), feitos,
+                           time.perf_counter() - t0)
+
+
+def simular_objetos(lab: Labirinto, bots: int = 1000, passos: int = 2000,
+                    politica: str = "aleatorio", semente: int = 0) -> ResultadoEnxame:
+    """Mesma simulação de `simular_enxame`, com um `Jogador` e `_tentar_mover` por bot.
+
+    Usa os mesmos sorteios (mesma semente e ordem), então o resultado é idêntico.
+    """
+    from .jogador import iniciar_jogador, _tentar_mover
+    from .servidor import Sobreposicao
+
+    _exigir_numpy()
+    _validar(politica)
+    t0 = time.perf_counter()
+    rng = np.random.default_rng(semente)
+    direcao, mao = _sorteios_iniciais(rng, bots, politica)
+    if politica == "parede":
+        direcao, mao = direcao.tolist(), mao.tolist()
+    jogadores = [iniciar_jogador(lab.entrada) for _ in range(bots)]
+    visoes = [Sobreposicao(lab) for _ in range(bots)]
+    chegada = [-1] * bots
+    ativos = list(range(bots))
+    contagem: Dict[Cell, int] = {}
+
+    feitos = 0
+    for passo in range(passos):
+        if not ativos:
+            break
+        sorteio = rng.integers(0, 4, bots).tolist() if politica == "aleatorio" else None
+        seguem = []
+        for b in ativos:
+            j, visao = jogadores[b], visoes[b]
+            if sorteio is not None:
+                d = sorteio[b]
+            else:
+                r, c = j.pos
+                ordem = [(direcao[b] + g) % 4 for g in (mao[b], 0, -mao[b], 2)]
+                d = next((o for o in ordem
+                          if visao.celula(r + DIRECOES[o][0], c + DIRECOES[o][1]) != '#'), ordem[0])
+                direcao[b] = d
+            _tentar_mover(visao, j, DIRECOES[d])
+            contagem[j.pos] = contagem.get(j.pos, 0) + 1
+            if j.pos == lab.saida:
+                chegada[b] = passo + 1
+            else:
+                seguem.append(b)
+        ativos = seguem
+        feitos = passo + 1
+
+    visitas = np.zeros((lab.altura, lab.largura), dtype=np.int64)
+    for (r, c), n in contagem.items():
+        visitas[r, c] = n
+    return ResultadoEnxame(np.array([j.pontos for j in jogadores], dtype=np.int64),
+                           np.array([j.movimentos for j in jogadores], dtype=np.int64),
+                           np.array([j.itens_coletados for j in jogadores], dtype=np.int64),
+                           np.array(chegada, dtype=np.int64), visitas, feitos,
+                           time.perf_counter() - t0)
+
+
+def mapa_calor(resultado: ResultadoEnxame, lab: Labirinto) -> List[str]:
+    """Linhas de texto com as visitas em escala logarítmica (paredes como '#')."""
+    livres = para_array(lab)
+    nivel = np.log1p(resultado.visitas.astype(float))
+    topo = nivel.max() or 1.0
+    indices = np.ceil(nivel / topo * (len(_TONS) - 1)).astype(int)
+    tons = np.array(list(_TONS))[indices]
+    tons[~livres] = '#'
+    return ["".join(linha) for linha in tons]
+
+
+def histograma_saida(resultado: ResultadoEnxame, faixas: int = 10) -> List[Tuple[int, int, int]]:
+    """Faixas (início, fim, bots) dos passos até a saída."""
+    tempos = resultado.tempos_saida()
+    if not len(tempos):
+        return []
+    contagens, bordas = np.histogram(tempos, bins=faixas)
+    return [(int(bordas[i]), int(bordas[i + 1]), int(n)) for i, n in enumerate(contagens)]
@@ -0,0 +1,297 @@
+"""
+Algoritmos de geração de labirintos e o registro que os expõe por nome.
+
+Todos os geradores trabalham sobre uma grade compacta (`labirinto.Grade`) que
+começa toda preenchida com paredes. As "salas" ficam nas coordenadas ímpares
+e cada algoritmo decide quais paredes entre salas vizinhas derrubar, sempre
+produzindo um labirinto perfeito (existe exatamente um caminho entre duas
+salas quaisquer).
+
+A aleatoriedade vem do objeto `rng` recebido (o módulo `random` ou uma
+instância de `random.Random`), de modo que a mesma semente gera sempre o mesmo
+labirinto.
+
+Para adicionar um algoritmo basta decorá-lo com `registrar_gerador`:
+
+    @registrar_gerador("meu_algoritmo")
+    def meu_algoritmo(grade, rng):
+        ...
+"""
+from __future__ import annotations
+
+from array import array
+from typing import Callable, Dict, Iterator, List
+
+PAREDE = ord('#')
+LIVRE = ord(' ')
+
+Gerador = Callable[..., None]
+
+GERADORES: Dict[str, Gerador] = {}
+
+
+def registrar_gerador(nome: str) -> Callable[[Gerador], Gerador]:
+    """Decorador que registra um algoritmo de geração sob `nome`."""
+    def decorar(func: Gerador) -> Gerador:
+        GERADORES[nome] = func
+        return func
+    return decorar
+
+
+def obter_gerador(nome: str) -> Gerador:
+    """Retorna o gerador registrado como `nome`.
+
+    Raises:
+        ValueError: se não houver algoritmo com esse nome.
+    """
+    try:
+        return GERADORES[nome]
+    except KeyError:
+        opcoes = ", ".join(sorted(GERADORES))
+        raise ValueError(f"Algoritmo desconhecido: {nome!r}. Opções: {opcoes}") from None
+
+
+def _salas(largura: int, altura: int) -> tuple[int, int]:
+    """Número de salas por linha e por coluna numa grade `largura` x `altura`."""
+    return (largura - 1) // 2, (altura - 1) // 2
+
+
+@registrar_gerador("backtracking")
+def backtracking(grade, rng) -> None:
+    """Backtracking (DFS) com pilha explícita, a partir da sala (1, 1).
+
+    Reproduz exatamente a ordem de visita do antigo DFS recursivo — inclusive
+    as chamadas a `rng.shuffle` —, então a mesma semente gera o mesmo
+    labirinto. Cada quadro da pilha guarda a célula (índice linear) e um
+    iterador sobre os vizinhos ainda não tentados.
+    """
+    largura, altura, dados = grade.largura, grade.altura, grade.dados
+    shuffle = rng.shuffle
+    cima, baixo = -2 * largura, 2 * largura
+    lim_r, lim_q = altura - 2, largura - 2
+
+    def vizinhos(k: int) -> List[int]:
+        r, q = divmod(k, largura)
+        viz = []
+        if r > 1: viz.append(k + cima)
+        if r < lim_r - 1: viz.append(k + baixo)
+        if q > 1: viz.append(k - 2)
+        if q < lim_q - 1: viz.append(k + 2)
+        shuffle(viz)
+        return viz
+
+    k0 = largura + 1
+    dados[k0] = LIVRE
+    celulas = [k0]
+    pendentes = [iter(vizinhos(k0))]
+    while celulas:
+        k = celulas[-1]
+        for n in pendentes[-1]:
+            if dados[n] == PAREDE:
+                # remove parede intermediária
+                dados[(k + n) >> 1] = LIVRE
+                dados[n] = LIVRE
+                celulas.append(n)
+                pendentes.append(iter(vizinhos(n)))
+                break
+        else:
+            celulas.pop()
+            pendentes.pop()
+
+
+@registrar_gerador("kruskal")
+def kruskal(grade, rng) -> None:
+    """Kruskal aleatório: embaralha as paredes e une salas com union-find.
+
+    O union-find usa compressão de caminho (por divisão ao meio) e união por
+    tamanho, então cada operação custa praticamente O(1).
+    """
+    largura, dados = grade.largura, grade.dados
+    m, n = _salas(largura, grade.altura)
+
+    # paredes entre salas vizinhas, como índices lineares na grade
+    paredes = array('q')
+    for r in range(n):
+        base = (2 * r + 1) * largura
+        for q in range(m):
+            k = base + 2 * q + 1
+            if q < m - 1:
+                paredes.append(k + 1)
+            if r < n - 1:
+                paredes.append(k + largura)
+    rng.shuffle(paredes)
+
+    pai = array('q', range(m * n))
+    tamanho = array('q', [1]) * (m * n)
+
+    def raiz(x: int) -> int:
+        while pai[x] != x:
+            pai[x] = pai[pai[x]]
+            x = pai[x]
+        return x
+
+    for d in range(m * n):
+        dados[(2 * (d // m) + 1) * largura + 2 * (d % m) + 1] = LIVRE
+    restantes = m * n - 1
+    for w in paredes:
+        if not restantes:
+            break
+        r, q = divmod(w, largura)
+        if r % 2:  # parede vertical: salas à esquerda e à direita
+            a = (r // 2) * m + (q - 1) // 2
+            b = a + 1
+        else:      # parede horizontal: salas acima e abaixo
+            a = (r // 2 - 1) * m + q // 2
+            b = a + m
+        ra, rb = raiz(a), raiz(b)
+        if ra == rb:
+            continue
+        if tamanho[ra] < tamanho[rb]:
+            ra, rb = rb, ra
+        pai[rb] = ra
+        tamanho[ra] += tamanho[rb]
+        dados[w] = LIVRE
+        restantes -= 1
+
+
+@registrar_gerador("prim")
+def prim(grade, rng) -> None:
+    """Prim aleatório: expande a árvore por uma parede de fronteira sorteada."""
+    largura, altura, dados = grade.largura, grade.altura, grade.dados
+    randrange = rng.randrange
+    passos = (-2 * largura, 2 * largura, -2, 2)
+
+    def fronteira(k: int) -> None:
+        r, q = divmod(k, largura)
+        for d, ok in zip(passos, (r > 1, r < altura - 3, q > 1, q < largura - 3)):
+            if ok and dados[k + d] == PAREDE:
+                paredes.append((k, k + d))
+
+    k0 = largura + 1
+    dados[k0] = LIVRE
+    paredes: List[tuple[int, int]] = []
+    fronteira(k0)
+    while paredes:
+        i = randrange(len(paredes))
+        paredes[i], paredes[-1] = paredes[-1], paredes[i]
+        k, n = paredes.pop()
+        if dados[n] == PAREDE:
+            dados[(k + n) >> 1] = LIVRE
+            dados[n] = LIVRE
+            fronteira(n)
+
+
+@registrar_gerador("wilson")
+def wilson(grade, rng) -> None:
+    """Wilson: passeios aleatórios com apagamento de laços (árvore uniforme).
+
+    Cada sala fora do labirinto inicia um passeio aleatório que só guarda a
+    última direção tomada em cada sala; ao encostar no labirinto, o caminho
+    é refeito seguindo essas direções, o que apaga os laços automaticamente.
+    """
+    largura, dados = grade.largura, grade.dados
+    m, n = _salas(largura, grade.altura)
+    total = m * n
+    dentro = bytearray(total)
+    direcao = bytearray(total)
+    deltas = (-m, m, -1, 1)  # cima, baixo, esquerda, direita (em salas)
+    randrange = rng.randrange
+
+    def celula(s: int) -> int:
+        return (2 * (s // m) + 1) * largura + 2 * (s % m) + 1
+
+    raiz = randrange(total)
+    dentro[raiz] = 1
+    dados[celula(raiz)] = LIVRE
+    for inicio in range(total):
+        if dentro[inicio]:
+            continue
+        s = inicio
+        while not dentro[s]:
+            r, q = divmod(s, m)
+            while True:
+                d = randrange(4)
+                if (d == 0 and r > 0) or (d == 1 and r < n - 1) or (d == 2 and q > 0) or (d == 3 and q < m - 1):
+                    break
+            direcao[s] = d
+            s += deltas[d]
+        s = inicio
+        while not dentro[s]:
+            dentro[s] = 1
+            prox = s + deltas[direcao[s]]
+            a, b = celula(s), celula(prox)
+            dados[a] = LIVRE
+            dados[(a + b) >> 1] = LIVRE
+            s = prox
+
+
+def linhas_eller(largura: int, altura: int, rng) -> Iterator[bytes]:
+    """Gera o labirinto linha a linha pelo algoritmo de Eller.
+
+    Só o estado de uma linha de salas fica em memória (O(largura)), então é
+    possível transmitir labirintos arbitrariamente altos sem montar a grade.
+
+    Args:
+        largura: número de colunas da grade (ímpar).
+        altura: número de linhas da grade (ímpar).
+        rng: fonte de aleatoriedade com a API de `random`.
+
+    Yields:
+        Cada linha da grade como `bytes` de tamanho `largura`.
+    """
+    m, n = _salas(largura, altura)
+    random_ = rng.random
+    conjunto = [0] * m          # conjunto de cada sala da linha atual
+    membros: Dict[int, List[int]] = {}
+    proximo = 1
+    parede = bytes([PAREDE]) * largura
+    yield parede
+    for r in range(n):
+        ultima = r == n - 1
+        for q in range(m):
+            if not conjunto[q]:
+                conjunto[q] = proximo
+                membros[proximo] = [q]
+                proximo += 1
+
+        linha = bytearray(parede)
+        for q in range(m):
+            linha[2 * q + 1] = LIVRE
+        # ligações horizontais: sempre entre conjuntos distintos
+        for q in range(m - 1):
+            a, b = conjunto[q], conjunto[q + 1]
+            if a != b and (ultima or random_() < 0.5):
+                linha[2 * q + 2] = LIVRE
+                if len(membros[a]) < len(membros[b]):
+                    a, b = b, a
+                salas_b = membros.pop(b)
+                for s in salas_b:
+                    conjunto[s] = a
+                membros[a].extend(salas_b)
+        yield bytes(linha)
+        if ultima:
+            break
+
+        # ligações verticais: ao menos uma por conjunto
+        baixo = bytearray(parede)
+        novos = [0] * m
+        novos_membros: Dict[int, List[int]] = {}
+        for c, salas in membros.items():
+            descem = [s for s in salas if random_() < 0.5]
+            if not descem:
+                descem = [salas[int(random_() * len(salas))]]
+            for s in descem:
+                baixo[2 * s + 1] = LIVRE
+                novos[s] = c
+            novos_membros[c] = descem
+        conjunto, membros = novos, novos_membros
+        yield bytes(baixo)
+    yield parede
+
+
+@registrar_gerador("eller")
+def eller(grade, rng) -> None:
+    """Eller: preenche a grade com as linhas de `linhas_eller`."""
+    largura, dados = grade.largura, grade.dados
+    for i, linha in enumerate(linhas_eller(largura, grade.altura, rng)):
+        dados[i * largura:(i + 1) * largura] = linha
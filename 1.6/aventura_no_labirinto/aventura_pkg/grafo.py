@@ -0,0 +1,297 @@
+"""
+Grafo comprimido de corredores de um labirinto.
+
+Num labirinto perfeito quase todas as células livres têm exatamente dois
+vizinhos livres: são trechos de corredor. O grafo guarda como nós apenas as
+células "interessantes" — bifurcações, becos sem saída, entrada, saída e
+itens — e como arestas os corredores entre elas, com o comprimento como
+peso. Buscas sobre ele visitam uma fração das células da grade.
+
+O grafo é construído sob demanda por `Labirinto.grafo` e atualizado de forma
+incremental quando um item é coletado (a célula deixa de ser especial e, se
+estiver no meio de um corredor, suas duas arestas viram uma só).
+"""
+from __future__ import annotations
+
+import heapq
+from itertools import compress
+from typing import Dict, List, Optional, Set, Tuple
+
+from .solucionador import _GradePlana
+
+Cell = Tuple[int, int]
+
+PAREDE = ord('#')
+ENTRADA = ord('E')
+SAIDA = ord('S')
+ITEM = ord('*')
+
+# saída de um nó: (nó vizinho, comprimento do corredor, direção de saída,
+# direção pela qual o corredor chega ao vizinho). Cada direção de um nó leva
+# a um único corredor, então (nó, direção) identifica a aresta.
+Aresta = Tuple[int, int, int, int]
+
+
+class GrafoCorredores:
+    """Grafo de nós especiais ligados por corredores.
+
+    Os índices internos são os da grade achatada com moldura de
+    `solucionador._GradePlana`; a API pública recebe e devolve células
+    (linha, coluna).
+
+    Attributes:
+        saidas: para cada nó, a lista de arestas (`Aresta`)
+        especiais: nós marcados como entrada, saída ou item (código ASCII).
+        expandidos: nós retirados da fila de prioridade na última busca.
+    """
+
+    def __init__(self, lab):
+        plana = _GradePlana(lab)
+        self._plana = plana
+        self.livre = plana.livre
+        self.desl = plana.deslocamentos
+        self._direcao = {d: i for i, d in enumerate(plana.deslocamentos)}
+        self.especiais: Dict[int, int] = {}
+        largura, dados = lab.largura, lab.grade.dados
+        for codigo in (ENTRADA, SAIDA, ITEM):
+            k = dados.find(codigo)
+            while k != -1:
+                self.especiais[plana.indice(divmod(k, largura))] = codigo
+                k = dados.find(codigo, k + 1)
+        self.expandidos = 0
+        self.saidas: Dict[int, List[Aresta]] = {}
+        self._construir()
+
+    # ------------------------------------------------------------------ #
+    # construção
+    # ------------------------------------------------------------------ #
+    def _grau(self, k: int) -> int:
+        livre, w = self.livre, self._plana.largura
+        return livre[k - w] + livre[k + w] + livre[k - 1] + livre[k + 1]
+
+    def _construir(self) -> None:
+        livre, saidas = self.livre, self.saidas
+        for k in compress(range(len(livre)), livre):
+            if self._grau(k) != 2:
+                saidas[k] = []
+        for k in self.especiais:
+            saidas.setdefault(k, [])
+        for k, lista in saidas.items():
+            for i, d in enumerate(self.desl):
+                if livre[k + d]:
+                    fim, passos, volta = self._percorrer(k, i)
+                    if fim != k:  # corredor que volta ao próprio nó não ajuda
+                        lista.append((fim, passos, i, volta))
+
+    def _percorrer(self, k: int, i: int, alvo: int = -1) -> Tuple[int, int, int]:
+        """Segue o corredor que sai de `k` pela direção `i`.
+
+        Para no primeiro nó (ou em `alvo`, se aparecer antes; ou de volta em
+        `k`, num laço sem nós) e retorna (célula final, número de passos,
+        direção pela qual o corredor chega à célula final).
+        """
+        livre, desl, saidas = self.livre, self.desl, self.saidas
+        anterior, atual, passos = k, k + desl[i], 1
+        while atual not in saidas and atual != alvo and atual != k:
+            for d in desl:
+                n = atual + d
+                if n != anterior and livre[n]:
+                    break
+            anterior, atual = atual, n
+            passos += 1
+        return atual, passos, self._direcao[anterior - atual]
+
+    def _trecho(self, k: int, i: int, fim: int) -> List[int]:
+        """Células do corredor que sai de `k` pela direção `i` até `fim` (inclusive)."""
+        livre, desl = self.livre, self.desl
+        anterior, atual = k, k + desl[i]
+        trecho = [atual]
+        while atual != fim:
+            for d in desl:
+                n = atual + d
+                if n != anterior and livre[n]:
+                    break
+            anterior, atual = atual, n
+            trecho.append(atual)
+        return trecho
+
+    def _ancoras(self, k: int, alvo: int = -1) -> List[Aresta]:
+        """Liga uma célula de corredor às pontas dele, no formato de `Aresta`."""
+        ancoras = []
+        for i, d in enumerate(self.desl):
+            if self.livre[k + d]:
+                fim, passos, volta = self._percorrer(k, i, alvo)
+                if fim != k:
+                    ancoras.append((fim, passos, i, volta))
+        return ancoras
+
+    # ------------------------------------------------------------------ #
+    # consultas
+    # ------------------------------------------------------------------ #
+    @property
+    def num_nos(self) -> int:
+        return len(self.saidas)
+
+    def nos_especiais(self, codigo: int) -> List[Cell]:
+        """Células marcadas com `codigo` (ENTRADA, SAIDA ou ITEM)."""
+        return [self._plana.celula(k) for k, c in self.especiais.items() if c == codigo]
+
+    def becos(self) -> int:
+        """Número de becos sem saída (células livres com um único vizinho livre)."""
+        return sum(1 for k in self.saidas if self._grau(k) == 1)
+
+    def alcancaveis(self, origem: Cell) -> Set[Cell]:
+        """Nós do grafo alcançáveis a partir de `origem` (inclusive, se for nó)."""
+        k = self._plana.indice(origem)
+        if not self.livre[k]:
+            return set()
+        inicio = [k] if k in self.saidas else [a[0] for a in self._ancoras(k)]
+        visto = set(inicio)
+        pilha = list(inicio)
+        while pilha:
+            for v, *_ in self.saidas[pilha.pop()]:
+                if v not in visto:
+                    visto.add(v)
+                    pilha.append(v)
+        return {self._plana.celula(x) for x in visto}
+
+    def caminho(self, origem: Cell, destino: Cell) -> Optional[List[Cell]]:
+        """Menor caminho entre duas células quaisquer (Dijkstra sobre o grafo).
+
+        Células fora do grafo (no meio de um corredor) são ligadas aos nós das
+        pontas do seu corredor antes da busca.
+        """
+        plana = self._plana
+        o, d = plana.indice(origem), plana.indice(destino)
+        if not (self.livre[o] and self.livre[d]):
+            return None
+        if o == d:
+            return [origem]
+
+        # ponto de partida: o próprio nó ou as pontas do corredor de `o`
+        dist: Dict[int, int] = {}
+        anterior: Dict[int, Tuple[int, int]] = {}
+        fila: List[Tuple[int, int]] = []
+        melhor, fim_melhor = None, None
+        partidas = [(o, 0, -1, -1)] if o in self.saidas else self._ancoras(o, alvo=d)
+        for no, passos, i, _ in partidas:
+            if no == d:  # destino no mesmo corredor
+                if melhor is None or passos < melhor:
+                    melhor, fim_melhor = passos, (o, i)
+                continue
+            if passos < dist.get(no, passos + 1):
+                dist[no] = passos
+                anterior[no] = (o, i)
+                heapq.heappush(fila, (passos, no))
+
+        # chegada: o próprio nó ou as pontas do corredor de `d`
+        chegadas: Dict[int, Tuple[int, int]] = {}
+        pontas = [(d, 0, -1, -1)] if d in self.saidas else self._ancoras(d)
+        for no, passos, i, _ in pontas:
+            if passos < chegadas.get(no, (passos + 1, 0))[0]:
+                chegadas[no] = (passos, i)
+
+        self.expandidos = 0
+        saidas = self.saidas
+        final = None
+        while fila:
+            du, u = heapq.heappop(fila)
+            if melhor is not None and du >= melhor:
+                break
+            if du > dist[u]:
+                continue
+            self.expandidos += 1
+            if u in chegadas:
+                total = du + chegadas[u][0]
+                if melhor is None or total < melhor:
+                    melhor, final = total, u
+                    fim_melhor = None
+            for v, peso, i, _ in saidas[u]:
+                dv = du + peso
+                if dv < dist.get(v, dv + 1):
+                    dist[v] = dv
+                    anterior[v] = (u, i)
+                    heapq.heappush(fila, (dv, v))
+
+        if melhor is None:
+            return None
+        if fim_melhor is not None:
+            trecho = self._trecho(o, fim_melhor[1], d)
+            return [origem] + [plana.celula(x) for x in trecho]
+
+        # reconstrói a sequência de nós e expande cada corredor em células
+        nos = [final]
+        while nos[-1] != o:
+            nos.append(anterior[nos[-1]][0])
+        nos.reverse()
+        passos = [o]
+        for u in nos[1:]:
+            pai, i = anterior[u]
+            passos.extend(self._trecho(pai, i, u))
+        if final != d:
+            _, i = chegadas[final]
+            volta = self._trecho(d, i, final)
+            volta.pop()
+            passos.extend(reversed(volta))
+            passos.append(d)
+        return [plana.celula(x) for x in passos]
+
+    # ------------------------------------------------------------------ #
+    # atualização incremental
+    # ------------------------------------------------------------------ #
+    def atualizar(self, celula: Cell, antes: int, depois: int) -> bool:
+        """Ajusta o grafo à troca de conteúdo de uma célula.
+
+        Trata as trocas que não mudam a passagem (item coletado, item
+        colocado, entrada/saída movidas). Retorna False quando a mudança
+        exige reconstruir o grafo (parede aberta ou fechada).
+        """
+        if (antes == PAREDE) != (depois == PAREDE):
+            return False
+        k = self._plana.indice(celula)
+        especial = depois in (ENTRADA, SAIDA, ITEM)
+        if especial:
+            self.especiais[k] = depois
+            if k not in self.saidas:
+                self._dividir(k)
+            return True
+        self.especiais.pop(k, None)
+        if k in self.saidas and self._grau(k) == 2:
+            self._juntar(k)
+        return True
+
+    def _juntar(self, k: int) -> None:
+        """Remove o nó `k` (grau 2), fundindo suas duas arestas numa só."""
+        arestas = self.saidas.pop(k)
+        if len(arestas) != 2:
+            # laço sobre o próprio nó: as arestas já tinham sido descartadas
+            for v, _, _, volta in arestas:
+                self._trocar(v, volta, None)
+            return
+        (a, pa, _, va), (b, pb, _, vb) = arestas
+        if a == b:
+            self._trocar(a, va, None)
+            self._trocar(b, vb, None)
+            return
+        self._trocar(a, va, (b, pa + pb, va, vb))
+        self._trocar(b, vb, (a, pa + pb, vb, va))
+
+    def _dividir(self, k: int) -> None:
+        """Transforma a célula de corredor `k` em nó, partindo sua aresta em duas."""
+        ancoras = self._ancoras(k)
+        self.saidas[k] = ancoras
+        for no, passos, i, volta in ancoras:
+            self._trocar(no, volta, (k, passos, volta, i))
+
+    def _trocar(self, no: int, direcao: int, aresta: Optional[Aresta]) -> None:
+        """Substitui (ou remove, se `aresta` for None) a aresta de `no` em `direcao`."""
+        lista = self.saidas[no]
+        for pos, atual in enumerate(lista):
+            if atual[2] == direcao:
+                if aresta is None:
+                    del lista[pos]
+                else:
+                    lista[pos] = aresta
+                return
+        if aresta is not None:
+            lista.append(aresta)
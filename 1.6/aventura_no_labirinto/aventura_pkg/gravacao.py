@@ -0,0 +1,316 @@
+"""
+Gravação dos quadros de uma partida para publicação: asciicast v2, HTML e SVG.
+
+O `Gravador` tem o mesmo contrato de desenho dos renderizadores
+(`desenhar(jogador)`) e usa a mesma ideia do `RenderizadorIncremental`: depois
+do primeiro quadro, só a posição antiga e a nova do jogador (e as células
+passadas a `marcar`) podem mudar, então cada quadro guarda apenas as células
+que mudaram em relação ao anterior. Os quadros ficam em arrays compactos
+(instante, índices e códigos), cerca de 35 bytes por quadro em memória.
+`junto` grava ao lado do desenho ao vivo.
+
+Exportação, pela extensão do arquivo (`exportar`):
+
+- `.cast`: asciicast v2 (asciinema). O primeiro evento desenha o labirinto
+  inteiro; os seguintes só reposicionam o cursor nas células alteradas, com os
+  códigos de estilo gerados pelo Rich.
+- `.html`: player autocontido (tocar/pausar, velocidade e busca). As cores
+  vêm dos estilos do Rich convertidos para CSS com um tema de terminal do
+  Rich; os quadros seguem como diferenças e o player redesenha só as linhas
+  alteradas.
+- `.svg`: o último quadro, exportado pelo próprio Rich (`export_svg`).
+
+Só labirintos com tamanho (`Labirinto`) podem ser gravados, não o mundo infinito.
+"""
+from __future__ import annotations
+
+import io
+import json
+import time
+from array import array
+from pathlib import Path
+from typing import Callable, Iterable, Optional, Tuple, Union
+
+from .labirinto import Labirinto
+from .renderizador import ESTILOS, JOGADOR, _estilos_ansi, _linha_ansi
+
+Cell = Tuple[int, int]
+
+FORMATOS = {".cast": "asciicast", ".html": "html", ".svg": "svg"}
+
+
+class Gravador:
+    """Guarda os quadros de uma partida como diferenças por célula.
+
+    Args:
+        lab: labirinto desenhado (o mesmo que o jogador altera).
+        cor: cor do jogador (como nos renderizadores).
+        passo: se informado, o quadro i fica no instante i * passo (útil para
+            exportar uma reprodução sem pausas); senão, vale o relógio.
+    """
+
+    def __init__(self, lab: Labirinto, cor: str = "green", passo: Optional[float] = None):
+        if not hasattr(lab, "altura"):
+            raise ValueError("Só labirintos com tamanho podem ser gravados")
+        self.lab = lab
+        self.cor = cor
+        self.passo = passo
+        self.inicial: Optional[bytes] = None   # tela do primeiro quadro
+        self._tela: Optional[bytearray] = None
+        self._pos: Optional[int] = None
+        self._sujas: set = set()
+        self._t0 = 0.0
+        self.tempos = array('d')               # instante de cada quadro (s)
+        self.fim = array('L')                  # fim das mudanças de cada quadro em indices/codigos
+        self.indices = array('L')
+        self.codigos = bytearray()
+
+    @property
+    def quadros(self) -> int:
+        return len(self.tempos)
+
+    @property
+    def duracao(self) -> float:
+        return self.tempos[-1] if self.tempos else 0.0
+
+    def marcar(self, celulas: Iterable[Cell]) -> None:
+        """Confere as células indicadas no próximo quadro."""
+        largura = self.lab.largura
+        self._sujas.update(r * largura + c for r, c in celulas)
+
+    def desenhar(self, jogador: Optional[Cell] = None) -> int:
+        """Grava um quadro e retorna quantas células mudaram."""
+        lab = self.lab
+        largura = lab.largura
+        k_jogador = -1 if jogador is None else jogador[0] * largura + jogador[1]
+        if self._tela is None:
+            tela = bytearray(lab.grade.dados)
+            if k_jogador >= 0:
+                tela[k_jogador] = JOGADOR
+            self._tela, self.inicial = tela, bytes(tela)
+            self._t0 = time.perf_counter()
+            n = 0
+        else:
+            tela, dados, sujas = self._tela, lab.grade.dados, self._sujas
+            if self._pos is not None:
+                sujas.add(self._pos)
+            if k_jogador >= 0:
+                sujas.add(k_jogador)
+            n = 0
+            for k in sujas:
+                codigo = JOGADOR if k == k_jogador else dados[k]
+                if tela[k] != codigo:
+                    tela[k] = codigo
+                    self.indices.append(k)
+                    self.codigos.append(codigo)
+                    n += 1
+            sujas.clear()
+        self._pos = k_jogador if k_jogador >= 0 else None
+        instante = len(self.tempos) * self.passo if self.passo is not None else time.perf_counter() - self._t0
+        self.tempos.append(instante)
+        self.fim.append(len(self.indices))
+        return n
+
+    def junto(self, desenhar: Callable[[Optional[Cell]], object]) -> Callable[[Optional[Cell]], object]:
+        """Função de desenho que chama `desenhar` (ao vivo) e grava o mesmo quadro."""
+        def ambos(jogador: Optional[Cell] = None):
+            resultado = desenhar(jogador)
+            self.desenhar(jogador)
+            return resultado
+        return ambos
+
+    def mudancas(self, i: int) -> Tuple[array, bytearray]:
+        """Índices e códigos das células alteradas no quadro `i`."""
+        inicio = self.fim[i - 1] if i else 0
+        return self.indices[inicio:self.fim[i]], self.codigos[inicio:self.fim[i]]
+
+    def tela_final(self) -> bytes:
+        return bytes(self._tela) if self._tela is not None else bytes(self.lab.grade.dados)
+
+
+# ---------------------------------------------------------------------- #
+# exportação
+# ---------------------------------------------------------------------- #
+def _console_registro(largura: int, altura: int):
+    from rich.console import Console
+    return Console(file=io.StringIO(), record=True, force_terminal=True, color_system="256",
+                   width=largura, height=altura)
+
+
+def exportar_asciicast(gravador: Gravador, caminho: Union[str, Path], titulo: str = "") -> int:
+    """Grava o asciicast v2 e retorna o tamanho em bytes."""
+    lab = gravador.lab
+    largura, altura = lab.largura, lab.altura
+    estilos = _estilos_ansi(_console_registro(largura, altura + 1), gravador.cor)
+    celula = {codigo: f"{p}{chr(codigo)}{s}" for codigo, (p, s) in estilos.items()}
+    rodape = f"\x1b[{altura + 1};1H"
+    cabecalho = {"version": 2, "width": largura, "height": altura + 1,
+                 "timestamp": int(time.time()), "env": {"TERM": "xterm-256color"}}
+    if titulo:
+        cabecalho["title"] = titulo
+    codificar = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write(codificar(cabecalho) + "\n")
+        inicial = gravador.inicial
+        if inicial is None:
+            return Path(caminho).stat().st_size
+        tela = "\r\n".join(_linha_ansi(inicial[r * largura:(r + 1) * largura], estilos)
+                           for r in range(altura))
+        f.write(codificar([0.0, "o", "\x1b[H\x1b[2J" + tela + "\r\n"]) + "\n")
+        for i in range(1, gravador.quadros):
+            indices, codigos = gravador.mudancas(i)
+            if not indices:
+                continue
+            partes = []
+            for k, codigo in zip(indices, codigos):
+                r, c = divmod(k, largura)
+                partes.append(f"\x1b[{r + 1};{c + 1}H{celula.get(codigo, chr(codigo))}")
+            partes.append(rodape)
+            f.write(codificar([round(gravador.tempos[i], 3), "o", "".join(partes)]) + "\n")
+    return Path(caminho).stat().st_size
+
+
+_PLAYER = """<!DOCTYPE html>
+<html lang="pt-br"><head><meta charset="utf-8"><title>__TITULO__</title>
+<style>
+body { background: __FUNDO__; color: __TEXTO__; font-family: monospace; }
+pre { font-size: 14px; line-height: 1.15; margin: 8px 0; }
+#controles { display: flex; gap: 8px; align-items: center; }
+#tempo { flex: 1; max-width: 600px; }
+__CLASSES__
+</style></head><body>
+<pre id="tela"></pre>
+<div id="controles">
+  <button id="tocar">&#9654;</button>
+  <input id="tempo" type="range" min="0" step="1" value="0">
+  <span id="relogio"></span>
+  <select id="velocidade"><option>0.5</option><option selected>1</option><option>2</option><option>4</option><option>8</option></select>
+</div>
+<script>
+const D = __DADOS__;
+const W = D.largura, H = D.altura, total = D.tempos.length ? D.tempos[D.tempos.length - 1] : 0;
+const pre = document.getElementById("tela"), barra = document.getElementById("tempo");
+const botao = document.getElementById("tocar"), relogio = document.getElementById("relogio");
+const linhas = [];
+for (let r = 0; r < H; r++) {
+  const e = document.createElement("span");
+  pre.appendChild(e); pre.appendChild(document.createTextNode("\\n")); linhas.push(e);
+}
+barra.max = total;
+let tela, proximo, sujas, t = 0, tocando = false, ultimo = 0;
+function reiniciar() {
+  tela = Uint8Array.from(D.inicial, ch => ch.charCodeAt(0));
+  proximo = 0; sujas = new Set(linhas.keys());
+}
+function aplicar(ate) {
+  while (proximo < D.tempos.length && D.tempos[proximo] <= ate) {
+    for (let j = proximo ? D.fim[proximo - 1] : 0; j < D.fim[proximo]; j++) {
+      tela[D.k[j]] = D.c[j]; sujas.add((D.k[j] / W) | 0);
+    }
+    proximo++;
+  }
+}
+function linha(r) {
+  let html = "", j = r * W;
+  const fim = j + W;
+  while (j < fim) {
+    const c = tela[j]; let f = j;
+    while (f < fim && tela[f] === c) f++;
+    const txt = String.fromCharCode(c).repeat(f - j).replace(/&/g, "&amp;").replace(/</g, "&lt;");
+    html += D.classes[c] ? `<span class="${D.classes[c]}">${txt}</span>` : txt;
+    j = f;
+  }
+  return html;
+}
+function desenhar() {
+  for (const r of sujas) linhas[r].innerHTML = linha(r);
+  sujas.clear();
+  barra.value = t;
+  relogio.textContent = (t / 1000).toFixed(1) + " / " + (total / 1000).toFixed(1) + " s";
+}
+function irPara(alvo) {
+  if (proximo > 0 && alvo < D.tempos[proximo - 1]) reiniciar();
+  t = alvo; aplicar(t); desenhar();
+}
+function quadro(agora) {
+  if (tocando) {
+    t = Math.min(total, t + (agora - ultimo) * parseFloat(document.getElementById("velocidade").value));
+    aplicar(t); desenhar();
+    if (t >= total) { tocando = false; botao.innerHTML = "&#9654;"; }
+  }
+  ultimo = agora;
+  requestAnimationFrame(quadro);
+}
+botao.onclick = () => {
+  if (!tocando && t >= total) irPara(0);
+  tocando = !tocando; botao.innerHTML = tocando ? "&#10074;&#10074;" : "&#9654;";
+};
+barra.oninput = () => irPara(parseFloat(barra.value));
+reiniciar(); aplicar(0); desenhar(); requestAnimationFrame(quadro);
+</script></body></html>
+"""
+
+
+def exportar_html(gravador: Gravador, caminho: Union[str, Path], titulo: str = "Aventura no Labirinto") -> int:
+    """Grava o player HTML autocontido e retorna o tamanho em bytes."""
+    from rich.style import Style
+    from rich.terminal_theme import MONOKAI
+    lab = gravador.lab
+    estilos = dict(ESTILOS)
+    estilos[JOGADOR] = f"bold {gravador.cor}"
+    classes = {codigo: f"c{codigo}" for codigo in estilos}
+    css = "\n".join(f".c{codigo} {{ {Style.parse(estilo).get_html_style(MONOKAI)} }}"
+                    for codigo, estilo in estilos.items())
+    dados = {
+        "largura": lab.largura,
+        "altura": lab.altura,
+        "inicial": (gravador.inicial or gravador.tela_final()).decode("latin-1"),
+        "tempos": [round(t * 1000) for t in gravador.tempos],
+        "fim": list(gravador.fim),
+        "k": list(gravador.indices),
+        "c": list(gravador.codigos),
+        "classes": classes,
+    }
+    html = (_PLAYER.replace("__TITULO__", titulo.replace("&", "&amp;").replace("<", "&lt;"))
+            .replace("__FUNDO__", MONOKAI.background_color.hex)
+            .replace("__TEXTO__", MONOKAI.foreground_color.hex)
+            .replace("__CLASSES__", css)
+            .replace("__DADOS__", json.dumps(dados, separators=(",", ":")).replace("</", "<\\/")))
+    Path(caminho).write_text(html, encoding="utf-8")
+    return len(html.encode("utf-8"))
+
+
+def exportar_svg(gravador: Gravador, caminho: Union[str, Path], titulo: str = "Aventura no Labirinto") -> int:
+    """Grava o último quadro como SVG (pelo `export_svg` do Rich) e retorna o tamanho em bytes."""
+    from rich.text import Text
+    lab = gravador.lab
+    tela = gravador.tela_final()
+    console = _console_registro(lab.largura, lab.altura)
+    texto = Text()
+    for r in range(lab.altura):
+        for codigo in tela[r * lab.largura:(r + 1) * lab.largura]:
+            estilo = f"bold {gravador.cor}" if codigo == JOGADOR else ESTILOS.get(codigo)
+            texto.append(chr(codigo), style=estilo)
+        texto.append("\n")
+    console.print(texto, end="")
+    svg = console.export_svg(title=titulo)
+    Path(caminho).write_text(svg, encoding="utf-8")
+    return len(svg.encode("utf-8"))
+
+
+def exportar(gravador: Gravador, caminho: Union[str, Path], titulo: str = "Aventura no Labirinto") -> int:
+    """Exporta pelo formato da extensão (.cast, .html ou .svg) e retorna o tamanho em bytes.
+
+    Raises:
+        ValueError: se a extensão não for conhecida.
+    """
+    formato = FORMATOS.get(Path(caminho).suffix.lower())
+    match formato:
+        case "asciicast":
+            return exportar_asciicast(gravador, caminho, titulo)
+        case "html":
+            return exportar_html(gravador, caminho, titulo)
+        case "svg":
+            return exportar_svg(gravador, caminho, titulo)
+        case _:
+            raise ValueError(f"Extensão desconhecida: {caminho}. Opções: {', '.join(FORMATOS)}")
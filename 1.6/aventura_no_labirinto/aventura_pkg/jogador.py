@@ -1,21 +1,16 @@
 
 """
 Módulo de controle do jogador e pontuação.
+
+A leitura do teclado fica em `entrada` (uma fonte persistente por partida).
 """
 from __future__ import annotations
 from dataclasses import dataclass
-from typing import Tuple, Optional, Callable, Set
+from typing import Tuple
 
-try:
-    from pynput import keyboard
-except Exception:  # pragma: no cover
-    keyboard = None  # permite testes sem a dependência instalada
+from .solucionador import dica
 
-try:
-    from rich.console import Console
-    console = Console()
-except Exception:  # pragma: no cover
-    console = None
+from .terminal import imprimir
 
 Cell = Tuple[int, int]
 
@@ -48,63 +43,20 @@ def pontuar(j: Jogador, evento: str) -> None:
         case _:
             pass
 
-def mover(lab, jogador: Jogador, on_tick: Optional[Callable[[], None]] = None) -> Optional[str]:
-    """
-    Lê o teclado e move o jogador no labirinto.
-    Retorna "sair" se o usuário pressionar ESC. Usa pynput, com fallback WASD por input().
-    """
-    if keyboard is None:
-        # Fallback simples para ambientes sem pynput
-        if console:
-            console.print("[dim]Controles: W/A/S/D ou Q para sair[/]")
-        else:
-            print("Controles: W/A/S/D ou Q para sair")
-        escolha = input("-> ").strip().lower()
-        mapping = {'w': (-1, 0), 's': (1, 0), 'a': (0, -1), 'd': (0, 1), 'q': None}
-        delta = mapping.get(escolha)
-        if delta is None:
-            return "sair"
-        if delta:
-            _tentar_mover(lab, jogador, delta)
-        if on_tick: on_tick()
-        return None
-
-    # Com pynput: listener por uma tecla
-    pressed = {"done": False, "cmd": None}
-    def on_press(key):
-        try:
-            k = key.char.lower()
-        except AttributeError:
-            k = str(key)
-        mapping = {
-            'w': (-1, 0), 's': (1, 0), 'a': (0, -1), 'd': (0, 1),
-            'Key.up': (-1, 0), 'Key.down': (1, 0), 'Key.left': (0, -1), 'Key.right': (0, 1),
-            'q': None, 'Key.esc': None
-        }
-        if k in mapping:
-            delta = mapping[k]
-            if delta is None:
-                pressed["done"] = True
-                pressed["cmd"] = "sair"
-                return False
-            _tentar_mover(lab, jogador, delta)
-            pressed["done"] = True
-            return False
+_NOMES_DIRECAO = {(-1, 0): "cima", (1, 0): "baixo", (0, -1): "esquerda", (0, 1): "direita"}
 
-    with keyboard.Listener(on_press=on_press) as listener:
-        listener.join()
-    if on_tick: on_tick()
-    return pressed["cmd"]
+def mostrar_dica(lab, jogador: Jogador) -> None:
+    """Mostra a direção do próximo passo rumo à saída (via grafo de corredores)."""
+    delta = dica(lab, jogador.pos) if lab.saida is not None else None
+    texto = f"Dica: vá para {_NOMES_DIRECAO[delta]}" if delta else "Sem dica disponível"
+    imprimir(f"[italic blue]{texto}[/]", texto)
 
 def _tentar_mover(lab, jogador: Jogador, delta: Tuple[int,int]) -> None:
     """Aplica o deslocamento se a célula alvo for válida."""
     r, c = jogador.pos
     dr, dc = delta
     nr, nc = r + dr, c + dc
-    if not (0 <= nr < lab.altura and 0 <= nc < lab.largura):
-        pontuar(jogador, "bater_parede")
-        return
-    alvo = lab.grade[nr][nc]
+    alvo = lab.celula(nr, nc)  # fora do labirinto conta como parede
     if alvo == '#':
         pontuar(jogador, "bater_parede")
         return
@@ -113,6 +65,6 @@ def _tentar_mover(lab, jogador: Jogador, delta: Tuple[int,int]) -> None:
     pontuar(jogador, "andar")
     if alvo == '*':
         pontuar(jogador, "coletar")
-        lab.grade[nr][nc] = ' '
+        lab.definir(nr, nc, ' ')
     if alvo == 'S':
         pontuar(jogador, "chegar_saida")
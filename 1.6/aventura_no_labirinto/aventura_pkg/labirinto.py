@@ -1,27 +1,158 @@
-
 """
 Módulo de geração e impressão de labirintos.
 
 Contém funções para criar um labirinto aleatório, imprimir em terminal com Rich
-e resolver o labirinto de forma recursiva (busca em profundidade).
+e resolvê-lo (menor caminho, via módulo `solucionador`).
+
+O algoritmo de geração é escolhido por nome no registro `GERADORES` (veja o
+módulo `geradores`): backtracking, kruskal, prim, wilson ou eller.
+
+A grade é guardada num buffer compacto de um byte por célula (`Grade`), o que
+permite gerar labirintos com milhares de células de lado sem estourar a pilha
+de recursão nem a memória.
 """
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import List, Tuple, Optional, Dict, Set
+from dataclasses import dataclass, field
+from array import array
+from itertools import compress
+from typing import List, Tuple, Optional, Set, Iterator, Union, Callable
 import random
 
-try:
-    # impressão bonita (opcional em testes)
-    from rich.console import Console
-    from rich.table import Table
-    from rich.text import Text
-    console = Console()
-except Exception:  # pragma: no cover
-    console = None  # fallback silencioso
+from .geradores import GERADORES, obter_gerador
+from .solucionador import resolver
+from .grafo import GrafoCorredores
+
+from .terminal import obter_console
+from .perfil import cronometrado
 
 Cell = Tuple[int, int]
 
+# Códigos (ASCII) usados no buffer da grade
+PAREDE = ord('#')
+LIVRE = ord(' ')
+ENTRADA = ord('E')
+SAIDA = ord('S')
+ITEM = ord('*')
+
+# tabela para `bytes.translate`: 1 nas células livres, 0 no resto
+_SO_LIVRES = bytes(1 if b == LIVRE else 0 for b in range(256))
+
+# sementes cabem em 64 bits com sinal: é o campo dos formatos .lab e .ses
+SEMENTE_MIN = -2**63
+SEMENTE_MAX = 2**63 - 1
+
+
+class _LinhaGrade:
+    """Visão de uma linha da `Grade`, para manter a API `grade[i][j]`."""
+    __slots__ = ("_grade", "_base")
+
+    def __init__(self, grade: "Grade", i: int):
+        self._grade = grade
+        self._base = i * grade.largura
+
+    def __len__(self) -> int:
+        return self._grade.largura
+
+    def _indice(self, j: int) -> int:
+        largura = self._grade.largura
+        if j < 0:
+            j += largura
+        if not 0 <= j < largura:
+            raise IndexError("coluna fora da grade")
+        return self._base + j
+
+    def __getitem__(self, j: Union[int, slice]) -> Union[str, List[str]]:
+        if isinstance(j, slice):
+            return list(str(self))[j]
+        return chr(self._grade.ler(self._indice(j)))
+
+    def __setitem__(self, j: int, ch: str) -> None:
+        self._grade.escrever(self._indice(j), ord(ch))
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(str(self))
+
+    def __str__(self) -> str:
+        return self._grade.linha(self._base // self._grade.largura)
+
+
+class Grade:
+    """Grade retangular compacta: um byte (código ASCII) por célula.
+
+    As células ficam em ordem de linha num único `bytearray`, de modo que a
+    célula (i, j) está no índice `i * largura + j`. Indexar `grade[i]` devolve
+    uma visão da linha, então `grade[i][j]` e `grade[i][j] = ' '` continuam
+    funcionando como na antiga lista de listas.
+
+    Attributes:
+        largura: número de colunas.
+        altura: número de linhas.
+        dados: buffer com os códigos das células.
+        observador: função `(indice, antes, depois)` chamada a cada escrita
+            por `grade[i][j] = ch` (ou `escrever`) que muda a célula; escritas
+            diretas em `dados` não são observadas.
+    """
+    __slots__ = ("largura", "altura", "dados", "observador")
+
+    def __init__(self, largura: int, altura: int, dados: Optional[bytearray] = None):
+        self.largura = largura
+        self.altura = altura
+        self.dados = dados if dados is not None else bytearray(bytes([PAREDE])) * (largura * altura)
+        self.observador: Optional[Callable[[int, int, int], None]] = None
+
+    @classmethod
+    def de_listas(cls, linhas: List[List[str]]) -> "Grade":
+        """Cria a grade a partir de uma lista de listas de caracteres."""
+        altura = len(linhas)
+        largura = len(linhas[0]) if linhas else 0
+        dados = bytearray("".join("".join(l) for l in linhas), "ascii")
+        return cls(largura, altura, dados)
+
+    def __len__(self) -> int:
+        return self.altura
+
+    def __getitem__(self, i: int) -> _LinhaGrade:
+        if i < 0:
+            i += self.altura
+        if not 0 <= i < self.altura:
+            raise IndexError("linha fora da grade")
+        return _LinhaGrade(self, i)
+
+    def __iter__(self) -> Iterator[_LinhaGrade]:
+        return (_LinhaGrade(self, i) for i in range(self.altura))
+
+    def ler(self, k: int) -> int:
+        """Código da célula de índice linear `k`."""
+        return self.dados[k]
+
+    def escrever(self, k: int, codigo: int) -> None:
+        """Grava `codigo` na célula `k`, avisando o observador se ela mudar."""
+        dados = self.dados
+        antes = dados[k]
+        dados[k] = codigo
+        if self.observador is not None and antes != codigo:
+            self.observador(k, antes, codigo)
+
+    def linha(self, i: int) -> str:
+        """Retorna a linha `i` como string."""
+        base = i * self.largura
+        return self.dados[base:base + self.largura].decode("ascii")
+
+    def trecho(self, i: int, a: int, b: int) -> bytes:
+        """Códigos das colunas [a, b) da linha `i` (sem decodificar a linha inteira)."""
+        base = i * self.largura
+        return bytes(self.dados[base + a:base + b])
+
+    def para_listas(self) -> List[List[str]]:
+        """Converte para lista de listas de caracteres."""
+        return [list(self.linha(i)) for i in range(self.altura)]
+
+    def copiar(self) -> "Grade":
+        """Retorna uma cópia independente da grade."""
+        return Grade(self.largura, self.altura, bytearray(self.dados))
+
+
 @dataclass
 class Labirinto:
     """Representa um labirinto retangular com paredes e espaços vazios.
@@ -36,93 +167,145 @@ class Labirinto:
     Attributes:
         largura: número de colunas.
         altura: número de linhas.
-        grade: lista de listas de caracteres.
+        grade: grade compacta (`Grade`); aceita lista de listas na construção.
         entrada: coordenada (linha, coluna) da entrada.
         saida: coordenada (linha, coluna) da saída.
-        itens: conjunto de coordenadas com itens.
+        itens: conjunto de coordenadas com itens (atualizado quando a grade muda).
+        semente: semente usada na geração (None se não informada).
+        algoritmo: nome do algoritmo de geração usado.
     """
     largura: int
     altura: int
-    grade: List[List[str]]
+    grade: Grade
     entrada: Cell
     saida: Cell
     itens: Set[Cell]
+    semente: Optional[int] = None
+    algoritmo: str = "backtracking"
+    _grafo: Optional[GrafoCorredores] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not isinstance(self.grade, Grade):
+            self.grade = Grade.de_listas(self.grade)
+        self.grade.observador = self._celula_alterada
+
+    @property
+    def grafo(self) -> GrafoCorredores:
+        """Grafo de corredores (construído na primeira consulta e mantido em cache)."""
+        if self._grafo is None:
+            self._grafo = GrafoCorredores(self)
+        return self._grafo
 
-def _vizinhos(c: Cell, largura: int, altura: int, passo: int = 2) -> List[Cell]:
-    """Retorna vizinhos candidatos para o algoritmo de labirinto (saltando em `passo`)."""
-    r, q = c
-    cand = [(r-2, q), (r+2, q), (r, q-2), (r, q+2)]
-    return [(i, j) for i, j in cand if 0 < i < altura-1 and 0 < j < largura-1]
+    # Acesso por coordenadas, comum a `Labirinto` e `mundo.MundoInfinito`: o
+    # jogador e os renderizadores de janela usam só estes três métodos.
+    def celula(self, r: int, c: int) -> str:
+        """Caractere da célula (r, c); fora da grade conta como parede."""
+        if 0 <= r < self.altura and 0 <= c < self.largura:
+            return chr(self.grade.ler(r * self.largura + c))
+        return '#'
 
-def criar_labirinto(largura: int, altura: int, sementes: Optional[int] = None, itens: int = 3) -> Labirinto:
-    """Gera um labirinto aleatório usando DFS recursivo para cavar túneis.
+    def definir(self, r: int, c: int, ch: str) -> None:
+        """Grava `ch` na célula (r, c)."""
+        self.grade.escrever(r * self.largura + c, ord(ch))
+
+    def trecho(self, r: int, c0: int, c1: int) -> bytes:
+        """Códigos das células (r, c0) a (r, c1 - 1); fora da grade vira parede."""
+        if not 0 <= r < self.altura:
+            return bytes([PAREDE]) * (c1 - c0)
+        a, b = max(c0, 0), min(c1, self.largura)
+        meio = self.grade.trecho(r, a, b) if a < b else b""
+        return bytes([PAREDE]) * (min(a, c1) - c0) + meio + bytes([PAREDE]) * (c1 - max(b, c0))
+
+    def _celula_alterada(self, k: int, antes: int, depois: int) -> None:
+        """Mantém `itens` e o grafo em dia quando uma célula da grade muda."""
+        celula = divmod(k, self.largura)
+        if antes == ITEM:
+            self.itens.discard(celula)
+        if depois == ITEM:
+            self.itens.add(celula)
+        if self._grafo is not None and not self._grafo.atualizar(celula, antes, depois):
+            self._grafo = None
+
+
+def validar_semente(semente: Optional[int]) -> None:
+    """Confere se a semente cabe nos formatos binários (inteiro de 64 bits com sinal).
+
+    Raises:
+        ValueError: se estiver fora de [SEMENTE_MIN, SEMENTE_MAX].
+    """
+    if semente is not None and not SEMENTE_MIN <= semente <= SEMENTE_MAX:
+        raise ValueError(f"Semente fora do intervalo [{SEMENTE_MIN}, {SEMENTE_MAX}]: {semente}")
+
+
+@cronometrado("gerar")
+def criar_labirinto(largura: int, altura: int, sementes: Optional[int] = None, itens: int = 3,
+                    algoritmo: str = "backtracking") -> Labirinto:
+    """Gera um labirinto aleatório com o algoritmo escolhido no registro.
+
+    O padrão é o backtracking (DFS) com pilha explícita, então não há limite
+    de tamanho imposto pela recursão.
 
     Args:
         largura: número de colunas (min 7, ímpar recomendado).
         altura: número de linhas (min 7, ímpar recomendado).
         sementes: semente do gerador de aleatoriedade para reprodutibilidade.
+            Cada labirinto usa sua própria instância de `random.Random`, sem
+            alterar o estado global do módulo `random`.
         itens: quantidade de itens colecionáveis a espalhar no labirinto.
+        algoritmo: nome do gerador em `GERADORES`.
+
+    Raises:
+        ValueError: se `algoritmo` não estiver registrado ou se a semente não
+            couber em 64 bits (veja `validar_semente`).
     """
-    if sementes is not None:
-        random.seed(sementes)
+    validar_semente(sementes)
+    gerar = obter_gerador(algoritmo)
+    rng = random.Random(sementes)
     largura = max(largura, 7)
     altura = max(altura, 7)
     if largura % 2 == 0: largura += 1
     if altura % 2 == 0: altura += 1
 
-    grade = [['#' for _ in range(largura)] for _ in range(altura)]
-
-    # Algoritmo: DFS recursivo cavando de 2 em 2 células
-    def cavar(c: Cell):
-        r, q = c
-        grade[r][q] = ' '
-        viz = _vizinhos(c, largura, altura)
-        random.shuffle(viz)
-        for nr, nq in viz:
-            if grade[nr][nq] == '#':
-                # remove parede intermediária
-                mr, mq = (r + nr)//2, (q + nq)//2
-                grade[mr][mq] = ' '
-                cavar((nr, nq))
-
-    # Início do carving
-    start = (1, 1)
-    cavar(start)
+    grade = Grade(largura, altura)
+
+    # Cava os túneis (salas nas coordenadas ímpares)
+    gerar(grade, rng)
 
     # Define entrada e saída em bordas opostas
     entrada = (1, 1)
     saida = (altura-2, largura-2)
-    grade[entrada[0]][entrada[1]] = 'E'
-    grade[saida[0]][saida[1]] = 'S'
+    dados = grade.dados
+    dados[entrada[0] * largura + entrada[1]] = ENTRADA
+    dados[saida[0] * largura + saida[1]] = SAIDA
 
-    # Espalhar itens em células vazias
-    livres = [(i, j) for i in range(1, altura-1) for j in range(1, largura-1) if grade[i][j] == ' ']
-    random.shuffle(livres)
+    # Espalhar itens em células vazias (índices lineares, em ordem de linha)
+    livres = array('q', compress(range(len(dados)), dados.translate(_SO_LIVRES)))
+    rng.shuffle(livres)
     itens_pos = set()
-    for k in range(min(itens, len(livres))):
-        i, j = livres[k]
-        grade[i][j] = '*'
-        itens_pos.add((i, j))
+    for k in livres[:itens]:
+        dados[k] = ITEM
+        itens_pos.add(divmod(k, largura))
 
-    return Labirinto(largura, altura, grade, entrada, saida, itens_pos)
+    return Labirinto(largura, altura, grade, entrada, saida, itens_pos, sementes, algoritmo)
 
 def imprimir_labirinto(lab: Labirinto, jogador: Optional[Cell] = None, cor: str = "green") -> None:
     """Imprime o labirinto no terminal. Se `jogador` for informado, marca a posição com '@'."""
+    console = obter_console()
     if console is None:
         # fallback: print simples
         for i in range(lab.altura):
-            linha = "".join(lab.grade[i])
+            linha = lab.grade.linha(i)
             if jogador and i == jogador[0]:
                 j = jogador[1]
                 linha = linha[:j] + '@' + linha[j+1:]
             print(linha)
         return
 
+    from rich.table import Table
     table = Table(show_header=False, show_lines=False, pad_edge=False, expand=False)
     for i in range(lab.altura):
         linha = ""
-        for j in range(lab.largura):
-            ch = lab.grade[i][j]
+        for j, ch in enumerate(lab.grade.linha(i)):
             if jogador and (i, j) == jogador:
                 linha += f"[bold {cor}]@[/]"
             elif ch == '#':
@@ -139,42 +322,14 @@ def imprimir_labirinto(lab: Labirinto, jogador: Optional[Cell] = None, cor: str
     console.print(table)
 
 def resolver_recursivo(lab: Labirinto, origem: Optional[Cell] = None, destino: Optional[Cell] = None) -> Optional[List[Cell]]:
-    """Resolve o labirinto via DFS recursivo e retorna uma lista de passos (células).
+    """Resolve o labirinto e retorna uma lista de passos (células).
+
+    Mantida por compatibilidade: antes era um DFS recursivo, que devolvia um
+    caminho qualquer e estourava a pilha em labirintos grandes. Agora delega
+    para a BFS iterativa de `solucionador`, que encontra o menor caminho e
+    não altera `lab.grade`.
 
     A busca considera movimentos em 4 direções. Retorna a sequência de células
     desde a origem até o destino (inclusivos), ou None se não houver caminho.
     """
-    if origem is None:
-        origem = lab.entrada
-    if destino is None:
-        destino = lab.saida
-
-    visitado: Set[Cell] = set()
-    caminho: List[Cell] = []
-
-    def dfs(c: Cell) -> bool:
-        if c in visitado:
-            return False
-        visitado.add(c)
-        caminho.append(c)
-        if c == destino:
-            return True
-        r, q = c
-        for nr, nq in [(r-1,q), (r+1,q), (r,q-1), (r,q+1)]:
-            if 0 <= nr < lab.altura and 0 <= nq < lab.largura:
-                ch = lab.grade[nr][nq]
-                if ch in (' ', 'S', '*'):
-                    if dfs((nr, nq)):
-                        return True
-        caminho.pop()
-        return False
-
-    # trata 'E' como espaço
-    er, eq = origem
-    if lab.grade[er][eq] == 'E':
-        lab.grade[er][eq] = ' '
-
-    achou = dfs(origem)
-    # restaura 'E'
-    lab.grade[er][eq] = 'E'
-    return caminho if achou else None
+    return resolver(lab, origem, destino, metodo="bfs")
@@ -0,0 +1,120 @@
+"""
+Modo em lote: gera e resolve muitos labirintos sem interface.
+
+Feito para ajuste de níveis: cada semente vira um labirinto, que é resolvido e
+resumido em estatísticas (comprimento do caminho, becos sem saída, itens
+alcançáveis, tempos de geração e solução). As sementes são divididas em
+blocos contíguos e distribuídas entre processos com `ProcessPoolExecutor`;
+os resultados chegam em ordem e podem ser gravados em CSV ou JSON Lines à
+medida que ficam prontos.
+
+Nada aqui imprime com Rich.
+"""
+from __future__ import annotations
+
+import csv
+import json
+import os
+import time
+from dataclasses import dataclass, asdict, fields
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from .labirinto import criar_labirinto
+from .solucionador import resolver
+
+FORMATOS = ("jsonl", "csv")
+
+
+@dataclass
+class Estatisticas:
+    """Resumo de um labirinto gerado e resolvido no modo em lote."""
+    semente: int
+    algoritmo: str
+    largura: int
+    altura: int
+    caminho: int               # células no menor caminho E -> S (0 se não houver)
+    becos: int                 # células livres com um único vizinho livre
+    itens: int                 # itens espalhados
+    itens_alcancaveis: int     # itens alcançáveis a partir da entrada
+    t_geracao: float           # segundos
+    t_solucao: float           # segundos
+
+
+def simular(semente: int, largura: int, altura: int, itens: int = 5,
+            algoritmo: str = "backtracking", metodo: str = "bfs") -> Estatisticas:
+    """Gera e resolve um labirinto, retornando suas estatísticas."""
+    t0 = time.perf_counter()
+    lab = criar_labirinto(largura, altura, sementes=semente, itens=itens, algoritmo=algoritmo)
+    t1 = time.perf_counter()
+    caminho = resolver(lab, metodo=metodo)
+    t2 = time.perf_counter()
+
+    # becos e itens alcançáveis saem do grafo de corredores
+    grafo = lab.grafo
+    alcancaveis = len(lab.itens & grafo.alcancaveis(lab.entrada))
+
+    return Estatisticas(semente, algoritmo, lab.largura, lab.altura,
+                        len(caminho) if caminho else 0, grafo.becos(), len(lab.itens),
+                        alcancaveis, t1 - t0, t2 - t1)
+
+
+def _simular_bloco(tarefa: Tuple[int, int, int, int, int, str, str]) -> List[Estatisticas]:
+    """Simula as sementes [inicio, fim). Função de módulo para ser serializável."""
+    inicio, fim, largura, altura, itens, algoritmo, metodo = tarefa
+    return [simular(s, largura, altura, itens, algoritmo, metodo) for s in range(inicio, fim)]
+
+
+def simular_lote(quantidade: int, largura: int, altura: int, itens: int = 5,
+                 algoritmo: str = "backtracking", metodo: str = "bfs",
+                 semente_inicial: int = 0, workers: Optional[int] = None,
+                 tamanho_bloco: Optional[int] = None) -> Iterator[Estatisticas]:
+    """Simula `quantidade` labirintos com sementes consecutivas.
+
+    Args:
+        quantidade: número de labirintos.
+        largura, altura, itens, algoritmo: parâmetros de `criar_labirinto`.
+        metodo: solucionador usado (veja `solucionador.SOLUCIONADORES`).
+        semente_inicial: primeira semente; as demais são consecutivas.
+        workers: processos em paralelo (padrão: número de CPUs; 1 = sem pool).
+        tamanho_bloco: sementes por tarefa enviada a um processo. O padrão
+            gera umas 8 tarefas por processo, equilibrando carga e custo de IPC.
+
+    Yields:
+        `Estatisticas` de cada labirinto, na ordem das sementes.
+    """
+    workers = workers or os.cpu_count() or 1
+    if tamanho_bloco is None:
+        tamanho_bloco = max(1, min(1000, quantidade // (workers * 8)))
+    fim = semente_inicial + quantidade
+    tarefas = [(s, min(s + tamanho_bloco, fim), largura, altura, itens, algoritmo, metodo)
+               for s in range(semente_inicial, fim, tamanho_bloco)]
+    if workers == 1:
+        for tarefa in tarefas:
+            yield from _simular_bloco(tarefa)
+        return
+    from concurrent.futures import ProcessPoolExecutor  # só quando há processos
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for bloco in executor.map(_simular_bloco, tarefas):
+            yield from bloco
+
+
+def gravar(estatisticas: Iterable[Estatisticas], arquivo: TextIO, formato: str = "jsonl") -> int:
+    """Grava as estatísticas em `arquivo` (CSV ou JSON Lines) e retorna quantas foram gravadas.
+
+    Raises:
+        ValueError: se o formato não for suportado.
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"Formato desconhecido: {formato!r}. Opções: {', '.join(FORMATOS)}")
+    n = 0
+    if formato == "csv":
+        escritor = csv.DictWriter(arquivo, fieldnames=[f.name for f in fields(Estatisticas)])
+        escritor.writeheader()
+        for e in estatisticas:
+            escritor.writerow(asdict(e))
+            n += 1
+    else:
+        for e in estatisticas:
+            arquivo.write(json.dumps(asdict(e)) + "\n")
+            n += 1
+    return n
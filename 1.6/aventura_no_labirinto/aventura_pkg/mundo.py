@@ -0,0 +1,260 @@
+"""
+Mundo infinito: labirinto dividido em blocos (chunks) gerados sob demanda.
+
+O mundo não tem borda nem saída. Ele é dividido em blocos de `tam` x `tam`
+células; o bloco (by, bx) cobre as linhas `by*tam .. by*tam + tam - 1` e as
+colunas correspondentes (coordenadas negativas valem). Cada bloco é um
+labirinto perfeito gerado por um algoritmo de `GERADORES` com um
+`random.Random` próprio, semeado por (semente do mundo, by, bx): o mesmo
+bloco sai sempre igual, então pode ser descartado e gerado de novo.
+
+Cada bloco é dono da sua primeira linha e da sua primeira coluna, que são as
+paredes de fronteira com os vizinhos de cima e da esquerda. As aberturas
+nessas fronteiras são sorteadas por um gerador semeado pela própria
+fronteira, de modo que os dois lados sempre concordam. Como cada bloco é
+conexo e toda fronteira tem pelo menos uma abertura, o mundo inteiro é
+conexo.
+
+Memória: os blocos ficam num LRU limitado a `max_blocos`. Um bloco alterado
+(item coletado) que sai do LRU é gravado em `diretorio`, se houver; sem
+diretório, guarda-se só o conjunto de células alteradas, que cresce com os
+itens coletados e não com a distância percorrida. Os arquivos levam no nome
+a versão do formato e tudo o que muda o conteúdo do bloco (semente,
+algoritmo, lado e itens por bloco), e os de uma partida anterior com a mesma
+configuração são apagados quando o mundo é criado: o estado em disco vale só
+para uma partida.
+
+Quadros: `preparar` enfileira os blocos em volta do jogador e `tique` gera os
+pendentes dentro de um orçamento de tempo, para ser chamado a cada quadro
+(`gerar_em_segundo_plano` faz isso dentro do laço asyncio). Um bloco só é
+gerado fora desse orçamento se o jogador chegar nele antes da fila
+(`stats.gerados_na_hora`).
+
+A API de acesso (`celula`, `definir`, `trecho`) é a mesma de `Labirinto`,
+então `jogador._tentar_mover` funciona nos dois.
+"""
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, asdict
+from pathlib import Path
+from typing import Deque, Dict, Optional, Set, Tuple, Union
+
+from .labirinto import Grade, LIVRE, ENTRADA, ITEM
+from .geradores import obter_gerador
+from .perfil import cronometrado
+
+Cell = Tuple[int, int]
+Bloco = Tuple[int, int]
+
+TAM_BLOCO = 32
+VERSAO_BLOCO = 1   # muda quando a geração ou o formato dos blocos em disco mudar
+
+
+@dataclass
+class EstatisticasMundo:
+    """Contadores do mundo."""
+    gerados: int = 0
+    gerados_na_hora: int = 0    # gerados fora do orçamento (o jogador chegou antes da fila)
+    lidos_disco: int = 0
+    despejos: int = 0
+
+
+class MundoInfinito:
+    """Mundo sem fim gerado em blocos, com LRU de blocos e disco opcional.
+
+    Args:
+        semente: semente do mundo (padrão: sorteada).
+        algoritmo: gerador usado dentro de cada bloco.
+        itens_por_bloco: itens espalhados em cada bloco.
+        max_blocos: blocos mantidos em memória.
+        diretorio: se informado, blocos alterados despejados do LRU são gravados ali.
+        tam: lado do bloco (par, para as salas ficarem nas coordenadas ímpares).
+
+    Raises:
+        ValueError: se `tam` for ímpar ou menor que 4.
+    """
+
+    def __init__(self, semente: Optional[int] = None, algoritmo: str = "backtracking",
+                 itens_por_bloco: int = 2, max_blocos: int = 64,
+                 diretorio: Optional[Union[str, Path]] = None, tam: int = TAM_BLOCO):
+        if tam % 2 or tam < 4:
+            raise ValueError("O lado do bloco precisa ser par e pelo menos 4")
+        self.semente = semente if semente is not None else random.randrange(2**31)
+        self.algoritmo = algoritmo
+        self._gerar_bloco = obter_gerador(algoritmo)
+        self.itens_por_bloco = itens_por_bloco
+        self.max_blocos = max_blocos
+        self.tam = tam
+        self.diretorio = Path(diretorio) if diretorio is not None else None
+        if self.diretorio is not None:
+            self.diretorio.mkdir(parents=True, exist_ok=True)
+            # itens coletados numa partida anterior não valem para esta
+            for velho in self.diretorio.glob(f"{self._prefixo()}_*.bloco"):
+                velho.unlink(missing_ok=True)
+        self.entrada: Cell = (1, 1)
+        self.saida: Optional[Cell] = None  # mundo sem saída
+        self._blocos: "OrderedDict[Bloco, bytearray]" = OrderedDict()
+        self._alterados: Dict[Bloco, Dict[int, int]] = {}   # células alteradas por bloco
+        self._pendentes: Deque[Bloco] = deque()
+        self._na_fila: Set[Bloco] = set()
+        self.stats = EstatisticasMundo()
+
+    # ------------------------------------------------------------------ #
+    # geração
+    # ------------------------------------------------------------------ #
+    def _rng(self, *chave) -> random.Random:
+        # sementes em texto são embaralhadas com SHA-512: estáveis entre execuções
+        return random.Random(":".join(map(str, (self.semente,) + chave)))
+
+    @cronometrado("gerar")
+    def gerar(self, bloco: Bloco) -> bytearray:
+        """Gera o bloco do zero (função pura da semente do mundo e da posição)."""
+        by, bx = bloco
+        tam = self.tam
+        # o gerador precisa de moldura dos dois lados: gera (tam+1)² e descarta
+        # a última linha e a última coluna, que pertencem aos vizinhos
+        grade = Grade(tam + 1, tam + 1)
+        rng = self._rng(by, bx)
+        self._gerar_bloco(grade, rng)
+        dados = bytearray().join(grade.dados[i * (tam + 1):i * (tam + 1) + tam] for i in range(tam))
+        # aberturas nas fronteiras de cima (linha 0) e da esquerda (coluna 0)
+        impares = range(1, tam, 2)
+        for j in self._rng("h", by, bx).sample(impares, 1 + (tam >= 16)):
+            dados[j] = LIVRE
+        for i in self._rng("v", by, bx).sample(impares, 1 + (tam >= 16)):
+            dados[i * tam] = LIVRE
+        # itens nas salas livres (fora da posição inicial do jogador)
+        livres = [k for k in range(tam * tam) if dados[k] == LIVRE and k % tam and k >= tam]
+        if bloco == (0, 0):
+            livres.remove(tam + 1)
+            dados[tam + 1] = ENTRADA
+        for k in rng.sample(livres, min(self.itens_por_bloco, len(livres))):
+            dados[k] = ITEM
+        return dados
+
+    def _prefixo(self) -> str:
+        return (f"v{VERSAO_BLOCO}_{self.semente}_{self.algoritmo}_t{self.tam}"
+                f"_i{self.itens_por_bloco}")
+
+    def _arquivo(self, bloco: Bloco) -> Path:
+        return self.diretorio / f"{self._prefixo()}_{bloco[0]}_{bloco[1]}.bloco"
+
+    def _carregar(self, bloco: Bloco) -> bytearray:
+        """Bloco do disco (se foi despejado alterado) ou gerado de novo."""
+        if self.diretorio is not None:
+            arquivo = self._arquivo(bloco)
+            if arquivo.exists():
+                self.stats.lidos_disco += 1
+                return bytearray(arquivo.read_bytes())
+        dados = self.gerar(bloco)
+        self.stats.gerados += 1
+        for k, codigo in self._alterados.get(bloco, {}).items():
+            dados[k] = codigo
+        return dados
+
+    def _guardar(self, bloco: Bloco, dados: bytearray) -> None:
+        self._blocos[bloco] = dados
+        while len(self._blocos) > self.max_blocos:
+            velho, vdados = self._blocos.popitem(last=False)
+            self.stats.despejos += 1
+            if self.diretorio is not None and velho in self._alterados:
+                self._arquivo(velho).write_bytes(vdados)
+                del self._alterados[velho]
+
+    def _bloco(self, bloco: Bloco) -> bytearray:
+        dados = self._blocos.get(bloco)
+        if dados is not None:
+            self._blocos.move_to_end(bloco)
+            return dados
+        self.stats.gerados_na_hora += 1
+        dados = self._carregar(bloco)
+        self._guardar(bloco, dados)
+        return dados
+
+    # ------------------------------------------------------------------ #
+    # acesso por coordenadas (mesma API de Labirinto)
+    # ------------------------------------------------------------------ #
+    def celula(self, r: int, c: int) -> str:
+        """Caractere da célula (r, c) do mundo."""
+        by, i = divmod(r, self.tam)
+        bx, j = divmod(c, self.tam)
+        return chr(self._bloco((by, bx))[i * self.tam + j])
+
+    def definir(self, r: int, c: int, ch: str) -> None:
+        """Grava `ch` na célula (r, c); a alteração sobrevive ao despejo do bloco."""
+        by, i = divmod(r, self.tam)
+        bx, j = divmod(c, self.tam)
+        k = i * self.tam + j
+        self._bloco((by, bx))[k] = ord(ch)
+        self._alterados.setdefault((by, bx), {})[k] = ord(ch)
+
+    def trecho(self, r: int, c0: int, c1: int) -> bytes:
+        """Códigos das células (r, c0) a (r, c1 - 1), atravessando blocos."""
+        tam = self.tam
+        by, i = divmod(r, tam)
+        partes = []
+        c = c0
+        while c < c1:
+            bx, j = divmod(c, tam)
+            fim = min(tam, j + c1 - c)
+            base = i * tam
+            partes.append(self._bloco((by, bx))[base + j:base + fim])
+            c += fim - j
+        return b"".join(partes)
+
+    # ------------------------------------------------------------------ #
+    # pré-geração
+    # ------------------------------------------------------------------ #
+    def preparar(self, pos: Cell, raio: int = 1) -> None:
+        """Enfileira os blocos até `raio` blocos de distância de `pos` que faltam na memória.
+
+        O raio é limitado para que os blocos em volta caibam no LRU.
+        """
+        lado = int(self.max_blocos ** 0.5)
+        raio = max(0, min(raio, (lado - 1) // 2))
+        by, bx = pos[0] // self.tam, pos[1] // self.tam
+        # do mais perto para o mais longe
+        vizinhos = sorted(((by + dy, bx + dx) for dy in range(-raio, raio + 1)
+                           for dx in range(-raio, raio + 1)),
+                          key=lambda b: abs(b[0] - by) + abs(b[1] - bx))
+        for bloco in vizinhos:
+            if bloco in self._blocos:
+                self._blocos.move_to_end(bloco)
+            elif bloco not in self._na_fila:
+                self._na_fila.add(bloco)
+                self._pendentes.append(bloco)
+
+    def tique(self, orcamento: float = 0.002) -> int:
+        """Gera blocos pendentes por até `orcamento` segundos; retorna quantos gerou."""
+        fim = time.perf_counter() + orcamento
+        n = 0
+        while self._pendentes and time.perf_counter() < fim:
+            bloco = self._pendentes.popleft()
+            self._na_fila.discard(bloco)
+            if bloco not in self._blocos:
+                self._guardar(bloco, self._carregar(bloco))
+                n += 1
+        return n
+
+    def estatisticas(self) -> Dict[str, int]:
+        """Contadores do mundo e blocos em memória."""
+        return dict(asdict(self.stats), em_memoria=len(self._blocos), pendentes=len(self._pendentes))
+
+    def __len__(self) -> int:
+        return len(self._blocos)
+
+
+async def gerar_em_segundo_plano(mundo: MundoInfinito, jogador, raio: int = 1,
+                                 fps: float = 60.0, orcamento: float = 0.002) -> None:
+    """Laço asyncio que, a cada tique, enfileira os blocos em volta do jogador e gera alguns.
+
+    Rode como tarefa ao lado de `entrada.jogar` e cancele-a no fim da partida.
+    """
+    while True:
+        mundo.preparar(jogador.pos, raio)
+        mundo.tique(orcamento)
+        await asyncio.sleep(1.0 / fps)
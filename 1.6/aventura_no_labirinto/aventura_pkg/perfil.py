@@ -0,0 +1,224 @@
+"""
+Instrumentação leve dos caminhos quentes: tempos e contadores por fase.
+
+Fases medidas no pacote:
+
+- "gerar": `criar_labirinto`.
+- "resolver": `solucionador.resolver` (e quem delega a ele, como `resolver_recursivo`).
+- "render": `desenhar` dos renderizadores (incremental, câmera e Rich).
+- "entrada": espera por tecla no laço assíncrono de `entrada.jogar`.
+- "espera": pausas de animação, de reprodução e do tique do laço de jogo.
+
+O contador "bytes" soma o que os renderizadores escrevem no terminal.
+
+Desligada (o padrão), a instrumentação custa um teste de variável global por
+chamada: `cronometrado` chama a função direto, `medir` devolve um gerenciador
+de contexto vazio e compartilhado e `contar` retorna na primeira linha.
+Ligada (`ativar` ou `sessao`), cada medição guarda a duração na sua fase,
+para os percentis de `resumo`. Com `linha_do_tempo=True`, guarda também o
+início, para `gravar_trace`, que usa o formato de eventos do Chrome e abre em
+chrome://tracing ou no Perfetto.
+
+No modo em lote, só o processo principal é medido (use `--workers 1`).
+"""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+from array import array
+from contextlib import contextmanager, nullcontext
+from functools import wraps
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+
+from .terminal import obter_console
+
+_ativo = False
+_linha_do_tempo = False
+_duracoes: Dict[str, array] = {}      # fase -> durações em ns
+_contadores: Dict[str, int] = {}
+_eventos: List[tuple] = []            # ("X", fase, início, duração, thread) ou ("C", nome, instante, total, 0)
+_t0 = time.perf_counter_ns()
+_NULO = nullcontext()
+
+
+def ativar(linha_do_tempo: bool = False) -> None:
+    """Liga a instrumentação, descartando medições anteriores."""
+    global _ativo, _linha_do_tempo, _t0
+    limpar()
+    _t0 = time.perf_counter_ns()
+    _linha_do_tempo = linha_do_tempo
+    _ativo = True
+
+
+def desativar() -> None:
+    """Desliga a instrumentação (as medições feitas continuam disponíveis)."""
+    global _ativo
+    _ativo = False
+
+
+def ativo() -> bool:
+    return _ativo
+
+
+def limpar() -> None:
+    """Descarta medições, contadores e a linha do tempo."""
+    _duracoes.clear()
+    _contadores.clear()
+    _eventos.clear()
+
+
+def _registrar(fase: str, inicio: int, fim: int) -> None:
+    duracoes = _duracoes.get(fase)
+    if duracoes is None:
+        duracoes = _duracoes[fase] = array('q')
+    duracoes.append(fim - inicio)
+    if _linha_do_tempo:
+        _eventos.append(("X", fase, inicio, fim - inicio, threading.get_ident()))
+
+
+class _Medicao:
+    """Gerenciador de contexto que mede o bloco na fase dada."""
+    __slots__ = ("fase", "inicio")
+
+    def __init__(self, fase: str):
+        self.fase = fase
+
+    def __enter__(self):
+        self.inicio = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, *exc) -> bool:
+        _registrar(self.fase, self.inicio, time.perf_counter_ns())
+        return False
+
+
+def medir(fase: str):
+    """`with medir("fase"):` mede o bloco (não faz nada com a instrumentação desligada)."""
+    return _Medicao(fase) if _ativo else _NULO
+
+
+def cronometrado(fase: str):
+    """Decorador: mede cada chamada da função na fase dada."""
+    def decorador(funcao):
+        @wraps(funcao)
+        def envolvida(*args, **kwargs):
+            if not _ativo:
+                return funcao(*args, **kwargs)
+            inicio = time.perf_counter_ns()
+            try:
+                return funcao(*args, **kwargs)
+            finally:
+                _registrar(fase, inicio, time.perf_counter_ns())
+        return envolvida
+    return decorador
+
+
+def contar(nome: str, n: int = 1) -> None:
+    """Soma `n` ao contador `nome`."""
+    if not _ativo:
+        return
+    total = _contadores[nome] = _contadores.get(nome, 0) + n
+    if _linha_do_tempo:
+        _eventos.append(("C", nome, time.perf_counter_ns(), total, 0))
+
+
+def _percentil(ordenados: List[int], p: float) -> int:
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+def resumo() -> List[Dict[str, Union[str, int, float]]]:
+    """Uma linha por fase: chamadas, total e percentis 50/95/99 e máximo, em ms."""
+    linhas = []
+    for fase, duracoes in sorted(_duracoes.items(), key=lambda item: -sum(item[1])):
+        ordenados = sorted(duracoes)
+        linhas.append({
+            "fase": fase,
+            "n": len(ordenados),
+            "total_ms": sum(ordenados) / 1e6,
+            "p50_ms": _percentil(ordenados, 50) / 1e6,
+            "p95_ms": _percentil(ordenados, 95) / 1e6,
+            "p99_ms": _percentil(ordenados, 99) / 1e6,
+            "max_ms": ordenados[-1] / 1e6,
+        })
+    return linhas
+
+
+def contadores() -> Dict[str, int]:
+    return dict(_contadores)
+
+
+def imprimir_resumo(arquivo=None) -> None:
+    """Mostra o resumo por fase e os contadores em `arquivo` (padrão: saída de erro).
+
+    Usa uma tabela do Rich, se disponível. A saída de erro não se mistura com
+    a saída do jogo nem com a do modo em lote.
+    """
+    arquivo = arquivo if arquivo is not None else sys.stderr
+    linhas = resumo()
+    colunas = ["fase", "n", "total_ms", "p50_ms", "p95_ms", "p99_ms", "max_ms"]
+    if obter_console():
+        from rich.console import Console
+        from rich.table import Table
+        console = Console(file=arquivo)
+        tabela = Table(title="Perfil (ms)")
+        for coluna in colunas:
+            tabela.add_column(coluna.removesuffix("_ms"), justify="left" if coluna == "fase" else "right")
+        for linha in linhas:
+            tabela.add_row(linha["fase"], str(linha["n"]),
+                           *(f"{linha[c]:.3f}" for c in colunas[2:]))
+        console.print(tabela)
+    else:
+        print(" | ".join(f"{c:>10}" for c in colunas), file=arquivo)
+        for linha in linhas:
+            print(" | ".join(f"{linha[c]:>10}" if c in ("fase", "n") else f"{linha[c]:10.3f}"
+                             for c in colunas), file=arquivo)
+    for nome, total in sorted(_contadores.items()):
+        print(f"{nome}: {total}", file=arquivo)
+
+
+def gravar_trace(caminho: Union[str, Path]) -> int:
+    """Grava a linha do tempo no formato de eventos do Chrome e retorna o número de eventos."""
+    pid = os.getpid()
+    eventos = []
+    for tipo, nome, instante, valor, tid in _eventos:
+        ts = (instante - _t0) / 1000  # o formato usa microssegundos
+        if tipo == "X":
+            eventos.append({"name": nome, "ph": "X", "ts": ts, "dur": valor / 1000, "pid": pid, "tid": tid})
+        else:
+            eventos.append({"name": nome, "ph": "C", "ts": ts, "pid": pid, "args": {nome: valor}})
+    with open(caminho, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": eventos, "displayTimeUnit": "ms"}, f)
+    return len(eventos)
+
+
+@contextmanager
+def sessao(diretorio: Optional[Union[str, Path]] = None):
+    """Liga a instrumentação durante o bloco e, no fim, imprime o resumo na saída de erro.
+
+    Com `diretorio`, roda também o cProfile e grava `sessao-<data>-<pid>.pstats`
+    e `.trace.json` nele (um par de arquivos por execução).
+    """
+    ativar(linha_do_tempo=diretorio is not None)
+    perfilador = None
+    if diretorio is not None:
+        import cProfile
+        perfilador = cProfile.Profile()
+        perfilador.enable()
+    try:
+        yield
+    finally:
+        if perfilador is not None:
+            perfilador.disable()
+        desativar()
+        imprimir_resumo()
+        if diretorio is not None:
+            pasta = Path(diretorio)
+            pasta.mkdir(parents=True, exist_ok=True)
+            base = pasta / time.strftime(f"sessao-%Y%m%d-%H%M%S-{os.getpid()}")
+            perfilador.dump_stats(f"{base}.pstats")
+            n = gravar_trace(f"{base}.trace.json")
+            print(f"perfil: {base}.pstats, {base}.trace.json ({n} eventos)", file=sys.stderr)
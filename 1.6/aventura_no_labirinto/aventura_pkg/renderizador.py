@@ -0,0 +1,456 @@
+"""
+Renderizador incremental do labirinto para o terminal.
+
+`imprimir_labirinto` monta e imprime o labirinto inteiro a cada quadro. Aqui o
+labirinto é desenhado uma única vez; nos quadros seguintes só as células que
+mudaram (posição antiga e nova do jogador, itens coletados, células marcadas
+com `marcar`) são reescritas, com endereçamento de cursor ANSI. Os códigos de
+estilo de cada tipo de célula são gerados pelo Rich uma vez e reaproveitados.
+
+Quando a saída não é um terminal (ou o labirinto não cabe na tela), o
+renderizador recai em `imprimir_labirinto`.
+
+Para labirintos maiores que o terminal (ou o mundo infinito de `mundo`), a
+`Camera` desenha só a janela em volta do jogador, com margens de rolagem,
+cache de fatias de linha e um minimapa opcional; `renderizador_para` escolhe
+entre os dois. `imprimir_janela` é a versão simples, sem estado.
+"""
+from __future__ import annotations
+
+from itertools import groupby
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+from .labirinto import Labirinto, imprimir_labirinto, PAREDE
+
+from .terminal import obter_console
+from .perfil import cronometrado, contar
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rich.console import Console
+
+Cell = Tuple[int, int]
+
+JOGADOR = ord('@')
+
+# mesmos estilos de `imprimir_labirinto`
+ESTILOS = {
+    ord('#'): "grey74",
+    ord('*'): "yellow",
+    ord('E'): "cyan",
+    ord('S'): "magenta",
+}
+
+
+def _prefixo_sufixo(saida: "Console", ch: str, estilo: str) -> Tuple[str, str]:
+    """Códigos ANSI que o Rich emite antes e depois de `ch` com `estilo`."""
+    from rich.text import Text
+    with saida.capture() as cap:
+        saida.print(Text(ch, style=estilo), end="")
+    ansi = cap.get()
+    i = ansi.index(ch)
+    return ansi[:i], ansi[i + 1:]
+
+
+def _estilos_ansi(saida: "Console", cor: str) -> Dict[int, Tuple[str, str]]:
+    """Prefixo e sufixo ANSI de cada tipo de célula e do jogador."""
+    estilos = {codigo: _prefixo_sufixo(saida, chr(codigo), estilo) for codigo, estilo in ESTILOS.items()}
+    estilos[JOGADOR] = _prefixo_sufixo(saida, '@', f"bold {cor}")
+    return estilos
+
+
+def _linha_ansi(linha: bytes, estilos: Dict[int, Tuple[str, str]]) -> str:
+    """Linha com os estilos aplicados, agrupando células vizinhas de mesmo tipo."""
+    partes = []
+    for codigo, grupo in groupby(linha):
+        prefixo, sufixo = estilos.get(codigo, ("", ""))
+        partes.append(prefixo + chr(codigo) * len(list(grupo)) + sufixo)
+    return "".join(partes)
+
+
+def _imprimir_linhas(linhas: Iterable[bytes], cor: str) -> None:
+    """Imprime linhas de códigos pelo Rich (ou texto puro, sem Rich)."""
+    console = obter_console()
+    if console is None:
+        print("\n".join(bytes(l).decode("ascii") for l in linhas))
+        return
+    from rich.text import Text
+    texto = Text()
+    for linha in linhas:
+        for codigo, grupo in groupby(linha):
+            estilo = f"bold {cor}" if codigo == JOGADOR else ESTILOS.get(codigo)
+            texto.append(chr(codigo) * len(list(grupo)), style=estilo)
+        texto.append("\n")
+    console.print(texto, end="")
+
+
+class RenderizadorIncremental:
+    """Desenha o labirinto uma vez e depois só as células alteradas.
+
+    Attributes:
+        quadros: quadros desenhados.
+        bytes_escritos: total de bytes enviados ao terminal.
+        bytes_ultimo_quadro: bytes enviados no último quadro.
+    """
+
+    def __init__(self, lab: Labirinto, cor: str = "green", saida: Optional["Console"] = None):
+        self.lab = lab
+        self.cor = cor
+        self.console = saida if saida is not None else obter_console()
+        self._tela: Optional[bytearray] = None  # o que está desenhado agora
+        self._pos: Optional[Cell] = None
+        self._sujas: Set[int] = set()
+        self.quadros = 0
+        self.bytes_escritos = 0
+        self.bytes_ultimo_quadro = 0
+        self._estilos = _estilos_ansi(self.console, cor) if self.console is not None else {}
+
+    @property
+    def incremental(self) -> bool:
+        """True se dá para endereçar o cursor (terminal e labirinto cabe na tela)."""
+        c = self.console
+        return (c is not None and c.is_terminal and self.lab.altura < c.size.height
+                and self.lab.largura <= c.size.width)
+
+    def marcar(self, celulas: Iterable[Cell]) -> None:
+        """Força o redesenho das células indicadas no próximo quadro."""
+        largura = self.lab.largura
+        self._sujas.update(r * largura + c for r, c in celulas)
+
+    def invalidar(self) -> None:
+        """Descarta o que está na tela: o próximo quadro redesenha tudo."""
+        self._tela = None
+
+    def _celula(self, codigo: int) -> str:
+        prefixo, sufixo = self._estilos.get(codigo, ("", ""))
+        return f"{prefixo}{chr(codigo)}{sufixo}"
+
+    def _quadro_completo(self, tela: bytearray) -> str:
+        """Tela inteira, agrupando células vizinhas de mesmo tipo num só estilo."""
+        largura = self.lab.largura
+        partes = ["\x1b[H\x1b[2J"]
+        for i in range(self.lab.altura):
+            partes.append(_linha_ansi(tela[i * largura:(i + 1) * largura], self._estilos))
+            partes.append("\r\n")
+        return "".join(partes)
+
+    @cronometrado("render")
+    def desenhar(self, jogador: Optional[Cell] = None) -> int:
+        """Desenha um quadro e retorna o número de bytes escritos."""
+        lab = self.lab
+        if not self.incremental:
+            imprimir_labirinto(lab, jogador, cor=self.cor)
+            self._tela = None   # se o terminal voltar a caber, redesenha tudo
+            self.quadros += 1
+            return 0
+
+        largura = lab.largura
+        dados = lab.grade.dados
+        if self._tela is None:
+            tela = bytearray(dados)
+            if jogador is not None:
+                tela[jogador[0] * largura + jogador[1]] = JOGADOR
+            saida = self._quadro_completo(tela)
+            self._tela = tela
+        else:
+            tela = self._tela
+            sujas = self._sujas
+            if self._pos is not None:
+                sujas.add(self._pos[0] * largura + self._pos[1])
+            k_jogador = -1
+            if jogador is not None:
+                k_jogador = jogador[0] * largura + jogador[1]
+                sujas.add(k_jogador)
+            partes = []
+            for k in sorted(sujas):
+                codigo = JOGADOR if k == k_jogador else dados[k]
+                if tela[k] != codigo:
+                    tela[k] = codigo
+                    r, c = divmod(k, largura)
+                    partes.append(f"\x1b[{r + 1};{c + 1}H{self._celula(codigo)}")
+            saida = "".join(partes)
+        self._sujas.clear()
+        self._pos = jogador
+        # deixa o cursor logo abaixo do labirinto, limpando mensagens antigas
+        saida += f"\x1b[{lab.altura + 1};1H\x1b[J"
+        arquivo = self.console.file
+        arquivo.write(saida)
+        arquivo.flush()
+        n = len(saida.encode("utf-8"))
+        self.quadros += 1
+        self.bytes_escritos += n
+        self.bytes_ultimo_quadro = n
+        contar("bytes", n)
+        return n
+
+
+def imprimir_janela(fonte, centro: Cell, altura: int, largura: int, cor: str = "green") -> None:
+    """Imprime só a janela `altura` x `largura` centrada em `centro`, com o jogador nela.
+
+    `fonte` é qualquer objeto com `trecho(r, c0, c1)` — um `Labirinto` ou um
+    `mundo.MundoInfinito` —, então o custo depende do tamanho da janela, não
+    do labirinto.
+    """
+    r0 = centro[0] - altura // 2
+    c0 = centro[1] - largura // 2
+    linhas = []
+    for r in range(r0, r0 + altura):
+        linha = bytearray(fonte.trecho(r, c0, c0 + largura))
+        if r == centro[0]:
+            linha[centro[1] - c0] = JOGADOR
+        linhas.append(linha)
+    _imprimir_linhas(linhas, cor)
+
+
+
+# tons do minimapa, do mais livre ao mais cheio de paredes (ASCII, como o resto da tela)
+_TONS = " .:=%"
+
+
+class Minimapa:
+    """Miniatura do labirinto: cada caractere resume um retângulo de células.
+
+    O tom é a fração de paredes no retângulo, estimada com algumas linhas de
+    amostra por retângulo (lidas com `trecho`), então montar o minimapa custa
+    O(altura x largura do labirinto / passo vertical), feito uma vez. Itens,
+    saída e jogador são marcados por cima a cada quadro. Num
+    `MundoInfinito` (sem tamanho) a miniatura cobre `alcance` células em
+    volta do centro e é refeita quando o jogador sai do trecho coberto.
+
+    Args:
+        fonte: `Labirinto` ou `MundoInfinito`.
+        altura, largura: tamanho do minimapa em caracteres.
+        amostras: linhas lidas por retângulo.
+        alcance: lado da área coberta no mundo infinito.
+    """
+
+    def __init__(self, fonte, altura: int = 10, largura: int = 24, amostras: int = 3,
+                 alcance: int = 512):
+        self.fonte = fonte
+        self.altura = altura
+        self.largura = largura
+        self.amostras = amostras
+        self.alcance = alcance
+        self._origem: Optional[Cell] = None
+        self._linhas: List[str] = []
+        self._passo = (1.0, 1.0)
+
+    def _area(self, centro: Cell) -> Tuple[int, int, int, int]:
+        """(linha0, coluna0, altura, largura) da área coberta."""
+        fonte = self.fonte
+        if getattr(fonte, "saida", None) is not None:  # labirinto finito
+            return 0, 0, fonte.altura, fonte.largura
+        lado = self.alcance
+        return centro[0] - lado // 2, centro[1] - lado // 2, lado, lado
+
+    def _montar(self, r0: int, c0: int, altura: int, largura: int) -> None:
+        ph, pw = altura / self.altura, largura / self.largura
+        cortes = [c0 + int(j * pw) for j in range(self.largura + 1)]
+        linhas = []
+        for i in range(self.altura):
+            topo = r0 + int(i * ph)
+            passo = max(1, int(ph) // self.amostras)
+            amostra = range(topo, max(topo + 1, r0 + int((i + 1) * ph)), passo)
+            paredes = [0] * self.largura
+            total = [0] * self.largura
+            for r in list(amostra)[:self.amostras]:
+                trecho = self.fonte.trecho(r, cortes[0], cortes[-1])
+                for j in range(self.largura):
+                    a, b = cortes[j] - cortes[0], cortes[j + 1] - cortes[0]
+                    paredes[j] += trecho.count(PAREDE, a, max(b, a + 1))
+                    total[j] += max(b - a, 1)
+            linhas.append("".join(_TONS[min(len(_TONS) - 1, round(p / t * (len(_TONS) - 1)))]
+                                  for p, t in zip(paredes, total)))
+        self._linhas = linhas
+        self._passo = (ph, pw)
+
+    def linhas(self, jogador: Cell) -> List[str]:
+        """Linhas do minimapa com '@' na posição do jogador."""
+        r0, c0, altura, largura = self._area(jogador)
+        if self._origem is None or (getattr(self.fonte, "saida", None) is None and (
+                abs(jogador[0] - self._origem[0] - altura // 2) > altura // 4 or
+                abs(jogador[1] - self._origem[1] - largura // 2) > largura // 4)):
+            self._montar(r0, c0, altura, largura)
+            self._origem = (r0, c0)
+        linhas = [list(l) for l in self._linhas]
+        marcas = [(jogador, "@")]
+        if getattr(self.fonte, "saida", None) is not None:
+            marcas = [(c, "*") for c in self.fonte.itens] + [(self.fonte.saida, "S")] + marcas
+        for celula, ch in marcas:
+            i, j = self._posicao(celula)
+            linhas[i][j] = ch
+        return ["".join(l) for l in linhas]
+
+    def _posicao(self, celula: Cell) -> Tuple[int, int]:
+        """Caractere do minimapa que cobre `celula`."""
+        r0, c0 = self._origem
+        ph, pw = self._passo
+        i = min(self.altura - 1, max(0, int((celula[0] - r0) / ph)))
+        j = min(self.largura - 1, max(0, int((celula[1] - c0) / pw)))
+        return i, j
+
+
+class Camera:
+    """Desenha só a janela do labirinto em volta do jogador, do tamanho do terminal.
+
+    A câmera só rola quando o jogador chega a `margem` células da borda da
+    janela. As linhas visíveis ficam num cache de fatias (`trecho`) da
+    posição atual da câmera: um quadro sem rolagem relê só as linhas do
+    jogador e as marcadas; rolar na vertical lê só as linhas novas. Na tela,
+    só as linhas que mudaram são reescritas. O custo por quadro é O(janela),
+    qualquer que seja o tamanho do labirinto — e `fonte` pode ser um
+    `Labirinto` ou um `mundo.MundoInfinito`.
+
+    Attributes:
+        quadros, bytes_escritos, bytes_ultimo_quadro: como em `RenderizadorIncremental`.
+        linhas_lidas: fatias lidas da fonte (custo de leitura).
+    """
+
+    def __init__(self, fonte, altura: Optional[int] = None, largura: Optional[int] = None,
+                 margem: int = 5, cor: str = "green", saida: Optional["Console"] = None,
+                 minimapa: bool = False):
+        self.fonte = fonte
+        self.cor = cor
+        self.console = saida if saida is not None else obter_console()
+        tela_h, tela_w = (self.console.size.height, self.console.size.width) if self.console else (24, 80)
+        self.altura = altura or max(3, tela_h - 2)  # deixa linhas para mensagens
+        self.largura = largura or max(3, tela_w)
+        self.margem = max(0, min(margem, (min(self.altura, self.largura) - 1) // 2))
+        self.minimapa = Minimapa(fonte, min(10, self.altura // 3), min(24, self.largura // 3)) \
+            if minimapa else None
+        self._estilos = _estilos_ansi(self.console, cor) if self.console is not None else {}
+        self.origem: Optional[Cell] = None        # canto superior esquerdo da janela
+        self._cache: Dict[int, bytes] = {}        # linha do mundo -> fatia visível
+        self._tela: List[Optional[bytes]] = []    # o que está desenhado em cada linha
+        self._sujas: Set[int] = set()
+        self._pos: Optional[Cell] = None
+        self.quadros = 0
+        self.bytes_escritos = 0
+        self.bytes_ultimo_quadro = 0
+        self.linhas_lidas = 0
+
+    @property
+    def incremental(self) -> bool:
+        """True se dá para endereçar o cursor (a saída é um terminal)."""
+        return self.console is not None and self.console.is_terminal
+
+    def seguir(self, pos: Cell) -> bool:
+        """Ajusta a janela para manter `pos` longe das bordas; True se a câmera rolou."""
+        r, c = pos
+        if self.origem is None:
+            self.origem = self._limitar(r - self.altura // 2, c - self.largura // 2)
+            return True
+        r0, c0 = self.origem
+        m = self.margem
+        if r < r0 + m:
+            r0 = r - m
+        elif r > r0 + self.altura - 1 - m:
+            r0 = r - self.altura + 1 + m
+        if c < c0 + m:
+            c0 = c - m
+        elif c > c0 + self.largura - 1 - m:
+            c0 = c - self.largura + 1 + m
+        r0, c0 = self._limitar(r0, c0)
+        if (r0, c0) == self.origem:
+            return False
+        if c0 != self.origem[1]:
+            self._cache.clear()  # rolagem horizontal: todas as fatias mudam
+        self.origem = (r0, c0)
+        return True
+
+    def _limitar(self, r0: int, c0: int) -> Cell:
+        """Num labirinto finito maior que a janela, não mostra além das bordas."""
+        fonte = self.fonte
+        if getattr(fonte, "saida", None) is None:  # mundo infinito
+            return r0, c0
+        if fonte.altura > self.altura:
+            r0 = min(max(r0, 0), fonte.altura - self.altura)
+        if fonte.largura > self.largura:
+            c0 = min(max(c0, 0), fonte.largura - self.largura)
+        return r0, c0
+
+    def marcar(self, celulas: Iterable[Cell]) -> None:
+        """Força a releitura das linhas das células indicadas no próximo quadro."""
+        self._sujas.update(r for r, _ in celulas)
+
+    def invalidar(self) -> None:
+        """Descarta cache e tela: o próximo quadro relê e redesenha tudo."""
+        self._cache.clear()
+        self._tela = []
+
+    def _linha(self, r: int) -> bytes:
+        fatia = self._cache.get(r)
+        if fatia is None:
+            c0 = self.origem[1]
+            fatia = self.fonte.trecho(r, c0, c0 + self.largura)
+            self._cache[r] = fatia
+            self.linhas_lidas += 1
+        return fatia
+
+    def _quadro(self, jogador: Optional[Cell]) -> List[bytes]:
+        """Linhas visíveis, com jogador e minimapa sobrepostos."""
+        r0, c0 = self.origem
+        # o jogador pode ter coletado itens: relê as linhas antiga e nova dele
+        for r in self._sujas | {p[0] for p in (self._pos, jogador) if p is not None}:
+            self._cache.pop(r, None)
+        self._sujas.clear()
+        visiveis = range(r0, r0 + self.altura)
+        for r in [r for r in self._cache if r not in visiveis]:
+            del self._cache[r]
+        linhas = [self._linha(r) for r in visiveis]
+        if jogador is not None:
+            i, j = jogador[0] - r0, jogador[1] - c0
+            if 0 <= i < self.altura and 0 <= j < self.largura:
+                linha = bytearray(linhas[i])
+                linha[j] = JOGADOR
+                linhas[i] = bytes(linha)
+        if self.minimapa is not None and jogador is not None:
+            mini = self.minimapa.linhas(jogador)
+            inicio = self.largura - len(mini[0])
+            for i, texto in enumerate(mini):
+                linhas[i] = linhas[i][:inicio] + texto.encode("ascii")
+        return linhas
+
+    @cronometrado("render")
+    def desenhar(self, jogador: Optional[Cell] = None) -> int:
+        """Desenha um quadro e retorna o número de bytes escritos."""
+        if jogador is not None:
+            self.seguir(jogador)
+        elif self.origem is None:
+            self.seguir(self.fonte.entrada)
+        linhas = self._quadro(jogador)
+        self._pos = jogador
+        if not self.incremental:
+            _imprimir_linhas(linhas, self.cor)
+            self.quadros += 1
+            return 0
+
+        if len(self._tela) != len(linhas):
+            self._tela = [None] * len(linhas)
+            partes = ["\x1b[H\x1b[2J"]
+        else:
+            partes = []
+        for i, linha in enumerate(linhas):
+            if self._tela[i] != linha:
+                self._tela[i] = linha
+                partes.append(f"\x1b[{i + 1};1H" + _linha_ansi(linha, self._estilos) + "\x1b[K")
+        partes.append(f"\x1b[{self.altura + 1};1H\x1b[J")
+        saida = "".join(partes)
+        arquivo = self.console.file
+        arquivo.write(saida)
+        arquivo.flush()
+        n = len(saida.encode("utf-8"))
+        self.quadros += 1
+        self.bytes_escritos += n
+        self.bytes_ultimo_quadro = n
+        contar("bytes", n)
+        return n
+
+
+def renderizador_para(lab: Labirinto, cor: str = "green", saida: Optional["Console"] = None,
+                      minimapa: bool = False):
+    """`RenderizadorIncremental` se o labirinto cabe na tela; senão, uma `Camera`."""
+    c = saida if saida is not None else obter_console()
+    cabe = c is None or (lab.altura < c.size.height and lab.largura <= c.size.width)
+    if cabe and not minimapa:
+        return RenderizadorIncremental(lab, cor=cor, saida=saida)
+    return Camera(lab, cor=cor, saida=saida, minimapa=minimapa)
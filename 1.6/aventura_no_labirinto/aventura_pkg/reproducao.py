@@ -0,0 +1,202 @@
+"""
+Gravação e reprodução determinística de partidas.
+
+Como `criar_labirinto` usa um `random.Random` próprio por labirinto, a
+tupla (largura, altura, semente, algoritmo, itens) recria exatamente o mesmo
+nível. Uma partida fica então descrita por essa tupla e pelo registro dos
+movimentos: cada movimento ocupa 2 bits (cima, baixo, esquerda, direita),
+quatro por byte. Dicas e a tecla de sair não alteram o estado e não entram
+no registro.
+
+    cabeçalho  "SES1", versão, itens, largura, altura, semente,
+               nº de movimentos, pontos declarados, algoritmo (16 bytes)
+    movimentos ceil(n / 4) bytes
+
+`simular` refaz a partida sem interface, com as mesmas regras de
+`jogador._tentar_mover` e `jogador.pontuar`, mas num laço sobre a grade plana
+(milhões de movimentos por segundo); serve para verificar pontuações de um
+placar (`verificar`). `reproduzir` refaz a partida com `_tentar_mover` de
+verdade e chama `desenhar` a cada passo, na velocidade pedida.
+"""
+from __future__ import annotations
+
+import struct
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Optional, Tuple, Union
+
+from .labirinto import Labirinto, criar_labirinto, validar_semente, PAREDE, LIVRE, ITEM, SAIDA
+from .jogador import Jogador, iniciar_jogador, _tentar_mover
+from .perfil import medir
+
+Cell = Tuple[int, int]
+Caminho = Union[str, Path]
+
+MAGICO = b"SES1"
+VERSAO = 1
+
+_CABECALHO = struct.Struct("<4sBxHIIqIi16s")
+
+# código de 2 bits de cada deslocamento (e o inverso)
+DESLOCAMENTOS: Tuple[Cell, ...] = ((-1, 0), (1, 0), (0, -1), (0, 1))
+_CODIGOS = {delta: codigo for codigo, delta in enumerate(DESLOCAMENTOS)}
+
+# byte empacotado -> seus 4 códigos (o primeiro movimento nos bits mais altos)
+_DESEMPACOTE = [bytes((b >> 6, (b >> 4) & 3, (b >> 2) & 3, b & 3)) for b in range(256)]
+
+
+@dataclass
+class Sessao:
+    """Uma partida: parâmetros do labirinto e os movimentos feitos (um código por byte).
+
+    Attributes:
+        pontos: pontuação declarada ao fim da partida (conferida por `verificar`).
+    """
+    largura: int
+    altura: int
+    semente: int
+    algoritmo: str = "backtracking"
+    itens: int = 5
+    movimentos: bytearray = field(default_factory=bytearray)
+    pontos: int = 0
+
+    @classmethod
+    def de_labirinto(cls, lab: Labirinto, itens: int) -> "Sessao":
+        """Sessão vazia para `lab`, que precisa ter sido gerado com semente conhecida.
+
+        Raises:
+            ValueError: se o labirinto não tiver semente (ex.: carregado de arquivo antigo).
+        """
+        if lab.semente is None:
+            raise ValueError("Só dá para gravar partidas em labirintos com semente conhecida")
+        return cls(lab.largura, lab.altura, lab.semente, lab.algoritmo, itens)
+
+    def registrar(self, delta: Cell) -> None:
+        """Acrescenta um movimento ao registro."""
+        self.movimentos.append(_CODIGOS[delta])
+
+    def labirinto(self) -> Labirinto:
+        """Recria o labirinto da partida, no estado inicial."""
+        return criar_labirinto(self.largura, self.altura, sementes=self.semente,
+                               itens=self.itens, algoritmo=self.algoritmo)
+
+    def para_bytes(self) -> bytes:
+        """Codifica a sessão no formato binário (movimentos com 2 bits cada).
+
+        Raises:
+            ValueError: se a semente não couber em 64 bits com sinal.
+        """
+        validar_semente(self.semente)
+        cods = bytes(self.movimentos) + b"\0" * (-len(self.movimentos) % 4)
+        corpo = bytes((cods[i] << 6) | (cods[i + 1] << 4) | (cods[i + 2] << 2) | cods[i + 3]
+                      for i in range(0, len(cods), 4))
+        cabecalho = _CABECALHO.pack(MAGICO, VERSAO, self.itens, self.largura, self.altura,
+                                    self.semente, len(self.movimentos), self.pontos,
+                                    self.algoritmo.encode("ascii")[:16])
+        return cabecalho + corpo
+
+    @classmethod
+    def de_bytes(cls, buf: bytes) -> "Sessao":
+        """Decodifica uma sessão gravada com `para_bytes`.
+
+        Raises:
+            ValueError: se o conteúdo não estiver no formato esperado.
+        """
+        try:
+            (magico, versao, itens, largura, altura, semente, n, pontos,
+             algoritmo) = _CABECALHO.unpack_from(buf, 0)
+        except struct.error as exc:
+            raise ValueError("Sessão truncada ou inválida") from exc
+        if magico != MAGICO:
+            raise ValueError("Conteúdo não é uma sessão (cabeçalho inválido)")
+        if versao != VERSAO:
+            raise ValueError(f"Versão de formato não suportada: {versao}")
+        corpo = buf[_CABECALHO.size:_CABECALHO.size + (n + 3) // 4]
+        if len(corpo) * 4 < n:
+            raise ValueError("Sessão truncada ou inválida")
+        movimentos = bytearray(b"".join(_DESEMPACOTE[b] for b in corpo)[:n])
+        return cls(largura, altura, semente, algoritmo.rstrip(b"\0").decode("ascii"),
+                   itens, movimentos, pontos)
+
+
+def salvar_sessao(sessao: Sessao, caminho: Caminho) -> None:
+    """Grava a sessão em `caminho`."""
+    Path(caminho).write_bytes(sessao.para_bytes())
+
+
+def carregar_sessao(caminho: Caminho) -> Sessao:
+    """Lê uma sessão gravada com `salvar_sessao`."""
+    return Sessao.de_bytes(Path(caminho).read_bytes())
+
+
+def simular(sessao: Sessao, lab: Optional[Labirinto] = None) -> Jogador:
+    """Refaz a partida sem interface e retorna o estado final do jogador.
+
+    Segue as regras de `_tentar_mover`/`pontuar` (parede: -1; passo: +1;
+    item: +10 e some; saída: +50), mas sobre uma cópia da grade plana, sem
+    tocar no labirinto nem no grafo de corredores.
+
+    Args:
+        sessao: partida gravada.
+        lab: labirinto da partida no estado inicial (padrão: recriado pela semente).
+    """
+    lab = lab if lab is not None else sessao.labirinto()
+    largura = lab.largura
+    dados = bytearray(lab.grade.dados)
+    passos = (-largura, largura, -1, 1)
+    k = lab.entrada[0] * largura + lab.entrada[1]
+    batidas = coletados = chegadas = 0
+    # a borda do labirinto é toda parede, então o índice nunca sai da grade
+    for codigo in sessao.movimentos:
+        alvo = k + passos[codigo]
+        celula = dados[alvo]
+        if celula == PAREDE:
+            batidas += 1
+        elif celula == ITEM:
+            k = alvo
+            coletados += 1
+            dados[alvo] = LIVRE
+        else:
+            k = alvo
+            if celula == SAIDA:
+                chegadas += 1
+    movimentos = len(sessao.movimentos)
+    andou = movimentos - batidas
+    pontos = andou - batidas + 10 * coletados + 50 * chegadas
+    return Jogador(divmod(k, largura), pontos, coletados, movimentos)
+
+
+def verificar(sessao: Sessao) -> bool:
+    """True se a pontuação declarada na sessão confere com a simulação."""
+    return simular(sessao).pontos == sessao.pontos
+
+
+def reproduzir(sessao: Sessao, desenhar: Optional[Callable[[Cell], object]] = None,
+               velocidade: float = 0.0, lab: Optional[Labirinto] = None) -> Jogador:
+    """Refaz a partida passo a passo com `_tentar_mover`, desenhando cada quadro.
+
+    Args:
+        sessao: partida gravada.
+        desenhar: chamada com a posição do jogador após cada movimento.
+        velocidade: movimentos por segundo (0 = o mais rápido possível).
+        lab: labirinto da partida no estado inicial (padrão: recriado pela
+            semente); passe o mesmo labirinto usado pelo renderizador.
+    """
+    lab = lab if lab is not None else sessao.labirinto()
+    jogador = iniciar_jogador(lab.entrada)
+    intervalo = 1.0 / velocidade if velocidade > 0 else 0.0
+    if desenhar is not None:
+        desenhar(jogador.pos)
+    proximo = time.perf_counter()
+    for codigo in sessao.movimentos:
+        _tentar_mover(lab, jogador, DESLOCAMENTOS[codigo])
+        if desenhar is not None:
+            desenhar(jogador.pos)
+        if intervalo:
+            proximo += intervalo
+            espera = proximo - time.perf_counter()
+            if espera > 0:
+                with medir("espera"):
+                    time.sleep(espera)
+    return jogador
@@ -0,0 +1,188 @@
+"""
+Planejador de rota de coleta: da entrada à saída passando por todos os itens.
+
+Cada passo vale +1 em `pontuar`, então "a maior pontuação" sozinha não tem
+limite (basta andar em círculos). O planejador busca a rota que coleta todos
+os itens alcançáveis (+10 cada) e chega à saída (+50) com o menor número de
+passos — é um caixeiro-viajante de caminho aberto sobre os itens:
+
+1. Uma BFS completa a partir de cada ponto de interesse (entrada, itens,
+   saída) dá a matriz de distâncias entre todos os pares e, de quebra, a
+   árvore de caminhos usada para montar a rota célula a célula.
+2. Até `LIMITE_EXATO` itens, a ordem de visita é ótima (programação
+   dinâmica de Held-Karp, O(2^n · n²)).
+3. Acima disso, parte do vizinho mais próximo e melhora com 2-opt
+   (inversão de trechos enquanto encurtar a rota).
+
+`solucionador.coletando_itens` expõe o planejador no registro de
+solucionadores (método "itens"), o que também o deixa em cache via
+`CacheNiveis.solucao`.
+"""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence, Tuple
+
+from .solucionador import _GradePlana
+
+Cell = Tuple[int, int]
+
+# até quantos itens a ordem é calculada de forma exata
+LIMITE_EXATO = 12
+
+_INF = float("inf")
+
+
+@dataclass
+class Rota:
+    """Rota planejada.
+
+    Attributes:
+        ordem: pontos na ordem de visita (origem, itens, destino).
+        passos: comprimento total da rota, em passos.
+        caminho: células da origem ao destino, inclusivas.
+        exata: True se a ordem veio de Held-Karp (ótima).
+        ignorados: itens inalcançáveis a partir da origem.
+        chegadas_saida: vezes que a rota pisa na saída do labirinto (ela pode
+            cruzar a saída a caminho de um item antes de terminar nela).
+    """
+    ordem: List[Cell]
+    passos: int
+    caminho: List[Cell]
+    exata: bool
+    ignorados: List[Cell] = field(default_factory=list)
+    chegadas_saida: int = 1
+
+    def pontos_previstos(self) -> int:
+        """Pontuação ao seguir a rota: +1 por passo, +10 por item e +50 a cada chegada à saída."""
+        return self.passos + 10 * (len(self.ordem) - 2) + 50 * self.chegadas_saida
+
+
+def _bfs_completa(plana: _GradePlana, origem: int) -> Tuple[array, bytearray]:
+    """Distância (-1 = inalcançável) e direção de chegada de toda célula a partir de `origem`."""
+    livre, desl = plana.livre, plana.deslocamentos
+    dist = array('i', [-1]) * len(livre)
+    veio = bytearray(len(livre))
+    dist[origem] = 0
+    veio[origem] = 5
+    fila = [origem]
+    for k in fila:
+        proxima = dist[k] + 1
+        for i in range(4):
+            n = k + desl[i]
+            if livre[n] and not veio[n]:
+                veio[n] = i + 1
+                dist[n] = proxima
+                fila.append(n)
+    return dist, veio
+
+
+def distancias(lab, pontos: Sequence[Cell]) -> Tuple[List[List[int]], List[bytearray]]:
+    """Matriz de distâncias entre `pontos` (-1 = sem caminho) e as árvores de BFS de cada um."""
+    plana = _GradePlana(lab)
+    indices = [plana.indice(p) for p in pontos]
+    matriz, arvores = [], []
+    for k in indices:
+        dist, veio = _bfs_completa(plana, k)
+        matriz.append([dist[j] for j in indices])
+        arvores.append(veio)
+    return matriz, arvores
+
+
+def held_karp(d: List[List[int]]) -> List[int]:
+    """Ordem ótima de 0 até len(d)-1 visitando todos os pontos intermediários."""
+    n = len(d)
+    m = n - 2  # pontos intermediários: 1..m
+    if m <= 0:
+        return list(range(n))
+    cheio = (1 << m) - 1
+    custo = [[_INF] * m for _ in range(1 << m)]
+    antes = [[-1] * m for _ in range(1 << m)]
+    for j in range(m):
+        custo[1 << j][j] = d[0][j + 1]
+    for mascara in range(1, cheio + 1):
+        linha = custo[mascara]
+        for j in range(m):
+            atual = linha[j]
+            if atual == _INF or not mascara >> j & 1:
+                continue
+            dj = d[j + 1]
+            for k in range(m):
+                if mascara >> k & 1:
+                    continue
+                novo = atual + dj[k + 1]
+                proxima = mascara | 1 << k
+                if novo < custo[proxima][k]:
+                    custo[proxima][k] = novo
+                    antes[proxima][k] = j
+    fim = min(range(m), key=lambda j: custo[cheio][j] + d[j + 1][n - 1])
+    ordem, mascara = [], cheio
+    while fim != -1:
+        ordem.append(fim + 1)
+        fim, mascara = antes[mascara][fim], mascara & ~(1 << fim)
+    return [0] + ordem[::-1] + [n - 1]
+
+
+def dois_opt(d: List[List[int]]) -> List[int]:
+    """Ordem de 0 até len(d)-1 pelo vizinho mais próximo, melhorada com 2-opt."""
+    n = len(d)
+    restantes = set(range(1, n - 1))
+    ordem = [0]
+    while restantes:
+        ultimo = d[ordem[-1]]
+        prox = min(restantes, key=ultimo.__getitem__)
+        restantes.remove(prox)
+        ordem.append(prox)
+    ordem.append(n - 1)
+    melhorou = True
+    while melhorou:
+        melhorou = False
+        for i in range(1, n - 2):
+            a, b = ordem[i - 1], ordem[i]
+            da, db = d[a], d[b]
+            for j in range(i + 1, n - 1):
+                c, e = ordem[j], ordem[j + 1]
+                if da[c] + db[e] < da[b] + d[c][e]:
+                    ordem[i:j + 1] = ordem[i:j + 1][::-1]
+                    b, db = ordem[i], d[ordem[i]]
+                    melhorou = True
+    return ordem
+
+
+def planejar(lab, origem: Optional[Cell] = None, destino: Optional[Cell] = None,
+             limite_exato: int = LIMITE_EXATO) -> Optional[Rota]:
+    """Rota mais curta da origem ao destino coletando todos os itens alcançáveis.
+
+    Args:
+        lab: labirinto (os itens vêm de `lab.itens`).
+        origem: padrão `lab.entrada`.
+        destino: padrão `lab.saida`.
+        limite_exato: acima deste número de itens usa 2-opt em vez de Held-Karp.
+
+    Returns:
+        A `Rota`, ou None se o destino for inalcançável.
+    """
+    origem = origem if origem is not None else lab.entrada
+    destino = destino if destino is not None else lab.saida
+    itens = sorted(lab.itens - {origem, destino})
+    pontos = [origem] + itens + [destino]
+    d, arvores = distancias(lab, pontos)
+    if d[0][-1] < 0:
+        return None
+    # itens fora do alcance ficam de fora (num labirinto perfeito não há nenhum)
+    uteis = [0] + [i for i in range(1, len(pontos) - 1) if d[0][i] >= 0] + [len(pontos) - 1]
+    ignorados = [pontos[i] for i in range(1, len(pontos) - 1) if d[0][i] < 0]
+    sub = [[d[i][j] for j in uteis] for i in uteis]
+    exata = len(uteis) - 2 <= limite_exato
+    ordem = [uteis[i] for i in (held_karp(sub) if exata else dois_opt(sub))]
+
+    plana = _GradePlana(lab)
+    caminho = [pontos[ordem[0]]]
+    for a, b in zip(ordem, ordem[1:]):
+        # a árvore da BFS de `a` leva de `a` até `b`
+        trecho = plana.caminho(arvores[a], plana.indice(pontos[b]))
+        caminho.extend(plana.celula(k) for k in trecho[1:])
+    passos = sum(d[a][b] for a, b in zip(ordem, ordem[1:]))
+    chegadas = sum(1 for c in caminho[1:] if c == lab.saida)
+    return Rota([pontos[i] for i in ordem], passos, caminho, exata, ignorados, chegadas)
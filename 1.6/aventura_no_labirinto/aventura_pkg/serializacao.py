@@ -0,0 +1,278 @@
+"""
+Formato binário compacto para salvar e abrir labirintos.
+
+Um labirinto ocupa um cabeçalho fixo, a lista de itens e um mapa de bits das
+paredes (1 bit por célula, em ordem de linha, bit mais significativo
+primeiro). Entrada, saída e itens ficam no cabeçalho e são sobrepostos ao
+mapa na leitura.
+
+    cabeçalho  "LAB1", versão, flags, largura, altura, entrada, saída,
+               semente, nº de itens, algoritmo (16 bytes)
+    itens      nº de itens x (linha, coluna)
+    paredes    ceil(largura * altura / 8) bytes
+
+`carregar` mapeia o arquivo com `mmap` e devolve um `Labirinto` cuja grade
+(`GradeMapeada`) lê as células direto do mapa, sem copiar o arquivo. O
+buffer de um byte por célula só é montado quando alguém pede `grade.dados`
+(solucionadores, grafo, renderizador).
+
+Vários labirintos podem ser guardados num único arquivo (`salvar_arquivo`),
+com um índice de deslocamentos para acesso aleatório (`ArquivoLabirintos`).
+"""
+from __future__ import annotations
+
+import mmap
+import struct
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, List, Optional, Union
+
+from .labirinto import Grade, Labirinto, validar_semente, PAREDE, LIVRE, ENTRADA, SAIDA, ITEM
+
+Caminho = Union[str, Path]
+
+MAGICO = b"LAB1"
+MAGICO_ARQUIVO = b"LABA"
+VERSAO = 1
+
+_FLAG_SEMENTE = 1
+
+_CABECALHO = struct.Struct("<4sBBHIIIIIIqI16s")
+_ITEM = struct.Struct("<II")
+# cabeçalho do arquivo em lote: mágico, versão, quantidade, posição do índice
+_CABECALHO_ARQUIVO = struct.Struct("<4sIIQ")
+_DESLOCAMENTO = struct.Struct("<Q")
+
+# paredes -> '1', resto -> '0' (e o caminho inverso)
+_PARA_BITS = bytes(ord('1') if b == PAREDE else ord('0') for b in range(256))
+_DE_BITS = bytes.maketrans(b"01", bytes([LIVRE, PAREDE]))
+
+
+def _empacotar(dados: bytes) -> bytes:
+    """Mapa de bits das paredes (1 = parede)."""
+    n = len(dados)
+    if not n:
+        return b""
+    bits = bytes(dados).translate(_PARA_BITS) + b"0" * (-n % 8)
+    return int(bits, 2).to_bytes(len(bits) // 8, "big")
+
+
+def _desempacotar(buf, inicio: int, primeiro_bit: int, n: int) -> bytearray:
+    """Decodifica `n` células a partir do bit `primeiro_bit` do mapa em `buf[inicio:]`."""
+    if n <= 0:
+        return bytearray()
+    a = inicio + (primeiro_bit >> 3)
+    b = inicio + ((primeiro_bit + n + 7) >> 3)
+    bits = format(int.from_bytes(buf[a:b], "big"), f"0{(b - a) * 8}b").encode("ascii")
+    desloc = primeiro_bit & 7
+    return bytearray(bits[desloc:desloc + n].translate(_DE_BITS))
+
+
+class GradeMapeada(Grade):
+    """Grade lida de um mapa de bits (tipicamente um `mmap`), sem cópia.
+
+    Leituras célula a célula e por linha decodificam só os bits necessários;
+    escritas (item coletado) vão para uma sobreposição em memória. O buffer
+    completo de um byte por célula é montado na primeira vez que `dados` é
+    acessado e, daí em diante, a grade se comporta como uma `Grade` comum.
+    """
+    __slots__ = ("_buf", "_inicio", "_sobreposicao", "_dados")
+
+    def __init__(self, largura: int, altura: int, buf, inicio: int, sobreposicao: Dict[int, int]):
+        self.largura = largura
+        self.altura = altura
+        self.observador = None
+        self._buf = buf
+        self._inicio = inicio
+        self._sobreposicao = sobreposicao
+        self._dados: Optional[bytearray] = None
+
+    @property
+    def dados(self) -> bytearray:
+        if self._dados is None:
+            dados = _desempacotar(self._buf, self._inicio, 0, self.largura * self.altura)
+            for k, codigo in self._sobreposicao.items():
+                dados[k] = codigo
+            self._dados = dados
+        return self._dados
+
+    @property
+    def materializada(self) -> bool:
+        """True se o buffer de um byte por célula já foi montado."""
+        return self._dados is not None
+
+    def ler(self, k: int) -> int:
+        if self._dados is not None:
+            return self._dados[k]
+        codigo = self._sobreposicao.get(k)
+        if codigo is not None:
+            return codigo
+        byte = self._buf[self._inicio + (k >> 3)]
+        return PAREDE if (byte >> (7 - (k & 7))) & 1 else LIVRE
+
+    def escrever(self, k: int, codigo: int) -> None:
+        if self._dados is not None:
+            return super().escrever(k, codigo)
+        antes = self.ler(k)
+        self._sobreposicao[k] = codigo
+        if self.observador is not None and antes != codigo:
+            self.observador(k, antes, codigo)
+
+    def linha(self, i: int) -> str:
+        if self._dados is not None:
+            return super().linha(i)
+        largura = self.largura
+        base = i * largura
+        linha = _desempacotar(self._buf, self._inicio, base, largura)
+        for k, codigo in self._sobreposicao.items():
+            if base <= k < base + largura:
+                linha[k - base] = codigo
+        return linha.decode("ascii")
+
+    def trecho(self, i: int, a: int, b: int) -> bytes:
+        if self._dados is not None:
+            return super().trecho(i, a, b)
+        base = i * self.largura
+        parte = _desempacotar(self._buf, self._inicio, base + a, b - a)
+        for k, codigo in self._sobreposicao.items():
+            if base + a <= k < base + b:
+                parte[k - base - a] = codigo
+        return bytes(parte)
+
+
+def para_bytes(lab: Labirinto) -> bytes:
+    """Codifica o labirinto no formato binário.
+
+    Raises:
+        ValueError: se a semente não couber em 64 bits com sinal.
+    """
+    flags = 0
+    semente = 0
+    if lab.semente is not None:
+        validar_semente(lab.semente)
+        flags |= _FLAG_SEMENTE
+        semente = lab.semente
+    itens = sorted(lab.itens)
+    cabecalho = _CABECALHO.pack(
+        MAGICO, VERSAO, flags, 0, lab.largura, lab.altura,
+        lab.entrada[0], lab.entrada[1], lab.saida[0], lab.saida[1],
+        semente, len(itens), lab.algoritmo.encode("ascii")[:16])
+    corpo = b"".join(_ITEM.pack(r, c) for r, c in itens)
+    # o mapa só registra paredes; entrada, saída e itens vêm do cabeçalho
+    return cabecalho + corpo + _empacotar(lab.grade.dados)
+
+
+def de_bytes(buf, inicio: int = 0) -> Labirinto:
+    """Abre o labirinto codificado em `buf[inicio:]` sem copiar o mapa de paredes.
+
+    `buf` pode ser `bytes`, `bytearray`, `memoryview` ou `mmap`; ele precisa
+    continuar vivo enquanto o labirinto for usado.
+
+    Raises:
+        ValueError: se o conteúdo não estiver no formato esperado.
+    """
+    try:
+        (magico, versao, flags, _, largura, altura, er, ec, sr, sc,
+         semente, n_itens, algoritmo) = _CABECALHO.unpack_from(buf, inicio)
+    except struct.error as exc:
+        raise ValueError("Labirinto truncado ou inválido") from exc
+    if magico != MAGICO:
+        raise ValueError("Conteúdo não é um labirinto (cabeçalho inválido)")
+    if versao != VERSAO:
+        raise ValueError(f"Versão de formato não suportada: {versao}")
+
+    pos = inicio + _CABECALHO.size
+    itens = set()
+    sobreposicao: Dict[int, int] = {}
+    for _ in range(n_itens):
+        r, c = _ITEM.unpack_from(buf, pos)
+        pos += _ITEM.size
+        itens.add((r, c))
+        sobreposicao[r * largura + c] = ITEM
+    sobreposicao[er * largura + ec] = ENTRADA
+    sobreposicao[sr * largura + sc] = SAIDA
+    if len(buf) < pos + (largura * altura + 7) // 8:
+        raise ValueError("Labirinto truncado ou inválido")
+
+    grade = GradeMapeada(largura, altura, buf, pos, sobreposicao)
+    return Labirinto(largura, altura, grade, (er, ec), (sr, sc), itens,
+                     semente if flags & _FLAG_SEMENTE else None,
+                     algoritmo.rstrip(b"\0").decode("ascii"))
+
+
+def _mapear(caminho: Caminho) -> mmap.mmap:
+    with open(caminho, "rb") as f:
+        return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+
+def salvar(lab: Labirinto, caminho: Caminho) -> None:
+    """Grava um labirinto em `caminho`."""
+    Path(caminho).write_bytes(para_bytes(lab))
+
+
+def carregar(caminho: Caminho) -> Labirinto:
+    """Abre um labirinto salvo com `salvar`, mapeando o arquivo em memória."""
+    return de_bytes(_mapear(caminho))
+
+
+def salvar_arquivo(labirintos: Iterable[Labirinto], caminho: Caminho) -> int:
+    """Grava vários labirintos num arquivo com índice; retorna quantos foram gravados.
+
+    Os labirintos são codificados e escritos um a um (o iterável pode ser um
+    gerador); o índice de deslocamentos vai para o fim do arquivo.
+    """
+    deslocamentos: List[int] = []
+    with open(caminho, "wb") as f:
+        f.write(_CABECALHO_ARQUIVO.pack(MAGICO_ARQUIVO, VERSAO, 0, 0))
+        for lab in labirintos:
+            deslocamentos.append(f.tell())
+            f.write(para_bytes(lab))
+        indice = f.tell()
+        f.write(b"".join(_DESLOCAMENTO.pack(d) for d in deslocamentos))
+        f.seek(0)
+        f.write(_CABECALHO_ARQUIVO.pack(MAGICO_ARQUIVO, VERSAO, len(deslocamentos), indice))
+    return len(deslocamentos)
+
+
+class ArquivoLabirintos:
+    """Arquivo com muitos labirintos, aberto com `mmap` e acesso aleatório.
+
+    Exemplo:
+        with ArquivoLabirintos("niveis.laba") as arq:
+            lab = arq[1234]
+    """
+
+    def __init__(self, caminho: Caminho):
+        self._mapa = _mapear(caminho)
+        magico, versao, quantidade, indice = _CABECALHO_ARQUIVO.unpack_from(self._mapa, 0)
+        if magico != MAGICO_ARQUIVO:
+            self._mapa.close()
+            raise ValueError("Arquivo não é um arquivo de labirintos (cabeçalho inválido)")
+        if versao != VERSAO:
+            self._mapa.close()
+            raise ValueError(f"Versão de formato não suportada: {versao}")
+        self._quantidade = quantidade
+        self._indice = indice
+
+    def __len__(self) -> int:
+        return self._quantidade
+
+    def __getitem__(self, i: int) -> Labirinto:
+        if i < 0:
+            i += self._quantidade
+        if not 0 <= i < self._quantidade:
+            raise IndexError("labirinto fora do arquivo")
+        (deslocamento,) = _DESLOCAMENTO.unpack_from(self._mapa, self._indice + i * _DESLOCAMENTO.size)
+        return de_bytes(self._mapa, deslocamento)
+
+    def __iter__(self) -> Iterator[Labirinto]:
+        return (self[i] for i in range(self._quantidade))
+
+    def fechar(self) -> None:
+        """Libera o mapeamento (labirintos ainda não materializados deixam de funcionar)."""
+        self._mapa.close()
+
+    def __enter__(self) -> "ArquivoLabirintos":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.fechar()
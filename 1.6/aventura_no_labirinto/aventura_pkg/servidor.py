@@ -0,0 +1,311 @@
+"""
+Servidor de partidas simultâneas (asyncio, TCP ou socket Unix).
+
+Um processo atende milhares de sessões com as mesmas regras do jogo local
+(`jogador._tentar_mover` e `jogador.pontuar`). Sessões na mesma semente
+compartilham um único `Labirinto`, que nunca é alterado. Cada sessão joga
+numa `Sobreposicao`, que lê a grade compartilhada e guarda só as células que
+a própria sessão mudou (os itens que coletou). Assim a grade não é copiada por
+jogador. O labirinto de uma semente é gerado na primeira sessão e descartado
+quando a última sai.
+
+Os movimentos recebidos entram numa fila por sessão e são aplicados em lote a
+cada tique (`tique` segundos, no máximo `MAX_POR_TIQUE` por sessão); cada
+sessão que se moveu recebe uma única resposta por tique.
+
+Protocolo (uma linha de texto por mensagem):
+
+    cliente -> servidor
+      ENTRAR <semente>        entra no labirinto da semente
+      wasd...                 um ou mais movimentos (w cima, s baixo, a esquerda, d direita)
+      SAIR
+    servidor -> cliente
+      OK <largura> <altura> <algoritmo> <itens no labirinto> <linha> <coluna>
+      P <aplicados> <linha> <coluna> <pontos> <itens coletados>
+      FIM <pontos> <itens coletados>      chegou à saída; a conexão é fechada
+      ERRO <mensagem>
+
+O endereço é "host:porta" (TCP) ou "unix:/caminho" (socket Unix). O cliente
+de carga fica em `benchmarks/bench_servidor.py`.
+"""
+from __future__ import annotations
+
+import asyncio
+import os
+import stat
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Deque, Dict, Optional, Set, Tuple
+
+from .labirinto import Labirinto, criar_labirinto, SEMENTE_MIN, SEMENTE_MAX
+from .jogador import Jogador, iniciar_jogador, _tentar_mover
+
+Cell = Tuple[int, int]
+
+TIQUE = 0.01           # segundos entre dois lotes de movimentos
+MAX_POR_TIQUE = 32     # movimentos aplicados por sessão a cada tique
+MAX_PENDENTES = 256    # movimentos na fila de uma sessão; o excesso é descartado
+MAX_BUFFER = 1 << 16   # bytes sem leitura pelo cliente antes de desconectá-lo
+
+_DESLOCAMENTOS = {ord('w'): (-1, 0), ord('s'): (1, 0), ord('a'): (0, -1), ord('d'): (0, 1)}
+
+
+class Sobreposicao:
+    """Visão de uma sessão sobre um labirinto compartilhado, que não é alterado.
+
+    Implementa o acesso por coordenadas de `Labirinto` (`celula`, `definir`,
+    `trecho`), então `_tentar_mover` funciona sem mudanças. As escritas ficam
+    num dicionário de índice linear -> código.
+    """
+    __slots__ = ("base", "alteradas")
+
+    def __init__(self, base: Labirinto):
+        self.base = base
+        self.alteradas: Dict[int, int] = {}
+
+    @property
+    def largura(self) -> int:
+        return self.base.largura
+
+    @property
+    def altura(self) -> int:
+        return self.base.altura
+
+    @property
+    def entrada(self) -> Cell:
+        return self.base.entrada
+
+    @property
+    def saida(self) -> Cell:
+        return self.base.saida
+
+    @property
+    def itens(self) -> Set[Cell]:
+        """Itens ainda não coletados nesta sessão."""
+        largura = self.base.largura
+        return {c for c in self.base.itens if c[0] * largura + c[1] not in self.alteradas}
+
+    def celula(self, r: int, c: int) -> str:
+        """Caractere da célula (r, c) nesta sessão; fora da grade conta como parede."""
+        base = self.base
+        if 0 <= r < base.altura and 0 <= c < base.largura:
+            k = r * base.largura + c
+            codigo = self.alteradas.get(k)
+            return chr(base.grade.dados[k] if codigo is None else codigo)
+        return '#'
+
+    def definir(self, r: int, c: int, ch: str) -> None:
+        """Grava `ch` na célula (r, c) só para esta sessão."""
+        self.alteradas[r * self.base.largura + c] = ord(ch)
+
+    def trecho(self, r: int, c0: int, c1: int) -> bytes:
+        """Códigos das células (r, c0) a (r, c1 - 1) nesta sessão."""
+        linha = self.base.trecho(r, c0, c1)
+        if not self.alteradas or not 0 <= r < self.base.altura:
+            return linha
+        linha = bytearray(linha)
+        inicio = r * self.base.largura
+        for k, codigo in self.alteradas.items():
+            c = k - inicio
+            if c0 <= c < c1 and 0 <= c < self.base.largura:
+                linha[c - c0] = codigo
+        return bytes(linha)
+
+
+@dataclass(eq=False)
+class Partida:
+    """Uma sessão conectada: jogador, visão do labirinto e movimentos pendentes."""
+    semente: int
+    jogador: Jogador
+    visao: Sobreposicao
+    escritor: asyncio.StreamWriter
+    pendentes: Deque[Tuple[int, int]] = field(default_factory=deque)
+    terminou: bool = False
+
+
+@dataclass
+class EstatisticasServidor:
+    """Contadores do servidor."""
+    sessoes_abertas: int = 0
+    sessoes_total: int = 0
+    movimentos: int = 0
+    descartados: int = 0
+    tiques: int = 0
+    labirintos: int = 0
+
+
+class Servidor:
+    """Atende sessões sobre labirintos compartilhados, aplicando movimentos por tique."""
+
+    def __init__(self, largura: int, altura: int, algoritmo: str = "backtracking", itens: int = 5,
+                 tique: float = TIQUE):
+        self.largura = largura
+        self.altura = altura
+        self.algoritmo = algoritmo
+        self.itens = itens
+        self.tique = tique
+        self.stats = EstatisticasServidor()
+        self._labirintos: Dict[int, Labirinto] = {}
+        self._usos: Dict[int, int] = {}
+        self._ativas: Set[Partida] = set()   # partidas com movimentos na fila
+
+    # ------------------------------------------------------------------ #
+    # labirintos compartilhados
+    # ------------------------------------------------------------------ #
+    def _entrar(self, semente: int) -> Labirinto:
+        lab = self._labirintos.get(semente)
+        if lab is None:
+            lab = criar_labirinto(self.largura, self.altura, sementes=semente, itens=self.itens,
+                                  algoritmo=self.algoritmo)
+            self._labirintos[semente] = lab
+            self._usos[semente] = 0
+        self._usos[semente] += 1
+        self.stats.labirintos = len(self._labirintos)
+        return lab
+
+    def _sair(self, semente: int) -> None:
+        self._usos[semente] -= 1
+        if not self._usos[semente]:
+            del self._usos[semente], self._labirintos[semente]
+        self.stats.labirintos = len(self._labirintos)
+
+    # ------------------------------------------------------------------ #
+    # sessões
+    # ------------------------------------------------------------------ #
+    async def atender(self, leitor: asyncio.StreamReader, escritor: asyncio.StreamWriter) -> None:
+        """Atende uma conexão: ENTRAR, depois movimentos até SAIR, FIM ou desconexão."""
+        partida = None
+        try:
+            try:
+                linha = (await leitor.readline()).split()
+            except ValueError:   # linha maior que o limite do leitor
+                escritor.write(b"ERRO linha longa demais\n")
+                return
+            if len(linha) != 2 or linha[0] != b"ENTRAR" or not linha[1].lstrip(b"-").isdigit():
+                escritor.write(b"ERRO esperado: ENTRAR <semente>\n")
+                return
+            semente = int(linha[1])
+            if not SEMENTE_MIN <= semente <= SEMENTE_MAX:
+                escritor.write(b"ERRO semente fora de 64 bits\n")
+                return
+            lab = self._entrar(semente)
+            partida = Partida(semente, iniciar_jogador(lab.entrada), Sobreposicao(lab), escritor)
+            self.stats.sessoes_abertas += 1
+            self.stats.sessoes_total += 1
+            r, c = lab.entrada
+            escritor.write(f"OK {lab.largura} {lab.altura} {self.algoritmo} {len(lab.itens)} {r} {c}\n".encode())
+            while not partida.terminou:
+                try:
+                    linha = await leitor.readuntil(b"\n")
+                except asyncio.IncompleteReadError as erro:
+                    linha = erro.partial       # último trecho sem quebra de linha
+                except asyncio.LimitOverrunError as erro:
+                    # uma linha pode ter quantos movimentos quiser: lê o que já chegou
+                    linha = await leitor.readexactly(erro.consumed)
+                if not linha or linha.startswith(b"SAIR"):
+                    break
+                pendentes = partida.pendentes
+                for byte in linha:
+                    delta = _DESLOCAMENTOS.get(byte)
+                    if delta is None:
+                        continue
+                    if len(pendentes) >= MAX_PENDENTES:
+                        self.stats.descartados += 1
+                        continue
+                    pendentes.append(delta)
+                if pendentes:
+                    self._ativas.add(partida)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            if partida is not None:
+                partida.terminou = True
+                self._ativas.discard(partida)
+                self.stats.sessoes_abertas -= 1
+                self._sair(partida.semente)
+            escritor.close()
+
+    def aplicar_tique(self) -> int:
+        """Aplica os movimentos pendentes de todas as sessões e responde a cada uma.
+
+        Returns:
+            int: movimentos aplicados.
+        """
+        total = 0
+        ativas, self._ativas = self._ativas, set()
+        for partida in ativas:
+            if partida.terminou:
+                continue
+            j, visao, pendentes = partida.jogador, partida.visao, partida.pendentes
+            saida = visao.base.saida
+            n = 0
+            while pendentes and n < MAX_POR_TIQUE:
+                _tentar_mover(visao, j, pendentes.popleft())
+                n += 1
+                if j.pos == saida:
+                    partida.terminou = True
+                    break
+            total += n
+            escritor = partida.escritor
+            if escritor.transport.get_write_buffer_size() > MAX_BUFFER:
+                partida.terminou = True   # cliente não lê as respostas
+                escritor.transport.abort()
+                continue
+            r, c = j.pos
+            resposta = f"P {n} {r} {c} {j.pontos} {j.itens_coletados}\n"
+            if partida.terminou:
+                resposta += f"FIM {j.pontos} {j.itens_coletados}\n"
+                pendentes.clear()
+                escritor.write(resposta.encode())
+                escritor.close()
+                continue
+            escritor.write(resposta.encode())
+            if pendentes:
+                self._ativas.add(partida)
+        self.stats.movimentos += total
+        self.stats.tiques += 1
+        return total
+
+    async def rodar_tiques(self) -> None:
+        """Laço de tiques em ritmo fixo (sem acumular atraso se um tique demorar)."""
+        loop = asyncio.get_running_loop()
+        proximo = loop.time()
+        while True:
+            if self._ativas:
+                self.aplicar_tique()
+            proximo = max(proximo + self.tique, loop.time())
+            await asyncio.sleep(proximo - loop.time())
+
+    async def servir(self, endereco: str, pronto: Optional[asyncio.Event] = None) -> None:
+        """Escuta em `endereco` ("host:porta" ou "unix:/caminho") até ser cancelado."""
+        if endereco.startswith("unix:"):
+            caminho = endereco[5:]
+            if os.path.exists(caminho):
+                # só remove um socket antigo; qualquer outro arquivo fica onde está
+                if not stat.S_ISSOCK(os.stat(caminho).st_mode):
+                    raise FileExistsError(f"{caminho} já existe e não é um socket Unix")
+                os.unlink(caminho)
+            servidor = await asyncio.start_unix_server(self.atender, caminho, backlog=4096)
+        else:
+            host, _, porta = endereco.rpartition(":")
+            servidor = await asyncio.start_server(self.atender, host or "127.0.0.1", int(porta),
+                                                  backlog=4096)
+        tiques = asyncio.create_task(self.rodar_tiques())
+        if pronto is not None:
+            pronto.set()
+        try:
+            async with servidor:
+                await servidor.serve_forever()
+        finally:
+            tiques.cancel()
+
+
+def servir(endereco: str, largura: int, altura: int, algoritmo: str = "backtracking",
+           itens: int = 5, tique: float = TIQUE) -> EstatisticasServidor:
+    """Roda o servidor até Ctrl+C e retorna as estatísticas."""
+    servidor = Servidor(largura, altura, algoritmo, itens, tique)
+    try:
+        asyncio.run(servidor.servir(endereco))
+    except KeyboardInterrupt:
+        pass
+    return servidor.stats
@@ -0,0 +1,242 @@
+"""
+Módulo de solução de labirintos por menor caminho.
+
+Oferece BFS iterativa, A* com heurística de Manhattan, BFS bidirecional e
+Dijkstra sobre o grafo de corredores do labirinto (`Labirinto.grafo`, em
+cache), além da rota de coleta de itens do módulo `rota` (método "itens"). As
+buscas na grade trabalham sobre uma cópia achatada dela — um byte por célula,
+com uma moldura de paredes para dispensar testes de limite — e deslocamentos
+de vizinhança pré-calculados. Nenhum deles altera `lab.grade`, então vários
+podem rodar ao mesmo tempo sobre o mesmo labirinto.
+"""
+from __future__ import annotations
+
+import heapq
+from typing import Callable, Dict, List, Optional, Tuple
+
+from .perfil import cronometrado
+
+Cell = Tuple[int, int]
+
+PAREDE = ord('#')
+
+# tabela para `bytes.translate`: 1 onde dá para andar, 0 nas paredes
+_PASSAVEL = bytes(0 if b == PAREDE else 1 for b in range(256))
+
+
+class _GradePlana:
+    """Grade achatada com moldura: `livre[k]` é 1 se a célula k é transitável.
+
+    A célula (r, c) do labirinto fica no índice `(r + 1) * largura + c + 1`,
+    onde `largura` já inclui as duas colunas da moldura.
+    """
+    __slots__ = ("largura", "livre", "deslocamentos")
+
+    def __init__(self, lab):
+        w = lab.largura
+        self.largura = largura = w + 2
+        dados = bytes(lab.grade.dados).translate(_PASSAVEL)
+        livre = bytearray(largura * (lab.altura + 2))
+        for i in range(lab.altura):
+            base = (i + 1) * largura + 1
+            livre[base:base + w] = dados[i * w:(i + 1) * w]
+        self.livre = livre
+        # ordem: cima, baixo, esquerda, direita
+        self.deslocamentos = (-largura, largura, -1, 1)
+
+    def indice(self, c: Cell) -> int:
+        return (c[0] + 1) * self.largura + c[1] + 1
+
+    def celula(self, k: int) -> Cell:
+        r, q = divmod(k, self.largura)
+        return (r - 1, q - 1)
+
+    def caminho(self, veio: bytearray, k: int) -> List[int]:
+        """Refaz o caminho até `k` seguindo as direções de chegada em `veio`.
+
+        `veio[k]` guarda 1 + o índice do deslocamento usado para chegar em k
+        (0 = não visitado, 5 = origem).
+        """
+        desl = self.deslocamentos
+        passos = [k]
+        while veio[k] != 5:
+            k -= desl[veio[k] - 1]
+            passos.append(k)
+        passos.reverse()
+        return passos
+
+
+def _extremos(lab, origem: Optional[Cell], destino: Optional[Cell]):
+    """Prepara a grade plana e valida origem e destino."""
+    plana = _GradePlana(lab)
+    o = plana.indice(origem if origem is not None else lab.entrada)
+    d = plana.indice(destino if destino is not None else lab.saida)
+    if not (plana.livre[o] and plana.livre[d]):
+        return plana, None, None
+    return plana, o, d
+
+
+def bfs(lab, origem: Optional[Cell] = None, destino: Optional[Cell] = None) -> Optional[List[Cell]]:
+    """Menor caminho por busca em largura iterativa.
+
+    Returns:
+        Lista de células da origem ao destino (inclusivos), ou None se não
+        houver caminho.
+    """
+    plana, o, d = _extremos(lab, origem, destino)
+    if o is None:
+        return None
+    livre, desl = plana.livre, plana.deslocamentos
+    veio = bytearray(len(livre))
+    veio[o] = 5
+    fila = [o]
+    for k in fila:  # a lista cresce durante a iteração: fila FIFO sem deque
+        if k == d:
+            return [plana.celula(x) for x in plana.caminho(veio, d)]
+        for i in range(4):
+            n = k + desl[i]
+            if livre[n] and not veio[n]:
+                veio[n] = i + 1
+                fila.append(n)
+    return None
+
+
+def a_estrela(lab, origem: Optional[Cell] = None, destino: Optional[Cell] = None) -> Optional[List[Cell]]:
+    """Menor caminho por A* com heurística de Manhattan (admissível em 4 direções)."""
+    plana, o, d = _extremos(lab, origem, destino)
+    if o is None:
+        return None
+    livre, desl, largura = plana.livre, plana.deslocamentos, plana.largura
+    dr, dq = divmod(d, largura)
+    custo: Dict[int, int] = {o: 0}
+    veio = bytearray(len(livre))
+    veio[o] = 5
+    fechado = bytearray(len(livre))
+    r, q = divmod(o, largura)
+    h0 = abs(r - dr) + abs(q - dq)
+    abertos = [(h0, h0, o)]
+    push, pop = heapq.heappush, heapq.heappop
+    while abertos:
+        _, _, k = pop(abertos)
+        if k == d:
+            return [plana.celula(x) for x in plana.caminho(veio, d)]
+        if fechado[k]:
+            continue
+        fechado[k] = 1
+        g = custo[k] + 1
+        for i in range(4):
+            n = k + desl[i]
+            if livre[n] and not fechado[n] and g < custo.get(n, g + 1):
+                custo[n] = g
+                veio[n] = i + 1
+                r, q = divmod(n, largura)
+                h = abs(r - dr) + abs(q - dq)
+                push(abertos, (g + h, h, n))
+    return None
+
+
+def bfs_bidirecional(lab, origem: Optional[Cell] = None, destino: Optional[Cell] = None) -> Optional[List[Cell]]:
+    """Menor caminho por BFS bidirecional, expandindo sempre a menor fronteira."""
+    plana, o, d = _extremos(lab, origem, destino)
+    if o is None:
+        return None
+    if o == d:
+        return [plana.celula(o)]
+    livre, desl = plana.livre, plana.deslocamentos
+    veio_o = bytearray(len(livre))
+    veio_d = bytearray(len(livre))
+    veio_o[o] = 5
+    veio_d[d] = 5
+    frente_o, frente_d = [o], [d]
+    encontros: List[int] = []
+    while frente_o and frente_d and not encontros:
+        if len(frente_o) <= len(frente_d):
+            frente, veio, outro = frente_o, veio_o, veio_d
+        else:
+            frente, veio, outro = frente_d, veio_d, veio_o
+        # expande o nível inteiro: o primeiro encontro nem sempre é o melhor
+        proxima = []
+        for k in frente:
+            for i in range(4):
+                n = k + desl[i]
+                if livre[n] and not veio[n]:
+                    veio[n] = i + 1
+                    if outro[n]:
+                        encontros.append(n)
+                    else:
+                        proxima.append(n)
+        if frente is frente_o:
+            frente_o = proxima
+        else:
+            frente_d = proxima
+    if not encontros:
+        return None
+    melhor = None
+    for n in encontros:
+        ida = plana.caminho(veio_o, n)
+        volta = plana.caminho(veio_d, n)
+        if melhor is None or len(ida) + len(volta) < len(melhor[0]) + len(melhor[1]):
+            melhor = (ida, volta)
+    ida, volta = melhor
+    volta.pop()  # o encontro já está em `ida`
+    return [plana.celula(x) for x in ida + volta[::-1]]
+
+
+def por_grafo(lab, origem: Optional[Cell] = None, destino: Optional[Cell] = None) -> Optional[List[Cell]]:
+    """Menor caminho por Dijkstra sobre o grafo de corredores em cache.
+
+    A primeira chamada constrói o grafo (custo parecido com uma BFS); as
+    seguintes visitam só bifurcações, becos e células especiais.
+    """
+    return lab.grafo.caminho(origem if origem is not None else lab.entrada,
+                             destino if destino is not None else lab.saida)
+
+
+def coletando_itens(lab, origem: Optional[Cell] = None, destino: Optional[Cell] = None) -> Optional[List[Cell]]:
+    """Rota mais curta da origem ao destino passando por todos os itens (veja `rota`).
+
+    Não é um menor caminho simples: é o caminho que o modo automático segue
+    para pontuar com todos os itens.
+    """
+    from .rota import planejar  # importado aqui: `rota` depende deste módulo
+    rota = planejar(lab, origem, destino)
+    return rota.caminho if rota is not None else None
+
+
+SOLUCIONADORES: Dict[str, Callable[..., Optional[List[Cell]]]] = {
+    "bfs": bfs,
+    "a_estrela": a_estrela,
+    "bidirecional": bfs_bidirecional,
+    "grafo": por_grafo,
+    "itens": coletando_itens,
+}
+
+
+@cronometrado("resolver")
+def resolver(lab, origem: Optional[Cell] = None, destino: Optional[Cell] = None,
+             metodo: str = "bfs") -> Optional[List[Cell]]:
+    """Resolve o labirinto com o método escolhido em `SOLUCIONADORES`.
+
+    Raises:
+        ValueError: se `metodo` não existir.
+    """
+    try:
+        solucionar = SOLUCIONADORES[metodo]
+    except KeyError:
+        opcoes = ", ".join(sorted(SOLUCIONADORES))
+        raise ValueError(f"Método desconhecido: {metodo!r}. Opções: {opcoes}") from None
+    return solucionar(lab, origem, destino)
+
+
+def dica(lab, pos: Cell, destino: Optional[Cell] = None) -> Optional[Tuple[int, int]]:
+    """Próximo passo (dr, dc) de `pos` rumo ao destino (saída, por padrão).
+
+    Consulta o grafo de corredores, então pedir dicas a cada jogada não
+    refaz a busca na grade inteira. Retorna None se não houver caminho ou se
+    `pos` já for o destino.
+    """
+    caminho = por_grafo(lab, pos, destino)
+    if not caminho or len(caminho) < 2:
+        return None
+    (r, c), (nr, nc) = caminho[0], caminho[1]
+    return (nr - r, nc - c)
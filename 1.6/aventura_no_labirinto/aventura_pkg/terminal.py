@@ -0,0 +1,66 @@
+"""
+Acesso preguiçoso ao terminal: um único `Console` do Rich e o teclado do pynput.
+
+Antes cada módulo importava o Rich (e o pynput) e criava o próprio
+`Console()` na importação, de modo que `--help`, `--batch` ou
+`--reproduzir` pagavam por Table, Markdown, Prompt e pelo listener de
+teclado mesmo sem usá-los. Aqui o `Console` é criado na primeira chamada de
+`obter_console` e compartilhado por todos os módulos; as demais classes do
+Rich (Table, Panel, Markdown...) são importadas dentro das funções que as
+usam.
+
+Sem o Rich (ou sem o pynput), as funções retornam None e quem chama recai
+em `print`/`input`, como antes.
+"""
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:  # pragma: no cover
+    from rich.console import Console
+
+_AUSENTE = object()
+
+_console = _AUSENTE
+_teclado = _AUSENTE
+
+
+def obter_console() -> Optional["Console"]:
+    """O `Console` compartilhado, criado na primeira chamada (None sem o Rich)."""
+    global _console
+    if _console is _AUSENTE:
+        try:
+            from rich.console import Console
+            _console = Console()
+        except Exception:  # pragma: no cover
+            _console = None
+    return _console
+
+
+def definir_console(console: Optional["Console"]) -> Optional["Console"]:
+    """Troca o `Console` compartilhado (ex.: por um terminal em memória); retorna o anterior."""
+    global _console
+    anterior = obter_console()
+    _console = console
+    return anterior
+
+
+def obter_teclado():
+    """O módulo `pynput.keyboard`, importado na primeira chamada (None sem o pynput)."""
+    global _teclado
+    if _teclado is _AUSENTE:
+        try:
+            from pynput import keyboard
+            _teclado = keyboard
+        except Exception:  # pragma: no cover
+            _teclado = None  # permite jogar sem a dependência instalada
+    return _teclado
+
+
+def imprimir(marcado: str, simples: Optional[str] = None) -> None:
+    """Imprime `marcado` (com marcação do Rich) ou, sem o Rich, `simples` com `print`."""
+    console = obter_console()
+    if console is not None:
+        console.print(marcado)
+    else:
+        print(simples if simples is not None else marcado)
@@ -1,35 +1,85 @@
-
 """
 Funções utilitárias para I/O, menus, efeitos e animações.
+
+`imprime_instrucoes` guarda o Markdown já renderizado (o texto ANSI que o
+Rich produziria) por (arquivo, mtime, tamanho, largura do terminal, sistema
+de cores): em memória, uma entrada por arquivo, e opcionalmente em disco.
+Rever as instruções só escreve o texto pronto; mudar o arquivo ou a largura
+do terminal muda a chave e força uma nova renderização. Um acerto em disco
+nem importa `rich.markdown` (markdown-it e pygments).
 """
 from __future__ import annotations
-from typing import Optional, List
-import time
+from typing import Dict, Optional, List, Tuple
+import hashlib
 import sys
 from pathlib import Path
 
-try:
-    from rich.console import Console
-    from rich.panel import Panel
+from .terminal import obter_console, imprimir
+from .animacao import Agendador, FPS
+
+# arquivo -> (chave, texto renderizado): só a versão atual de cada arquivo
+_instrucoes: Dict[str, Tuple[tuple, str]] = {}
+
+def _chave_instrucoes(p: Path, console) -> tuple:
+    """O que muda a renderização: arquivo, versão no disco e terminal."""
+    try:
+        st = p.stat()
+        versao = (st.st_mtime_ns, st.st_size)
+    except OSError:
+        versao = (0, 0)
+    return (str(p.resolve()), *versao, console.width, console.color_system)
+
+def renderizar_instrucoes(path: str, console) -> str:
+    """Renderiza o arquivo de instruções (Markdown num painel) e retorna o texto ANSI."""
     from rich.markdown import Markdown
-    from rich.prompt import Prompt
-    from rich.table import Table
-    console = Console()
-except Exception:  # pragma: no cover
-    console = None
-
-def imprime_instrucoes(path: str) -> None:
-    """Lê um arquivo de instruções e imprime formatado com Rich (se disponível)."""
+    from rich.panel import Panel
     p = Path(path)
     conteudo = p.read_text(encoding="utf-8") if p.exists() else "# Instruções\nSem conteúdo."
-    if console:
+    with console.capture() as cap:
         console.print(Panel(Markdown(conteudo), title="Instruções", border_style="blue"))
-    else:
-        print(conteudo)
+    return cap.get()
+
+def _arquivo_cache(diretorio: Path, chave: tuple) -> Path:
+    """Arquivo do cache em disco: prefixo pelo caminho, sufixo pela chave inteira."""
+    def resumo(x) -> str:
+        return hashlib.sha1(repr(x).encode("utf-8")).hexdigest()[:16]
+    return diretorio / f"{resumo(chave[0])}_{resumo(chave)}.ansi"
+
+def imprime_instrucoes(path: str, cache_dir: Optional[str] = None) -> None:
+    """Lê um arquivo de instruções e imprime formatado com Rich (se disponível).
+
+    A renderização fica em cache (veja o topo do módulo); com `cache_dir`,
+    também em `cache_dir/instrucoes`, para valer entre execuções.
+    """
+    console = obter_console()
+    if not console:
+        p = Path(path)
+        print(p.read_text(encoding="utf-8") if p.exists() else "# Instruções\nSem conteúdo.")
+        return
+    chave = _chave_instrucoes(Path(path), console)
+    guardado = _instrucoes.get(chave[0])
+    texto = guardado[1] if guardado and guardado[0] == chave else None
+    arquivo = _arquivo_cache(Path(cache_dir) / "instrucoes", chave) if cache_dir else None
+    if texto is None and arquivo is not None and arquivo.exists():
+        texto = arquivo.read_text(encoding="utf-8")
+    if texto is None:
+        texto = renderizar_instrucoes(path, console)
+        if arquivo is not None:
+            arquivo.parent.mkdir(parents=True, exist_ok=True)
+            # versões antigas do mesmo arquivo não servem mais
+            for velho in arquivo.parent.glob(arquivo.name.split("_")[0] + "_*.ansi"):
+                velho.unlink()
+            arquivo.write_text(texto, encoding="utf-8")
+    _instrucoes[chave[0]] = (chave, texto)
+    console.file.write(texto)
+    console.file.flush()
 
 def mostrar_menu(nome: str) -> str:
     """Mostra menu inicial e retorna a opção escolhida usando match-case."""
+    console = obter_console()
     if console:
+        from rich.prompt import Prompt
+        from rich.table import Table
         table = Table(title=f"Aventura no Labirinto — Bem-vindo(a), {nome}!")
         table.add_column("Opção", justify="center")
         table.add_column("Descrição")
@@ -56,16 +106,31 @@ def mostrar_menu(nome: str) -> str:
         case _:
             return "sair"
 
-def animacao_vitoria_recursiva(n: int) -> None:
-    """Animação recursiva simples para celebrar a vitória."""
+def _linhas_vitoria(n: int):
+    """Linhas da comemoração, de n estrelas até uma (gerador recursivo)."""
     if n <= 0:
         return
-    if console:
-        console.print("[bold green]★[/] " * n)
-    else:
-        print("★ " * n)
-    time.sleep(0.05)
-    animacao_vitoria_recursiva(n-1)
+    yield n
+    yield from _linhas_vitoria(n - 1)
+
+def animacao_vitoria_recursiva(n: int, duracao: Optional[float] = None, fps: float = FPS) -> None:
+    """Animação recursiva simples para celebrar a vitória.
+
+    As linhas saem pelo `Agendador` em `duracao` segundos (padrão: 50 ms por
+    linha); se o terminal atrasar, as linhas vencidas saem juntas.
+    """
+    linhas = _linhas_vitoria(n)
+    pendentes: List[int] = []
+
+    def avancar(k: int) -> None:
+        pendentes.extend(next(linhas) for _ in range(k))
+
+    def desenhar() -> None:
+        imprimir("\n".join("[bold green]★[/] " * m for m in pendentes),
+                 "\n".join("★ " * m for m in pendentes))
+        pendentes.clear()
+
+    Agendador(fps, duracao=n * 0.05 if duracao is None else duracao).executar(n, avancar, desenhar)
 
 def tocar_musica(caminho: Optional[str]) -> None:
     """Toca música com playsound, se disponível e caminho válido."""
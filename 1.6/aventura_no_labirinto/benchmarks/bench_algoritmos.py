@@ -0,0 +1,72 @@
+"""
+Benchmark dos algoritmos de geração: vazão (células/s) e pico de memória.
+
+Também mede o modo de transmissão do Eller (`linhas_eller`), que percorre
+um labirinto muito alto sem montar a grade, para mostrar a memória O(largura).
+
+Uso:
+    python benchmarks/bench_algoritmos.py
+    python benchmarks/bench_algoritmos.py --lado 1001 --altura-eller 100001
+"""
+from __future__ import annotations
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aventura_pkg.labirinto import criar_labirinto, GERADORES
+from aventura_pkg.geradores import linhas_eller
+
+
+def medir(func):
+    """Executa `func` e retorna (segundos, pico em bytes).
+
+    O tempo é medido numa execução sem tracemalloc (que distorce a vazão) e
+    o pico de memória numa segunda execução, com tracemalloc ligado.
+    """
+    t0 = time.perf_counter()
+    func()
+    dt = time.perf_counter() - t0
+    tracemalloc.start()
+    func()
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dt, pico
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos de geração.")
+    parser.add_argument("--lado", type=int, default=501, help="Largura = altura do labirinto.")
+    parser.add_argument("--altura-eller", type=int, default=20001,
+                        help="Altura do labirinto transmitido pelo Eller.")
+    parser.add_argument("--semente", type=int, default=1)
+    args = parser.parse_args()
+
+    n = args.lado | 1
+    celulas = n * n
+    print(f"Labirinto {n}x{n} ({celulas} células)")
+    print(f"{'algoritmo':>14} | {'tempo':>9} | {'células/s':>12} | {'pico':>10}")
+    for nome in sorted(GERADORES):
+        dt, pico = medir(lambda: criar_labirinto(n, n, sementes=args.semente, algoritmo=nome))
+        print(f"{nome:>14} | {dt:7.3f} s | {celulas / dt:12,.0f} | {pico / 2**20:6.2f} MiB")
+
+    altura = args.altura_eller | 1
+    largura = min(n, 201) | 1
+
+    def transmitir():
+        rng = random.Random(args.semente)
+        for _ in linhas_eller(largura, altura, rng):
+            pass
+
+    dt, pico = medir(transmitir)
+    celulas = largura * altura
+    print(f"\nEller transmitido {largura}x{altura}: {dt:.3f} s, "
+          f"{celulas / dt:,.0f} células/s, pico {pico / 2**10:.1f} KiB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+Benchmark das métricas de labirintos: NumPy em lote x laços Python sobre a grade.
+
+Para N labirintos do mesmo tamanho mede becos, histograma de grau e o campo
+de distâncias a partir da entrada de duas formas: com `analise.medir` (uma
+pilha de arrays) e com laços Python célula a célula sobre `lab.grade`,
+conferindo que os resultados batem.
+
+Uso:
+    python benchmarks/bench_analise.py
+    python benchmarks/bench_analise.py --quantidade 5000 --largura 61 --altura 31
+"""
+from __future__ import annotations
+import argparse
+import sys
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aventura_pkg.labirinto import criar_labirinto
+from aventura_pkg import analise
+
+
+def medir_python(lab):
+    """Becos, histograma de grau e distância até a saída com laços sobre `lab.grade`."""
+    grade = lab.grade
+    livre = lambda r, c: grade[r][c] != '#'
+    hist = [0] * 5
+    for r in range(1, lab.altura - 1):
+        for c in range(1, lab.largura - 1):
+            if livre(r, c):
+                hist[livre(r - 1, c) + livre(r + 1, c) + livre(r, c - 1) + livre(r, c + 1)] += 1
+    dist = {lab.entrada: 0}
+    fila = deque([lab.entrada])
+    while fila:
+        r, c = fila.popleft()
+        for v in ((r - 1, c), (r + 1, c), (r, c - 1), (r, c + 1)):
+            if v not in dist and livre(*v):
+                dist[v] = dist[(r, c)] + 1
+                fila.append(v)
+    return hist[1], hist, dist.get(lab.saida, -1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de métricas de labirintos.")
+    parser.add_argument("--quantidade", type=int, default=1000)
+    parser.add_argument("--largura", type=int, default=41)
+    parser.add_argument("--altura", type=int, default=23)
+    parser.add_argument("--algoritmo", default="backtracking")
+    args = parser.parse_args()
+
+    labs = [criar_labirinto(args.largura, args.altura, sementes=s, algoritmo=args.algoritmo)
+            for s in range(args.quantidade)]
+
+    t0 = time.perf_counter()
+    m = analise.medir(labs)
+    hist = analise.histograma_grau(analise.empilhar(labs))
+    t_numpy = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    referencia = [medir_python(lab) for lab in labs]
+    t_python = time.perf_counter() - t0
+
+    for i, (becos, h, caminho) in enumerate(referencia):
+        assert m.becos[i] == becos and list(hist[i]) == h and m.caminho[i] == caminho, i
+
+    n = len(labs)
+    print(f"{n} labirintos {args.largura}x{args.altura} ({args.algoritmo})")
+    print(f"{'modo':>8} | {'tempo s':>8} | {'labirintos/s':>13}")
+    for nome, dt in (("numpy", t_numpy), ("python", t_python)):
+        print(f"{nome:>8} | {dt:8.3f} | {n / dt:13,.0f}")
+    print(f"dificuldade: min {m.dificuldade.min():.2f}  mediana {sorted(m.dificuldade)[n // 2]:.2f}"
+          f"  max {m.dificuldade.max():.2f}")
+
+
+if __name__ == "__main__":
+    main()
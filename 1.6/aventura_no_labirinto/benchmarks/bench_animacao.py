@@ -0,0 +1,95 @@
+"""
+Benchmark da animação da solução: pausa fixa por célula x agendador de quadros.
+
+Para labirintos cada vez maiores, reproduz o caminho da entrada à saída num
+terminal simulado (80x24, com cores) de dois jeitos: o laço antigo (desenhar
+e dormir 30 ms a cada célula), medido numa amostra de `--amostra` células e
+extrapolado para o caminho inteiro, e o `Agendador` com duração fixa
+(`--duracao`), que junta células por quadro quando desenhar não acompanha.
+`--atraso-ms` soma um custo artificial a cada desenho (terminal lento).
+
+Uso:
+    python benchmarks/bench_animacao.py
+    python benchmarks/bench_animacao.py --tamanhos 101 1001 --duracao 1 --atraso-ms 20
+"""
+from __future__ import annotations
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from rich.console import Console
+
+from aventura_pkg.animacao import Agendador
+from aventura_pkg.labirinto import criar_labirinto
+from aventura_pkg.renderizador import renderizador_para
+from aventura_pkg.solucionador import resolver
+
+
+def terminal() -> Console:
+    return Console(file=io.StringIO(), force_terminal=True, color_system="truecolor", width=80, height=24)
+
+
+def desenhista(lab, atraso: float):
+    """Função de desenho do caminho: posição -> quadro, com `atraso` segundos extras."""
+    render = renderizador_para(lab, saida=terminal())
+
+    def desenhar(pos):
+        render.desenhar(pos)
+        if atraso:
+            time.sleep(atraso)
+    return desenhar
+
+
+def laco_antigo(lab, caminho, amostra: int, atraso: float) -> float:
+    """Segundos estimados do laço com pausa fixa para o caminho inteiro."""
+    desenhar = desenhista(lab, atraso)
+    desenhar(caminho[0])
+    trecho = caminho[1:amostra + 1]
+    t0 = time.perf_counter()
+    for pos in trecho:
+        desenhar(pos)
+        time.sleep(0.03)
+    return (time.perf_counter() - t0) / len(trecho) * (len(caminho) - 1)
+
+
+def agendado(lab, caminho, duracao: float, fps: float, atraso: float):
+    desenhar = desenhista(lab, atraso)
+    desenhar(caminho[0])
+    i = 0
+
+    def avancar(n):
+        nonlocal i
+        i += n
+    return Agendador(fps, duracao=duracao).executar(len(caminho) - 1, avancar, lambda: desenhar(caminho[i]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da animação da solução.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[21, 101, 501, 1001])
+    parser.add_argument("--duracao", type=float, default=2.0)
+    parser.add_argument("--fps", type=float, default=30)
+    parser.add_argument("--amostra", type=int, default=50, help="Células medidas no laço antigo.")
+    parser.add_argument("--atraso-ms", type=float, default=0.0, help="Custo extra por desenho.")
+    parser.add_argument("--semente", type=int, default=1)
+    args = parser.parse_args()
+    atraso = args.atraso_ms / 1000
+
+    print(f"alvo: {args.duracao:.1f} s a no máximo {args.fps:.0f} quadros/s")
+    print(f"{'labirinto':>10} | {'células':>7} | {'antigo s':>8} | {'agendado s':>10} | {'quadros':>7} | "
+          f"{'juntados':>8} | {'desenho ms p50/p95':>18}")
+    for n in args.tamanhos:
+        lab = criar_labirinto(n, n, sementes=args.semente)
+        caminho = resolver(lab, metodo="a_estrela")
+        antigo = laco_antigo(lab, caminho, args.amostra, atraso)
+        est = agendado(lab, caminho, args.duracao, args.fps, atraso)
+        custo = f"{est.custo_ms(50):.2f}/{est.custo_ms(95):.2f}"
+        print(f"{f'{n}x{n}':>10} | {len(caminho) - 1:7d} | {antigo:8.1f} | {est.segundos:10.2f} | "
+              f"{est.quadros:7d} | {est.juntados:8d} | {custo:>18}")
+
+
+if __name__ == "__main__":
+    main()
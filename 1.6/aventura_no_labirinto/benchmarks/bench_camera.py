@@ -0,0 +1,93 @@
+"""
+Benchmark da câmera: custo por quadro x tamanho do labirinto.
+
+Reproduz a solução de labirintos cada vez maiores num terminal simulado de
+80x24 e mede tempo, bytes e linhas lidas por quadro da `Camera`. Para
+comparação, mede o tempo de um quadro completo (labirinto inteiro com
+estilos, como o `RenderizadorIncremental` faz no primeiro quadro), que
+cresce com a área. O último caso usa o mundo infinito.
+
+Uso:
+    python benchmarks/bench_camera.py
+    python benchmarks/bench_camera.py --tamanhos 101 1001 3001 --quadros 2000
+"""
+from __future__ import annotations
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from rich.console import Console
+
+from aventura_pkg.labirinto import criar_labirinto
+from aventura_pkg.mundo import MundoInfinito
+from aventura_pkg.renderizador import Camera, RenderizadorIncremental
+from aventura_pkg.solucionador import resolver
+
+
+def terminal(largura: int = 80, altura: int = 24) -> Console:
+    return Console(file=io.StringIO(), force_terminal=True, color_system="truecolor",
+                   width=largura, height=altura)
+
+
+def medir_camera(fonte, caminho, minimapa: bool):
+    camera = Camera(fonte, saida=terminal(), minimapa=minimapa)
+    camera.desenhar(caminho[0])
+    camera.bytes_escritos = camera.linhas_lidas = 0
+    t0 = time.perf_counter()
+    for cel in caminho[1:]:
+        camera.desenhar(cel)
+    n = len(caminho) - 1
+    return (time.perf_counter() - t0) / n, camera.bytes_escritos / n, camera.linhas_lidas / n
+
+
+def medir_completo(lab):
+    render = RenderizadorIncremental(lab, saida=terminal(lab.largura + 10, lab.altura + 10))
+    t0 = time.perf_counter()
+    render._quadro_completo(bytearray(lab.grade.dados))
+    return time.perf_counter() - t0
+
+
+def caminho_no_mundo(mundo, passos: int):
+    """Anda para a direita/baixo pelas células livres (passeio simples, sem busca)."""
+    pos, caminho = mundo.entrada, [mundo.entrada]
+    anterior = None
+    while len(caminho) < passos:
+        for d in ((0, 1), (1, 0), (-1, 0), (0, -1)):
+            nova = (pos[0] + d[0], pos[1] + d[1])
+            if nova != anterior and mundo.celula(*nova) != '#':
+                anterior, pos = pos, nova
+                caminho.append(pos)
+                break
+        else:
+            anterior = None
+    return caminho
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark da câmera.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[101, 501, 1001, 2001])
+    parser.add_argument("--quadros", type=int, default=1000)
+    parser.add_argument("--minimapa", action="store_true")
+    parser.add_argument("--semente", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'labirinto':>10} | {'câmera ms':>9} | {'bytes/quadro':>12} | {'linhas lidas':>12} | "
+          f"{'quadro inteiro ms':>17}")
+    for n in args.tamanhos:
+        lab = criar_labirinto(n, n, sementes=args.semente, itens=20)
+        caminho = resolver(lab)[:args.quadros]
+        dt, b, lidas = medir_camera(lab, caminho, args.minimapa)
+        print(f"{f'{n}x{n}':>10} | {dt * 1e3:9.3f} | {b:12,.0f} | {lidas:12.1f} | "
+              f"{medir_completo(lab) * 1e3:17.1f}")
+    mundo = MundoInfinito(semente=args.semente)
+    caminho = caminho_no_mundo(mundo, args.quadros)
+    dt, b, lidas = medir_camera(mundo, caminho, args.minimapa)
+    print(f"{'infinito':>10} | {dt * 1e3:9.3f} | {b:12,.0f} | {lidas:12.1f} | {'-':>17}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Benchmark de geração de labirintos: tempo e pico de memória por tamanho.
+
+Compara `criar_labirinto` (pilha explícita + grade de um byte por célula) com a
+implementação original (DFS recursivo sobre lista de listas), reproduzida aqui
+como referência.
+
+Uso:
+    python benchmarks/bench_geracao.py
+    python benchmarks/bench_geracao.py --tamanhos 101 501 1001 2001
+"""
+from __future__ import annotations
+import argparse
+import random
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aventura_pkg.labirinto import criar_labirinto
+
+
+def _vizinhos(c, largura: int, altura: int):
+    """Vizinhos candidatos a dois passos (da implementação original)."""
+    r, q = c
+    cand = [(r-2, q), (r+2, q), (r, q-2), (r, q+2)]
+    return [(i, j) for i, j in cand if 0 < i < altura-1 and 0 < j < largura-1]
+
+
+def criar_labirinto_legado(largura: int, altura: int, sementes=None, itens: int = 3):
+    """Implementação original (recursiva, lista de listas), só para comparação."""
+    if sementes is not None:
+        random.seed(sementes)
+    largura = max(largura, 7)
+    altura = max(altura, 7)
+    if largura % 2 == 0: largura += 1
+    if altura % 2 == 0: altura += 1
+
+    grade = [['#' for _ in range(largura)] for _ in range(altura)]
+
+    def cavar(c):
+        r, q = c
+        grade[r][q] = ' '
+        viz = _vizinhos(c, largura, altura)
+        random.shuffle(viz)
+        for nr, nq in viz:
+            if grade[nr][nq] == '#':
+                mr, mq = (r + nr)//2, (q + nq)//2
+                grade[mr][mq] = ' '
+                cavar((nr, nq))
+
+    cavar((1, 1))
+    grade[1][1] = 'E'
+    grade[altura-2][largura-2] = 'S'
+    livres = [(i, j) for i in range(1, altura-1) for j in range(1, largura-1) if grade[i][j] == ' ']
+    random.shuffle(livres)
+    for k in range(min(itens, len(livres))):
+        i, j = livres[k]
+        grade[i][j] = '*'
+    return grade
+
+
+def medir(func, tamanho: int, semente: int):
+    """Retorna (segundos, pico em bytes) ou (None, None) se a função falhar."""
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    try:
+        func(tamanho, tamanho, sementes=semente, itens=5)
+    except RecursionError:
+        tracemalloc.stop()
+        return None, None
+    dt = time.perf_counter() - t0
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return dt, pico
+
+
+def _fmt(dt, pico, pulado: bool = False) -> str:
+    if pulado:
+        return f"{'-':>24}"
+    if dt is None:
+        return f"{'RecursionError':>24}"
+    return f"{dt:9.3f} s {pico / 2**20:9.2f} MiB"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de geração de labirintos.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[17, 41, 101, 301, 1001, 2001],
+                        help="Lados (largura = altura) a medir.")
+    parser.add_argument("--semente", type=int, default=1)
+    parser.add_argument("--sem-legado", action="store_true", help="Não mede a implementação original.")
+    args = parser.parse_args()
+
+    print(f"{'lado':>6} | {'atual (tempo / pico)':>24} | {'legado (tempo / pico)':>24}")
+    for n in args.tamanhos:
+        atual = medir(criar_labirinto, n, args.semente)
+        legado = (None, None) if args.sem_legado else medir(criar_labirinto_legado, n, args.semente)
+        print(f"{n:>6} | {_fmt(*atual)} | {_fmt(*legado, pulado=args.sem_legado)}")
+
+
+if __name__ == "__main__":
+    main()
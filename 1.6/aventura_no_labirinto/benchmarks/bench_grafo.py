@@ -0,0 +1,82 @@
+"""
+Benchmark do grafo de corredores: tamanho do grafo, nós visitados e tempo.
+
+Para cada tamanho, compara consultas de menor caminho entre células
+aleatórias feitas com BFS na grade e com Dijkstra no grafo em cache
+(`Labirinto.grafo`). O custo de construir o grafo é mostrado à parte, já que
+ele é pago uma vez e reaproveitado por soluções, dicas e rotas de itens.
+
+Uso:
+    python benchmarks/bench_grafo.py
+    python benchmarks/bench_grafo.py --tamanhos 101 501 --consultas 50
+"""
+from __future__ import annotations
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aventura_pkg.labirinto import criar_labirinto
+from aventura_pkg.solucionador import _GradePlana, bfs
+
+
+def visitados_bfs(lab, origem, destino) -> int:
+    """Número de células retiradas da fila por uma BFS de origem a destino."""
+    plana = _GradePlana(lab)
+    livre, desl = plana.livre, plana.deslocamentos
+    o, d = plana.indice(origem), plana.indice(destino)
+    visto = bytearray(len(livre))
+    visto[o] = 1
+    fila = [o]
+    for n, k in enumerate(fila, 1):
+        if k == d:
+            return n
+        for x in desl:
+            v = k + x
+            if livre[v] and not visto[v]:
+                visto[v] = 1
+                fila.append(v)
+    return len(fila)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do grafo de corredores.")
+    parser.add_argument("--tamanhos", type=int, nargs="+", default=[41, 201, 1001])
+    parser.add_argument("--consultas", type=int, default=30)
+    parser.add_argument("--semente", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'lado':>6} | {'células':>9} | {'nós':>8} | {'construção':>10} | "
+          f"{'visitas BFS':>11} | {'visitas grafo':>13} | {'t BFS':>9} | {'t grafo':>9}")
+    for n in args.tamanhos:
+        lab = criar_labirinto(n, n, sementes=args.semente, itens=20)
+        livres = [divmod(k, lab.largura) for k, b in enumerate(lab.grade.dados) if b != ord('#')]
+        rng = random.Random(args.semente)
+        pares = [(rng.choice(livres), rng.choice(livres)) for _ in range(args.consultas)]
+
+        t0 = time.perf_counter()
+        grafo = lab.grafo
+        t_construcao = time.perf_counter() - t0
+
+        v_bfs = v_grafo = 0
+        t_bfs = t_grafo = 0.0
+        for o, d in pares:
+            t0 = time.perf_counter()
+            bfs(lab, o, d)
+            t_bfs += time.perf_counter() - t0
+            t0 = time.perf_counter()
+            grafo.caminho(o, d)
+            t_grafo += time.perf_counter() - t0
+            v_bfs += visitados_bfs(lab, o, d)
+            v_grafo += grafo.expandidos
+        q = len(pares)
+        print(f"{n:>6} | {len(livres):>9} | {grafo.num_nos:>8} | {t_construcao * 1e3:7.1f} ms | "
+              f"{v_bfs / q:>11.0f} | {v_grafo / q:>13.0f} | "
+              f"{t_bfs / q * 1e3:6.2f} ms | {t_grafo / q * 1e3:6.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+"""
+Benchmark da gravação: custo por quadro e tamanho dos arquivos exportados.
+
+Reproduz a solução de labirintos de vários tamanhos num terminal simulado e
+mede o custo de um quadro só com o desenho ao vivo (`RenderizadorIncremental`)
+e com o desenho ao vivo mais o `Gravador` (`junto`). Depois exporta a gravação
+em .cast e .html e mostra os bytes por quadro, comparando com um asciicast que
+reemitisse a tela inteira a cada quadro (o tamanho do primeiro evento), e
+extrapola o tamanho de uma hora de partida a 5 e a 30 quadros por segundo.
+
+Uso:
+    python benchmarks/bench_gravacao.py
+    python benchmarks/bench_gravacao.py --tamanhos 41x23 201x101 --quadros 2000
+"""
+from __future__ import annotations
+import argparse
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from rich.console import Console
+
+from aventura_pkg.gravacao import Gravador, exportar_asciicast, exportar_html
+from aventura_pkg.labirinto import criar_labirinto, resolver_recursivo
+from aventura_pkg.renderizador import RenderizadorIncremental
+
+
+def terminal_falso(largura: int, altura: int) -> Console:
+    """Console que escreve num buffer, mas se comporta como terminal."""
+    return Console(file=io.StringIO(), force_terminal=True, color_system="truecolor",
+                   width=largura + 10, height=altura + 10)
+
+
+def medir_quadro(lab, caminho, gravar: bool):
+    """(µs por quadro, gravador ou None) desenhando o caminho ao vivo, com ou sem gravação."""
+    render = RenderizadorIncremental(lab, saida=terminal_falso(lab.largura, lab.altura))
+    gravador = Gravador(lab, passo=1 / 30) if gravar else None
+    desenhar = gravador.junto(render.desenhar) if gravar else render.desenhar
+    desenhar(caminho[0])
+    t0 = time.perf_counter()
+    for cel in caminho[1:]:
+        desenhar(cel)
+    return (time.perf_counter() - t0) / (len(caminho) - 1) * 1e6, gravador
+
+
+def tamanhos_exportados(gravador, pasta: Path):
+    """(bytes do quadro inicial, B/quadro .cast, B/quadro .html) depois do primeiro quadro."""
+    cast = pasta / "g.cast"
+    exportar_asciicast(gravador, cast)
+    linhas = cast.read_bytes().splitlines(keepends=True)
+    inicial, resto = linhas[1], linhas[2:]   # linhas[0] é o cabeçalho
+    quadros = gravador.quadros - 1
+    html = pasta / "g.html"
+    tamanho_html = exportar_html(gravador, html)
+    # o player e os estilos são fixos; o que cresce com a partida são os quadros
+    vazio = Gravador(gravador.lab, passo=1 / 30)
+    vazio.desenhar(None)
+    base_html = exportar_html(vazio, pasta / "vazio.html")
+    return len(inicial), sum(map(len, resto)) / quadros, (tamanho_html - base_html) / quadros
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Gravação: custo por quadro e tamanho exportado.")
+    ap.add_argument("--tamanhos", nargs="+", default=["41x23", "101x101", "201x101"],
+                    help="Tamanhos LARGURAxALTURA.")
+    ap.add_argument("--quadros", type=int, default=1000,
+                    help="Máximo de quadros (passos da solução) por medição.")
+    ap.add_argument("--semente", type=int, default=1)
+    args = ap.parse_args()
+
+    print(f"{'tamanho':>9} | {'ao vivo µs':>10} | {'+gravação µs':>12} | {'memória B/q':>11} | "
+          f"{'tela cheia B':>12} | {'.cast B/q':>9} | {'.html B/q':>9} | "
+          f"{'.cast MB/h 5|30 fps':>19} | {'tela cheia MB/h 30 fps':>22}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for tamanho in args.tamanhos:
+            largura, altura = map(int, tamanho.split("x"))
+            lab = criar_labirinto(largura, altura, sementes=args.semente, itens=5)
+            caminho = resolver_recursivo(lab)[:args.quadros]
+            ao_vivo, _ = medir_quadro(lab, caminho, gravar=False)
+            com_gravacao, gravador = medir_quadro(lab, caminho, gravar=True)
+            memoria = (gravador.tempos.itemsize + gravador.fim.itemsize
+                       + (gravador.indices.itemsize + 1) * len(gravador.indices) / gravador.quadros)
+            inicial, cast, html = tamanhos_exportados(gravador, Path(tmp))
+            por_hora = lambda b, fps: b * fps * 3600 / 1e6
+            print(f"{tamanho:>9} | {ao_vivo:10.1f} | {com_gravacao:12.1f} | {memoria:11.1f} | "
+                  f"{inicial:12,} | {cast:9.1f} | {html:9.1f} | "
+                  f"{por_hora(cast, 5):8.1f} | {por_hora(cast, 30):8.1f} | {por_hora(inicial, 30):22,.0f}")
+
+
+if __name__ == "__main__":
+    main()
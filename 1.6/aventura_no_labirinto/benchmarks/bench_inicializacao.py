@@ -0,0 +1,85 @@
+"""
+Benchmark de inicialização: do processo novo até a primeira saída.
+
+Para cada modo da CLI, dispara `python main.py ...` num processo novo e mede
+o tempo até o primeiro byte chegar na saída padrão (mediana de várias
+execuções), comparando com um alvo. Uma execução extra com
+`python -X importtime` soma o tempo de importação e lista os módulos de
+topo mais caros, para mostrar onde o tempo vai quando o alvo estoura.
+
+Uso:
+    python benchmarks/bench_inicializacao.py
+    python benchmarks/bench_inicializacao.py --repeticoes 20 --alvo 80
+"""
+from __future__ import annotations
+import argparse
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+RAIZ = Path(__file__).resolve().parents[1]
+
+# nome -> (argumentos após o interpretador, entrada padrão)
+CASOS = {
+    "python (vazio)": (["-c", "print()"], b""),
+    "--help": (["main.py", "--help"], b""),
+    "--batch 1": (["main.py", "--name", "x", "--batch", "1", "--workers", "1"], b""),
+    "menu": (["main.py", "--name", "x", "--disable-sound"], b"4\n"),
+    "--instrucoes": (["main.py", "--name", "x", "--instrucoes"], b""),
+}
+
+
+def primeira_saida(argumentos, entrada: bytes) -> float:
+    """Segundos do início do processo até o primeiro byte na saída padrão."""
+    t0 = time.perf_counter()
+    proc = subprocess.Popen([sys.executable, *argumentos], cwd=RAIZ, stdin=subprocess.PIPE,
+                            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL)
+    proc.stdin.write(entrada)
+    proc.stdin.close()
+    proc.stdout.read(1)
+    dt = time.perf_counter() - t0
+    proc.stdout.read()
+    proc.wait()
+    return dt
+
+
+def importacoes(argumentos, entrada: bytes, top: int):
+    """(total de importação em s, [(módulo, s)] dos `top` módulos de topo mais caros)."""
+    proc = subprocess.run([sys.executable, "-X", "importtime", *argumentos], cwd=RAIZ,
+                          input=entrada, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    topo = []
+    # formato: "import time: <próprio> | <cumulativo> | <nome indentado pela profundidade>"
+    for linha in proc.stderr.decode("utf-8", errors="ignore").splitlines():
+        partes = linha.split("|")
+        if not linha.startswith("import time:") or len(partes) != 3 or "cumulative" in linha:
+            continue
+        nome = partes[2][1:]
+        if not nome.startswith(" "):
+            topo.append((nome, int(partes[1]) / 1e6))
+    total = sum(s for _, s in topo)
+    return total, sorted(topo, key=lambda t: -t[1])[:top]
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser(description=__doc__.split("\n")[1])
+    ap.add_argument("--repeticoes", type=int, default=10)
+    ap.add_argument("--alvo", type=float, default=100.0,
+                    help="Alvo de tempo até a primeira saída, em ms.")
+    ap.add_argument("--top", type=int, default=3, help="Módulos mais caros listados por modo.")
+    args = ap.parse_args()
+
+    print(f"{'modo':>15} | {'1ª saída ms':>11} | {'import ms':>9} | {'alvo':>5} | módulos mais caros")
+    for nome, (argumentos, entrada) in CASOS.items():
+        primeira_saida(argumentos, entrada)  # aquece o cache de disco e os .pyc
+        tempos = [primeira_saida(argumentos, entrada) for _ in range(args.repeticoes)]
+        mediana = statistics.median(tempos) * 1000
+        total, caros = importacoes(argumentos, entrada, args.top)
+        ok = "ok" if mediana <= args.alvo else "ACIMA"
+        lista = ", ".join(f"{m} {s * 1000:.0f}" for m, s in caros)
+        print(f"{nome:>15} | {mediana:11.1f} | {total * 1000:9.1f} | {ok:>5} | {lista}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""
+Benchmark das instruções: renderização fria x cache em memória x cache em disco.
+
+No mesmo processo, mede `utils.imprime_instrucoes` num terminal simulado
+(com cores, saída descartada): a primeira chamada renderiza o Markdown, as
+seguintes só escrevem o texto guardado; limpando o cache em memória, a
+leitura vem do disco. Depois dispara `python main.py --instrucoes` em
+processos novos, sem e com `--cache-dir` já preenchido, e mede o tempo até
+o fim (mediana de várias execuções).
+
+Uso:
+    python benchmarks/bench_instrucoes.py
+    python benchmarks/bench_instrucoes.py --repeticoes 20 --arquivo README.md
+"""
+from __future__ import annotations
+import argparse
+import io
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from rich.console import Console
+
+from aventura_pkg import terminal, utils
+
+RAIZ = Path(__file__).resolve().parents[1]
+
+
+def medir(funcao, repeticoes: int) -> float:
+    """Mediana, em ms, de `repeticoes` chamadas de `funcao`."""
+    tempos = []
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        funcao()
+        tempos.append((time.perf_counter() - t0) * 1000)
+    return statistics.median(tempos)
+
+
+def main():
+    ap = argparse.ArgumentParser(description="Instruções: renderização fria x cache.")
+    ap.add_argument("--arquivo", default=str(RAIZ / "README.md"))
+    ap.add_argument("--repeticoes", type=int, default=10)
+    args = ap.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        print(f"{'caso':>28} | {'ms':>8}")
+
+        def linha(nome, ms):
+            print(f"{nome:>28} | {ms:8.2f}")
+
+        anterior = terminal.definir_console(Console(file=io.StringIO(), force_terminal=True, width=100,
+                                                    color_system="truecolor"))
+        try:
+            def fria():
+                utils._instrucoes.clear()
+                utils.imprime_instrucoes(args.arquivo)
+
+            def disco():
+                utils._instrucoes.clear()
+                utils.imprime_instrucoes(args.arquivo, pasta)
+
+            fria()  # aquece: importações do Rich e do markdown
+            linha("renderização (sem cache)", medir(fria, args.repeticoes))
+            linha("cache em memória", medir(lambda: utils.imprime_instrucoes(args.arquivo), args.repeticoes))
+            disco()
+            linha("cache em disco", medir(disco, args.repeticoes))
+        finally:
+            terminal.definir_console(anterior)
+
+        def processo(*extra):
+            subprocess.run([sys.executable, "main.py", "--name", "x", "--instrucoes", *extra],
+                           cwd=RAIZ, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+
+        cache = os.path.join(pasta, "processo")
+        processo("--cache-dir", cache)  # preenche o cache em disco
+        linha("processo novo (sem cache)", medir(processo, args.repeticoes))
+        linha("processo novo (--cache-dir)", medir(lambda: processo("--cache-dir", cache), args.repeticoes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark de latência: da tecla pressionada ao quadro desenhado.
+
+Usa `FonteRoteirizada` para "apertar" teclas em intervalos fixos e mede, no
+laço assíncrono de `entrada.jogar`, o tempo entre a chegada de cada tecla e
+o fim do quadro que a reflete (renderizador incremental escrevendo num
+terminal simulado em memória).
+
+Para comparação, mede também o padrão antigo (um `keyboard.Listener` criado
+por tecla): uma thread nova criada e aguardada por tecla (sem o custo de
+conexão com o servidor gráfico, que só o aumenta).
+
+Uso:
+    python benchmarks/bench_latencia.py
+    python benchmarks/bench_latencia.py --teclas 2000 --intervalo 0.002
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import io
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from rich.console import Console
+
+from aventura_pkg.labirinto import criar_labirinto
+from aventura_pkg.jogador import iniciar_jogador, _tentar_mover
+from aventura_pkg.renderizador import RenderizadorIncremental
+from aventura_pkg.entrada import FonteRoteirizada, TECLAS, jogar
+
+
+def renderizador(lab) -> RenderizadorIncremental:
+    terminal = Console(file=io.StringIO(), force_terminal=True, width=lab.largura + 10,
+                       height=lab.altura + 10)
+    return RenderizadorIncremental(lab, saida=terminal)
+
+
+def percentis(amostras):
+    amostras = sorted(amostras)
+    p = lambda q: amostras[min(len(amostras) - 1, int(q * len(amostras)))] * 1e3
+    return p(0.5), p(0.95), p(0.99)
+
+
+def medir_async(teclas, intervalo: float, fps: float, semente: int):
+    lab = criar_labirinto(41, 23, sementes=semente)
+    j = iniciar_jogador(lab.entrada)
+    render = renderizador(lab)
+    fonte = FonteRoteirizada(teclas + ['q'], intervalo)
+    resultado = asyncio.run(jogar(lab, j, render.desenhar, fonte=fonte, fps=fps))
+    return percentis(resultado.latencias)
+
+
+def medir_thread_por_tecla(teclas, semente: int):
+    lab = criar_labirinto(41, 23, sementes=semente)
+    j = iniciar_jogador(lab.entrada)
+    render = renderizador(lab)
+    latencias = []
+    for tecla in teclas:
+        t0 = time.perf_counter()
+        ouvinte = threading.Thread(target=lambda: None)
+        ouvinte.start()
+        ouvinte.join()
+        _tentar_mover(lab, j, TECLAS[tecla])
+        render.desenhar(j.pos)
+        latencias.append(time.perf_counter() - t0)
+    return percentis(latencias)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de latência tecla -> quadro.")
+    parser.add_argument("--teclas", type=int, default=500)
+    parser.add_argument("--intervalo", type=float, default=0.005, help="Segundos entre teclas.")
+    parser.add_argument("--semente", type=int, default=1)
+    args = parser.parse_args()
+
+    teclas = ("dsaw" * args.teclas)[:args.teclas]
+    print(f"{'modo':>22} | {'p50 ms':>7} | {'p95 ms':>7} | {'p99 ms':>7}")
+    for fps in (60, 120, 240):
+        p50, p95, p99 = medir_async(list(teclas), args.intervalo, fps, args.semente)
+        print(f"{f'async {fps} fps':>22} | {p50:7.3f} | {p95:7.3f} | {p99:7.3f}")
+    p50, p95, p99 = medir_thread_por_tecla(teclas, args.semente)
+    print(f"{'thread por tecla':>22} | {p50:7.3f} | {p95:7.3f} | {p99:7.3f}")
+
+
+if __name__ == "__main__":
+    main()
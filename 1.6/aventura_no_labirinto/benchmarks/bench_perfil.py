@@ -0,0 +1,102 @@
+"""
+Benchmark da instrumentação: custo por chamada, desligada e ligada.
+
+Mede, em ns por chamada, uma função vazia chamada direto e pelo decorador
+`cronometrado`, um bloco `with medir(...)` e `contar`, com a instrumentação
+desligada e ligada (com e sem linha do tempo). Para dar escala, mede também
+um quadro do `RenderizadorIncremental` num terminal simulado.
+
+Uso:
+    python benchmarks/bench_perfil.py
+    python benchmarks/bench_perfil.py --chamadas 2000000
+"""
+from __future__ import annotations
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from rich.console import Console
+
+from aventura_pkg import perfil
+from aventura_pkg.labirinto import criar_labirinto
+from aventura_pkg.renderizador import RenderizadorIncremental
+from aventura_pkg.solucionador import resolver
+
+
+def vazia():
+    pass
+
+
+envolvida = perfil.cronometrado("bench")(vazia)
+
+
+def ns_por_chamada(corpo, n: int) -> float:
+    t0 = time.perf_counter_ns()
+    corpo(n)
+    return (time.perf_counter_ns() - t0) / n
+
+
+def direto(n):
+    for _ in range(n):
+        vazia()
+
+
+def decorada(n):
+    for _ in range(n):
+        envolvida()
+
+
+def bloco(n):
+    medir = perfil.medir
+    for _ in range(n):
+        with medir("bench"):
+            pass
+
+
+def contador(n):
+    contar = perfil.contar
+    for _ in range(n):
+        contar("bench")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Custo da instrumentação.")
+    parser.add_argument("--chamadas", type=int, default=500_000)
+    args = parser.parse_args()
+    n = args.chamadas
+
+    casos = {"função direta": direto, "cronometrado": decorada, "with medir": bloco, "contar": contador}
+    modos = {"desligada": None, "ligada": False, "ligada + linha do tempo": True}
+    print(f"{'caso':>14} | " + " | ".join(f"{m:>23}" for m in modos) + "  (ns/chamada)")
+    resultados = {caso: [] for caso in casos}
+    for linha_do_tempo in modos.values():
+        if linha_do_tempo is None:
+            perfil.desativar()
+        else:
+            perfil.ativar(linha_do_tempo)
+        for caso, corpo in casos.items():
+            resultados[caso].append(ns_por_chamada(corpo, n))
+        perfil.desativar()
+        perfil.limpar()
+    for caso, valores in resultados.items():
+        print(f"{caso:>14} | " + " | ".join(f"{v:23.0f}" for v in valores))
+
+    lab = criar_labirinto(61, 21, sementes=1)
+    caminho = resolver(lab)
+    render = RenderizadorIncremental(lab, saida=Console(file=io.StringIO(), force_terminal=True,
+                                                        width=100, height=40))
+    render.desenhar(caminho[0])
+    t0 = time.perf_counter_ns()
+    for pos in caminho[1:]:
+        render.desenhar(pos)
+    quadro = (time.perf_counter_ns() - t0) / (len(caminho) - 1)
+    print(f"escala: um quadro incremental custa {quadro:.0f} ns "
+          f"(decorador desligado: {(resultados['cronometrado'][0] - resultados['função direta'][0]) / quadro:.2%})")
+
+
+if __name__ == "__main__":
+    main()
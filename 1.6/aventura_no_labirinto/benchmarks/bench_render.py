@@ -0,0 +1,84 @@
+"""
+Benchmark de renderização: bytes e tempo por quadro na reprodução da solução.
+
+Compara `imprimir_labirinto` (reimprime o labirinto inteiro a cada quadro)
+com `RenderizadorIncremental` (desenha uma vez e depois só as células que
+mudaram). A saída vai para um buffer em memória simulando um terminal grande
+o bastante para o labirinto.
+
+Uso:
+    python benchmarks/bench_render.py
+    python benchmarks/bench_render.py --tamanhos 41x23 121x61
+"""
+from __future__ import annotations
+import argparse
+import io
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from rich.console import Console
+
+from aventura_pkg import terminal
+from aventura_pkg.labirinto import criar_labirinto, imprimir_labirinto, resolver_recursivo
+from aventura_pkg.renderizador import RenderizadorIncremental
+
+
+def terminal_falso(largura: int, altura: int) -> Console:
+    """Console que escreve num buffer, mas se comporta como terminal."""
+    return Console(file=io.StringIO(), force_terminal=True, color_system="truecolor",
+                   width=largura + 10, height=altura + 10)
+
+
+def medir_completo(lab, caminho):
+    """(bytes/quadro, s/quadro) reimprimindo o labirinto inteiro."""
+    falso = terminal_falso(lab.largura, lab.altura)
+    original = terminal.definir_console(falso)
+    try:
+        t0 = time.perf_counter()
+        for cel in caminho:
+            imprimir_labirinto(lab, cel)
+        dt = time.perf_counter() - t0
+    finally:
+        terminal.definir_console(original)
+    n = len(falso.file.getvalue().encode("utf-8"))
+    return n / len(caminho), dt / len(caminho)
+
+
+def medir_incremental(lab, caminho):
+    """(bytes do 1º quadro, bytes/quadro depois, s/quadro) com o renderizador."""
+    render = RenderizadorIncremental(lab, saida=terminal_falso(lab.largura, lab.altura))
+    primeiro = render.desenhar(caminho[0])
+    t0 = time.perf_counter()
+    for cel in caminho[1:]:
+        render.desenhar(cel)
+    dt = time.perf_counter() - t0
+    resto = len(caminho) - 1
+    return primeiro, (render.bytes_escritos - primeiro) / resto, dt / resto
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de renderização.")
+    parser.add_argument("--tamanhos", nargs="+", default=["41x23", "81x45", "161x81"],
+                        help="Tamanhos LARGURAxALTURA.")
+    parser.add_argument("--quadros", type=int, default=200,
+                        help="Máximo de quadros (passos da solução) por medição.")
+    parser.add_argument("--semente", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'tamanho':>9} | {'completo B/q':>12} | {'fps máx':>8} | "
+          f"{'1º quadro B':>11} | {'incr. B/q':>9} | {'fps máx':>9}")
+    for tamanho in args.tamanhos:
+        largura, altura = map(int, tamanho.split("x"))
+        lab = criar_labirinto(largura, altura, sementes=args.semente, itens=5)
+        caminho = resolver_recursivo(lab)[:args.quadros]
+        b_comp, t_comp = medir_completo(lab, caminho)
+        primeiro, b_inc, t_inc = medir_incremental(lab, caminho)
+        print(f"{tamanho:>9} | {b_comp:12,.0f} | {1 / t_comp:8,.0f} | "
+              f"{primeiro:11,} | {b_inc:9,.1f} | {1 / t_inc:9,.0f}")
+
+
+if __name__ == "__main__":
+    main()
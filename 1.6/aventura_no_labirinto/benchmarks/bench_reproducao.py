@@ -0,0 +1,56 @@
+"""
+Benchmark da reprodução de partidas: simulação sem interface x `_tentar_mover`.
+
+Gera um registro de movimentos aleatórios num labirinto e mede quantos
+movimentos por segundo cada caminho processa, conferindo que ambos chegam ao
+mesmo estado final do jogador. Mostra também o tamanho da sessão gravada.
+
+Uso:
+    python benchmarks/bench_reproducao.py
+    python benchmarks/bench_reproducao.py --movimentos 5000000 --lado 201
+"""
+from __future__ import annotations
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aventura_pkg.jogador import iniciar_jogador, _tentar_mover
+from aventura_pkg.reproducao import DESLOCAMENTOS, Sessao, simular
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de reprodução de partidas.")
+    parser.add_argument("--movimentos", type=int, default=2_000_000)
+    parser.add_argument("--lado", type=int, default=101)
+    parser.add_argument("--semente", type=int, default=1)
+    args = parser.parse_args()
+
+    rng = random.Random(args.semente)
+    sessao = Sessao(args.lado, args.lado, args.semente, itens=50)
+    sessao.movimentos = bytearray(rng.randrange(4) for _ in range(args.movimentos))
+    n = len(sessao.movimentos)
+
+    lab = sessao.labirinto()
+    t0 = time.perf_counter()
+    rapido = simular(sessao, lab)
+    t_simular = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    jogador = iniciar_jogador(lab.entrada)
+    for codigo in sessao.movimentos:
+        _tentar_mover(lab, jogador, DESLOCAMENTOS[codigo])
+    t_mover = time.perf_counter() - t0
+    assert rapido == jogador, (rapido, jogador)
+
+    print(f"{n} movimentos, sessão gravada com {len(sessao.para_bytes())} bytes")
+    print(f"{'caminho':>14} | {'tempo s':>8} | {'mov/s':>12}")
+    for nome, dt in (("simular", t_simular), ("_tentar_mover", t_mover)):
+        print(f"{nome:>14} | {dt:8.3f} | {n / dt:12,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,60 @@
+"""
+Benchmark do planejador de rota de coleta: tempo de planejamento x número de itens.
+
+Para cada quantidade de itens mede o tempo das BFS (matriz de distâncias) e
+da ordenação, com Held-Karp (exato, só até `--max-exato` itens) e com vizinho
+mais próximo + 2-opt, e compara o comprimento das rotas.
+
+Uso:
+    python benchmarks/bench_rota.py
+    python benchmarks/bench_rota.py --lado 201 --itens 4 8 12 16 32 64 128
+"""
+from __future__ import annotations
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aventura_pkg.labirinto import criar_labirinto
+from aventura_pkg.rota import distancias, held_karp, dois_opt
+
+
+def comprimento(d, ordem) -> int:
+    return sum(d[a][b] for a, b in zip(ordem, ordem[1:]))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark do planejador de rota de coleta.")
+    parser.add_argument("--lado", type=int, default=101)
+    parser.add_argument("--itens", type=int, nargs="+", default=[4, 8, 10, 12, 14, 32, 64, 128])
+    parser.add_argument("--max-exato", type=int, default=14, help="Maior n em que roda Held-Karp.")
+    parser.add_argument("--semente", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'itens':>5} | {'BFS s':>7} | {'Held-Karp s':>11} | {'2-opt s':>8} | "
+          f"{'passos HK':>9} | {'passos 2-opt':>12}")
+    for n in args.itens:
+        lab = criar_labirinto(args.lado, args.lado, sementes=args.semente, itens=n)
+        pontos = [lab.entrada] + sorted(lab.itens) + [lab.saida]
+        t0 = time.perf_counter()
+        d, _ = distancias(lab, pontos)
+        t_bfs = time.perf_counter() - t0
+
+        t_hk = passos_hk = None
+        if n <= args.max_exato:
+            t0 = time.perf_counter()
+            passos_hk = comprimento(d, held_karp(d))
+            t_hk = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        passos_2opt = comprimento(d, dois_opt(d))
+        t_2opt = time.perf_counter() - t0
+
+        hk = f"{t_hk:11.4f}" if t_hk is not None else f"{'-':>11}"
+        phk = f"{passos_hk:9d}" if passos_hk is not None else f"{'-':>9}"
+        print(f"{n:5d} | {t_bfs:7.3f} | {hk} | {t_2opt:8.4f} | {phk} | {passos_2opt:12d}")
+
+
+if __name__ == "__main__":
+    main()
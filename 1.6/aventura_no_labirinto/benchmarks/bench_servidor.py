@@ -0,0 +1,156 @@
+"""
+Cliente de carga do modo servidor: sessões por núcleo e latência dos movimentos.
+
+Sobe `python main.py --servidor unix:...` num processo separado e abre
+`--sessoes` conexões distribuídas entre `--sementes` labirintos. Cada sessão
+recria localmente o labirinto da sua semente (mesmo tamanho, algoritmo e
+itens informados no OK), calcula o caminho até a saída e anda por ele, para
+frente e para trás sem pisar na saída, com `--taxa` movimentos por segundo
+durante `--segundos`. A latência de cada movimento vai do envio até a linha
+`P` que o confirma. No fim, mostra a vazão, os percentis da latência e o
+tempo de CPU do servidor: sessões por núcleo = sessões / (CPU do servidor /
+tempo de parede).
+
+Cliente e servidor dividem a mesma máquina, então com poucos núcleos o
+próprio cliente de carga pesa nas latências.
+
+Uso:
+    python benchmarks/bench_servidor.py
+    python benchmarks/bench_servidor.py --sessoes 3000 --taxa 10 --tique 0.02
+"""
+from __future__ import annotations
+import argparse
+import asyncio
+import os
+import random
+import resource
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+from collections import deque
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aventura_pkg.labirinto import criar_labirinto
+from aventura_pkg.solucionador import resolver
+
+RAIZ = Path(__file__).resolve().parents[1]
+_LETRAS = {(-1, 0): "w", (1, 0): "s", (0, -1): "a", (0, 1): "d"}
+
+_roteiros = {}
+
+
+def roteiro(semente: int, largura: int, altura: int, algoritmo: str, itens: int) -> str:
+    """Movimentos da entrada até a célula antes da saída e de volta (um ciclo)."""
+    chave = (semente, largura, altura, algoritmo, itens)
+    if chave not in _roteiros:
+        lab = criar_labirinto(largura, altura, sementes=semente, itens=itens, algoritmo=algoritmo)
+        caminho = resolver(lab)[:-1]
+        ida = "".join(_LETRAS[(b[0] - a[0], b[1] - a[1])] for a, b in zip(caminho, caminho[1:]))
+        volta = ida[::-1].translate(str.maketrans("wsad", "swda"))
+        _roteiros[chave] = ida + volta
+    return _roteiros[chave]
+
+
+async def sessao(caminho: str, semente: int, taxa: float, segundos: float, latencias: list,
+                 limite: asyncio.Semaphore) -> int:
+    """Uma sessão do cliente de carga; retorna quantos movimentos foram confirmados."""
+    async with limite:
+        leitor, escritor = await asyncio.open_unix_connection(caminho)
+        escritor.write(f"ENTRAR {semente}\n".encode())
+        ok = (await leitor.readline()).split()
+    largura, altura, algoritmo, itens = int(ok[1]), int(ok[2]), ok[3].decode(), int(ok[4])
+    movimentos = roteiro(semente, largura, altura, algoritmo, itens)
+    enviados = deque()
+    confirmados = 0
+
+    async def ler():
+        nonlocal confirmados
+        while True:
+            linha = await leitor.readline()
+            if not linha.startswith(b"P "):
+                return
+            agora = time.perf_counter()
+            for _ in range(int(linha.split()[1])):
+                latencias.append(agora - enviados.popleft())
+                confirmados += 1
+
+    leitura = asyncio.create_task(ler())
+    intervalo = 1.0 / taxa
+    await asyncio.sleep(random.random() * intervalo)   # espalha as sessões no tempo
+    fim = time.perf_counter() + segundos
+    i = 0
+    while time.perf_counter() < fim:
+        escritor.write(movimentos[i % len(movimentos)].encode() + b"\n")
+        enviados.append(time.perf_counter())
+        i += 1
+        await asyncio.sleep(intervalo)
+    await asyncio.sleep(0.2)   # espera as últimas confirmações
+    escritor.write(b"SAIR\n")
+    leitura.cancel()
+    escritor.close()
+    return confirmados
+
+
+async def carga(caminho: str, args) -> tuple:
+    latencias = []
+    limite = asyncio.Semaphore(256)   # conexões abrindo ao mesmo tempo
+    t0 = time.perf_counter()
+    confirmados = await asyncio.gather(*(
+        sessao(caminho, i % args.sementes, args.taxa, args.segundos, latencias, limite)
+        for i in range(args.sessoes)))
+    return sum(confirmados), latencias, time.perf_counter() - t0
+
+
+def percentil(ordenados, p: float) -> float:
+    return ordenados[min(len(ordenados) - 1, int(len(ordenados) * p / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cliente de carga do modo servidor.")
+    parser.add_argument("--sessoes", type=int, default=1000)
+    parser.add_argument("--sementes", type=int, default=20, help="Labirintos distintos (compartilhados).")
+    parser.add_argument("--taxa", type=float, default=5, help="Movimentos por segundo por sessão.")
+    parser.add_argument("--segundos", type=float, default=10)
+    parser.add_argument("--tique", type=float, default=0.01)
+    parser.add_argument("--dificuldade", default="medio", choices=["facil", "medio", "dificil"])
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as pasta:
+        caminho = os.path.join(pasta, "servidor.sock")
+        servidor = subprocess.Popen(
+            [sys.executable, "main.py", "--name", "carga", "--servidor", f"unix:{caminho}",
+             "--tique", str(args.tique), "--dificuldade", args.dificuldade],
+            cwd=RAIZ, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        while not os.path.exists(caminho):
+            if servidor.poll() is not None:
+                sys.exit(servidor.stdout.read())
+            time.sleep(0.05)
+        t0 = time.perf_counter()
+        confirmados, latencias, segundos = asyncio.run(carga(caminho, args))
+        servidor.send_signal(signal.SIGINT)
+        saida = servidor.communicate()[0].strip().splitlines()
+        parede = time.perf_counter() - t0
+    uso = resource.getrusage(resource.RUSAGE_CHILDREN)
+    cpu_servidor = uso.ru_utime + uso.ru_stime
+    proprio = resource.getrusage(resource.RUSAGE_SELF)
+    nucleos = cpu_servidor / parede
+
+    latencias.sort()
+    print(f"{args.sessoes} sessões em {args.sementes} labirintos ({args.dificuldade}), "
+          f"{args.taxa:g} mov/s cada, tique {args.tique * 1000:g} ms, {os.cpu_count()} CPU(s)")
+    print(f"servidor: {saida[-1] if saida else '?'}")
+    print(f"{'movimentos confirmados':>26} | {confirmados} ({confirmados / segundos:.0f}/s)")
+    print(f"{'latência ms p50/p95/p99':>26} | " + "/".join(
+        f"{percentil(latencias, p) * 1000:.1f}" for p in (50, 95, 99)))
+    print(f"{'CPU do servidor':>26} | {cpu_servidor:.2f} s ({nucleos:.0%} de um núcleo), "
+          f"pico de memória {uso.ru_maxrss / 1024:.0f} MB")
+    print(f"{'CPU do cliente de carga':>26} | {proprio.ru_utime + proprio.ru_stime:.2f} s")
+    print(f"{'sessões por núcleo':>26} | {args.sessoes / max(nucleos, 1e-9):.0f}")
+
+
+if __name__ == "__main__":
+    main()
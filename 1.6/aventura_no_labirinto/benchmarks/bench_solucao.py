@@ -0,0 +1,89 @@
+"""
+Benchmark dos solucionadores: tempo de solução por tamanho de labirinto.
+
+Mede BFS, A* e BFS bidirecional nos tamanhos das dificuldades do jogo
+(facil, medio, dificil) e num labirinto 2000x2000, além do DFS recursivo
+original (reproduzido aqui) enquanto ele não estoura a pilha.
+
+Uso:
+    python benchmarks/bench_solucao.py
+    python benchmarks/bench_solucao.py --grande 1001 --repeticoes 3
+"""
+from __future__ import annotations
+import argparse
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from aventura_pkg.labirinto import criar_labirinto
+from aventura_pkg.solucionador import SOLUCIONADORES
+
+
+def resolver_dfs_legado(lab):
+    """DFS recursivo original (altera e restaura a grade), só para comparação."""
+    origem, destino = lab.entrada, lab.saida
+    visitado = set()
+    caminho = []
+
+    def dfs(c):
+        if c in visitado:
+            return False
+        visitado.add(c)
+        caminho.append(c)
+        if c == destino:
+            return True
+        r, q = c
+        for nr, nq in [(r-1, q), (r+1, q), (r, q-1), (r, q+1)]:
+            if 0 <= nr < lab.altura and 0 <= nq < lab.largura:
+                if lab.grade[nr][nq] in (' ', 'S', '*'):
+                    if dfs((nr, nq)):
+                        return True
+        caminho.pop()
+        return False
+
+    er, eq = origem
+    lab.grade[er][eq] = ' '
+    achou = dfs(origem)
+    lab.grade[er][eq] = 'E'
+    return caminho if achou else None
+
+
+def cronometrar(func, lab, repeticoes: int):
+    """Melhor tempo em `repeticoes` execuções, ou None em caso de RecursionError."""
+    melhor = None
+    for _ in range(repeticoes):
+        t0 = time.perf_counter()
+        try:
+            func(lab)
+        except RecursionError:
+            return None
+        dt = time.perf_counter() - t0
+        melhor = dt if melhor is None else min(melhor, dt)
+    return melhor
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark dos solucionadores.")
+    parser.add_argument("--grande", type=int, default=2001, help="Lado do labirinto grande.")
+    parser.add_argument("--repeticoes", type=int, default=5)
+    parser.add_argument("--semente", type=int, default=1)
+    args = parser.parse_args()
+
+    casos = [("facil", 17, 11), ("medio", 31, 17), ("dificil", 41, 23),
+             (f"{args.grande}²", args.grande, args.grande)]
+    metodos = dict(SOLUCIONADORES, dfs_legado=resolver_dfs_legado)
+    print(f"{'labirinto':>10} | " + " | ".join(f"{m:>12}" for m in metodos))
+    for nome, largura, altura in casos:
+        lab = criar_labirinto(largura, altura, sementes=args.semente)
+        reps = 1 if largura * altura > 10**6 else args.repeticoes
+        tempos = []
+        for func in metodos.values():
+            dt = cronometrar(func, lab, reps)
+            tempos.append(f"{'Recursion':>12}" if dt is None else f"{dt * 1e3:9.3f} ms")
+        print(f"{nome:>10} | " + " | ".join(tempos))
+
+
+if __name__ == "__main__":
+    main()
@@ -5,18 +5,28 @@ Implementa uma CLI com argparse.
 """
 from __future__ import annotations
 import argparse
+import random
+import sys
 import time
+from itertools import islice
 from pathlib import Path
 
-from aventura_pkg.labirinto import criar_labirinto, imprimir_labirinto, resolver_recursivo
-from aventura_pkg.jogador import iniciar_jogador, mover
-from aventura_pkg import utils
+# só o necessário para interpretar os argumentos; o resto (Rich, asyncio,
+# pynput, renderizador, mundo...) é importado no modo que o usa
+from aventura_pkg.labirinto import GERADORES, criar_labirinto, resolver, validar_semente
+from aventura_pkg.jogador import iniciar_jogador, _tentar_mover
+from aventura_pkg.terminal import imprimir
+from aventura_pkg.animacao import Agendador, FPS
+from aventura_pkg import utils, lote
 
-try:
-    from rich.console import Console
-    console = Console()
-except Exception:  # pragma: no cover
-    console = None
+def semente_valida(texto: str) -> int:
+    """Tipo do argparse para --semente: inteiro que cabe em 64 bits com sinal."""
+    try:
+        semente = int(texto)
+        validar_semente(semente)
+    except ValueError as erro:
+        raise argparse.ArgumentTypeError(str(erro)) from None
+    return semente
 
 def parse_args():
     parser = argparse.ArgumentParser(
@@ -28,9 +38,65 @@ def parse_args():
     parser.add_argument("--color", default="green", help="Cor principal do jogador (Rich).")
     parser.add_argument("--dificuldade", choices=["facil", "medio", "dificil"], default="medio",
                         help="Define o tamanho do labirinto.")
+    parser.add_argument("--dificuldade-medida", action="store_true",
+                        help="Escolhe a semente pela dificuldade medida (requer NumPy), "
+                             "não só pelo tamanho.")
+    parser.add_argument("--algoritmo", choices=sorted(GERADORES), default="backtracking",
+                        help="Algoritmo de geração do labirinto.")
     parser.add_argument("--disable-sound", action="store_true", help="Desliga a música/sons do jogo.")
-    parser.add_argument("--auto-solve", action="store_true", help="Assiste a solução recursiva automaticamente.")
+    parser.add_argument("--auto-solve", action="store_true", help="Assiste ao jogo automático (rota que coleta todos os itens).")
     parser.add_argument("--instrucoes", action="store_true", help="Mostra instruções e sai.")
+    parser.add_argument("--semente", type=semente_valida, default=None,
+                        help="Semente do labirinto (no modo em lote, a primeira semente).")
+    parser.add_argument("--carregar", metavar="ARQUIVO",
+                        help="Joga o labirinto salvo em ARQUIVO (formato binário .lab).")
+    parser.add_argument("--salvar", metavar="ARQUIVO",
+                        help="Salva o labirinto gerado em ARQUIVO (formato binário .lab).")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="Diretório do cache em disco de níveis e soluções.")
+    parser.add_argument("--cache-mb", type=float, default=64,
+                        help="Orçamento em MiB do cache de níveis em memória.")
+    parser.add_argument("--infinito", action="store_true",
+                        help="Modo sem fim: mundo gerado em blocos conforme você explora.")
+    parser.add_argument("--minimapa", action="store_true",
+                        help="Mostra um minimapa no canto da tela (desenho por câmera).")
+    parser.add_argument("--gravar", metavar="ARQUIVO",
+                        help="Grava a partida (semente + movimentos) em ARQUIVO para reprodução.")
+    parser.add_argument("--exportar", metavar="ARQUIVO",
+                        help="Grava os quadros da partida (jogo, --auto-solve ou --reproduzir) em ARQUIVO: "
+                             ".cast (asciicast v2), .html (player) ou .svg (último quadro). "
+                             "Não vale com --infinito.")
+    parser.add_argument("--reproduzir", metavar="ARQUIVO",
+                        help="Confere e reproduz uma partida gravada com --gravar e sai.")
+    parser.add_argument("--velocidade", type=float, default=20,
+                        help="Movimentos por segundo na reprodução e no --auto-solve (0 = sem pausa).")
+    parser.add_argument("--duracao", type=float, default=None, metavar="SEG",
+                        help="Duração do --auto-solve em segundos, qualquer que seja o tamanho do caminho.")
+    parser.add_argument("--fps", type=float, default=FPS,
+                        help="Quadros por segundo, no máximo, das animações (passos atrasados saem juntos).")
+    parser.add_argument("--enxame", type=int, default=None, metavar="BOTS",
+                        help="Solta BOTS bots no labirinto (NumPy), mostra o mapa de calor e os tempos até a saída e sai.")
+    parser.add_argument("--politica", choices=["aleatorio", "parede"], default="aleatorio",
+                        help="Como os bots do --enxame andam (sorteio ou seguindo a parede).")
+    parser.add_argument("--passos", type=int, default=2000,
+                        help="Passos máximos dos bots do --enxame.")
+    parser.add_argument("--servidor", metavar="ENDERECO", default=None,
+                        help="Modo servidor: atende partidas em \"host:porta\" ou \"unix:/caminho\" "
+                             "(tamanho por --dificuldade) até Ctrl+C.")
+    parser.add_argument("--tique", type=float, default=0.01, metavar="SEG",
+                        help="No modo servidor, intervalo entre dois lotes de movimentos.")
+    parser.add_argument("--profile", action="store_true",
+                        help="Mede gerar/resolver/render/entrada/espera e mostra os percentis ao sair.")
+    parser.add_argument("--profile-dir", metavar="DIR", default=None,
+                        help="Como --profile, e grava cProfile (.pstats) e linha do tempo (.trace.json) em DIR.")
+    parser.add_argument("--batch", type=int, default=None, metavar="N",
+                        help="Modo em lote: gera e resolve N labirintos sem interface e sai.")
+    parser.add_argument("--workers", type=int, default=None, metavar="K",
+                        help="Processos usados no modo em lote (padrão: nº de CPUs).")
+    parser.add_argument("--saida-lote", default="-", metavar="ARQUIVO",
+                        help="Arquivo de estatísticas do modo em lote ('-' = saída padrão).")
+    parser.add_argument("--formato", choices=lote.FORMATOS, default="jsonl",
+                        help="Formato das estatísticas do modo em lote.")
     return parser.parse_args()
 
 def tamanho_por_dificuldade(nivel: str) -> tuple[int,int]:
@@ -42,12 +108,132 @@ def tamanho_por_dificuldade(nivel: str) -> tuple[int,int]:
         case _:
             return (31, 17)
 
-def main():
-    args = parse_args()
+def semente_por_dificuldade(args, largura: int, altura: int):
+    """Semente do próximo nível: a de `--semente` ou, com `--dificuldade-medida`,
+    uma sorteada entre candidatas pela dificuldade medida (`analise`)."""
+    if args.semente is not None or not args.dificuldade_medida:
+        return args.semente
+    from aventura_pkg import analise
+    return analise.semente_por_dificuldade(largura, altura, args.dificuldade, args.algoritmo,
+                                           itens=5, semente_inicial=random.randrange(2**31 - 64))
+
+def executar_lote(args) -> None:
+    """Modo em lote: só estatísticas, sem Rich nem pausas de animação."""
+    largura, altura = tamanho_por_dificuldade(args.dificuldade)
+    estatisticas = lote.simular_lote(args.batch, largura, altura, itens=5, algoritmo=args.algoritmo,
+                                     semente_inicial=args.semente or 0, workers=args.workers)
+    t0 = time.perf_counter()
+    if args.saida_lote == "-":
+        n = lote.gravar(estatisticas, sys.stdout, args.formato)
+    else:
+        with open(args.saida_lote, "w", encoding="utf-8", newline="") as f:
+            n = lote.gravar(estatisticas, f, args.formato)
+    dt = time.perf_counter() - t0
+    print(f"{n} labirintos em {dt:.2f} s ({n / dt:.0f}/s)", file=sys.stderr)
+
+async def jogar_infinito(mundo, j, cor: str, minimapa: bool = False):
+    """Partida no mundo infinito: blocos em volta do jogador são gerados a cada tique."""
+    import asyncio
+    from aventura_pkg import entrada
+    from aventura_pkg.mundo import gerar_em_segundo_plano
+    from aventura_pkg.renderizador import Camera
+    camera = Camera(mundo, cor=cor, minimapa=minimapa)
+    fundo = asyncio.create_task(gerar_em_segundo_plano(mundo, j, raio=2))
+    try:
+        return await entrada.jogar(mundo, j, camera.desenhar)
+    finally:
+        fundo.cancel()
+
+def desenho_exportado(args, lab, desenhar, passo=None):
+    """`desenhar` e, com --exportar, um `Gravador` que grava os mesmos quadros (senão None)."""
+    if not args.exportar:
+        return desenhar, None
+    from aventura_pkg.gravacao import Gravador
+    gravador = Gravador(lab, cor=args.color, passo=passo)
+    return gravador.junto(desenhar), gravador
+
+def concluir_exportacao(args, gravador) -> None:
+    """Grava o arquivo de --exportar (se houver gravação)."""
+    if gravador is None:
+        return
+    from aventura_pkg.gravacao import exportar
+    n = exportar(gravador, args.exportar, titulo=f"Aventura no Labirinto — {args.name}")
+    texto = (f"{gravador.quadros} quadros ({gravador.duracao:.1f} s) exportados para "
+             f"{args.exportar} ({n / 1024:.0f} KB)")
+    imprimir(f"[dim]{texto}[/]", texto)
+
+def executar_reproducao(args) -> None:
+    """Confere a pontuação gravada e reproduz a partida na tela."""
+    from aventura_pkg import reproducao
+    from aventura_pkg.renderizador import renderizador_para
+    sessao = reproducao.carregar_sessao(args.reproduzir)
+    final = reproducao.simular(sessao)
+    ok = final.pontos == sessao.pontos
+    lab = sessao.labirinto()
+    render = renderizador_para(lab, cor=args.color, minimapa=args.minimapa)
+    # sem pausas (--velocidade 0), a exportação usa 20 movimentos por segundo
+    desenhar, gravador = desenho_exportado(args, lab, render.desenhar, passo=1 / (args.velocidade or 20))
+    reproducao.reproduzir(sessao, desenhar, args.velocidade, lab=lab)
+    concluir_exportacao(args, gravador)
+    texto = (f"{len(sessao.movimentos)} movimentos, {final.pontos} pontos "
+             f"({'confere' if ok else f'declarado: {sessao.pontos}'})")
+    imprimir(f"[{'green' if ok else 'red'}]{texto}[/]", texto)
+
+def executar_enxame(args) -> None:
+    """Enxame de bots: mapa de calor das visitas e distribuição dos tempos até a saída."""
+    from aventura_pkg import enxame
+    largura, altura = tamanho_por_dificuldade(args.dificuldade)
+    semente = semente_por_dificuldade(args, largura, altura)
+    lab = criar_labirinto(largura, altura, sementes=semente, itens=5, algoritmo=args.algoritmo)
+    res = enxame.simular_enxame(lab, args.enxame, args.passos, args.politica, semente or 0)
+    resumo = res.resumo()
+    texto = (f"{res.bots} bots ({args.politica}), {res.passos} passos em {res.segundos:.2f} s: "
+             f"{resumo['chegaram']:.0%} chegaram, cobertura {res.cobertura(lab):.0%}, "
+             f"{resumo['pontos_medio']:.1f} pontos e {resumo['itens_medio']:.2f} itens em média")
+    imprimir(f"[bold]{texto}[/]", texto)
+    imprimir("\n".join(enxame.mapa_calor(res, lab)))
+    faixas = enxame.histograma_saida(res)
+    maior = max((n for _, _, n in faixas), default=0) or 1
+    for inicio, fim, n in faixas:
+        linha = f"{inicio:6d}-{fim:<6d} {n:7d} " + "█" * round(40 * n / maior)
+        imprimir(f"[cyan]{linha}[/]", linha)
+
+def executar_servidor(args) -> None:
+    """Modo servidor: partidas simultâneas pela rede, sem interface local."""
+    from aventura_pkg import servidor
+    largura, altura = tamanho_por_dificuldade(args.dificuldade)
+    imprimir(f"[bold]Servidor em {args.servidor}[/] ({largura}x{altura}, {args.algoritmo}); Ctrl+C para parar",
+             f"Servidor em {args.servidor} ({largura}x{altura}, {args.algoritmo}); Ctrl+C para parar")
+    try:
+        stats = servidor.servir(args.servidor, largura, altura, args.algoritmo, itens=5, tique=args.tique)
+    except FileExistsError as erro:
+        sys.exit(f"--servidor: {erro}")
+    texto = (f"{stats.sessoes_total} sessões, {stats.movimentos} movimentos "
+             f"em {stats.tiques} tiques, {stats.descartados} descartados")
+    imprimir(f"[dim]{texto}[/]", texto)
+
+def executar_sessao(args) -> None:
+    """Roda o modo escolhido na linha de comando (lote, reprodução, instruções ou menu)."""
     nome = args.name
 
+    if args.batch is not None:
+        executar_lote(args)
+        return
+
+    if args.reproduzir:
+        executar_reproducao(args)
+        return
+
+    if args.servidor:
+        executar_servidor(args)
+        return
+
+    if args.enxame is not None:
+        executar_enxame(args)
+        return
+
     if args.instrucoes:
-        utils.imprime_instrucoes("README.md")
+        utils.imprime_instrucoes("README.md", args.cache_dir)
         return
 
     # Música (opcional)
@@ -56,46 +242,121 @@ def main():
         if Path(trilha).exists():
             utils.tocar_musica(trilha)
 
+    from aventura_pkg import serializacao
+    from aventura_pkg.cache import CacheNiveis
+
+    cache = CacheNiveis(int(args.cache_mb * 2**20), args.cache_dir)
+
     # Loop de menu
     while True:
         acao = utils.mostrar_menu(nome)
         if acao == "sair":
             break
 
+        # importados depois do menu: ele aparece sem esperar por asyncio e Rich Text
+        import asyncio
+        from aventura_pkg import entrada, reproducao
+        from aventura_pkg.mundo import MundoInfinito
+        from aventura_pkg.renderizador import renderizador_para
+
+        if acao == "jogar" and args.infinito:
+            import contextlib
+            import tempfile
+            # blocos alterados vão para uma pasta desta partida, apagada no fim
+            with contextlib.ExitStack() as pilha:
+                diretorio = None
+                if args.cache_dir:
+                    base = Path(args.cache_dir) / "mundo"
+                    base.mkdir(parents=True, exist_ok=True)
+                    diretorio = pilha.enter_context(tempfile.TemporaryDirectory(dir=base))
+                mundo = MundoInfinito(semente=args.semente, algoritmo=args.algoritmo, diretorio=diretorio)
+                j = iniciar_jogador(mundo.entrada)
+                asyncio.run(jogar_infinito(mundo, j, args.color, args.minimapa))
+            imprimir(f"[bold green]{nome}: {j.pontos} pontos, {j.itens_coletados} itens[/]",
+                     f"{nome}: {j.pontos} pontos, {j.itens_coletados} itens")
+            continue
+
         largura, altura = tamanho_por_dificuldade(args.dificuldade)
-        lab = criar_labirinto(largura, altura, itens=5)
+        if args.carregar:
+            lab = serializacao.carregar(args.carregar)
+        else:
+            semente = semente_por_dificuldade(args, largura, altura)
+            lab = cache.labirinto(largura, altura, semente, args.algoritmo, itens=5)
+        if args.salvar:
+            serializacao.salvar(lab, args.salvar)
 
         if acao == "assistir" or args.auto_solve:
-            caminho = resolver_recursivo(lab)
+            # rota que coleta todos os itens com o menor número de passos
+            if args.carregar:
+                caminho = resolver(lab, metodo="itens")
+            else:
+                caminho = cache.solucao(lab.largura, lab.altura, lab.semente, lab.algoritmo,
+                                        itens=5, metodo="itens")
             if caminho is None:
-                if console: console.print("[red]Sem solução encontrada![/]")
-                else: print("Sem solução encontrada!")
+                imprimir("[red]Sem solução encontrada![/]", "Sem solução encontrada!")
                 continue
             j = iniciar_jogador(lab.entrada)
-            for cel in caminho:
-                j.pos = cel
-                imprimir_labirinto(lab, j.pos, cor=args.color)
-                time.sleep(0.03)
-            utils.animacao_vitoria_recursiva(20)
+            render = renderizador_para(lab, cor=args.color, minimapa=args.minimapa)
+            desenhar, gravador = desenho_exportado(args, lab, render.desenhar)
+            desenhar(j.pos)
+            passos = iter(zip(caminho, caminho[1:]))
+
+            def avancar(n: int) -> None:
+                for (r, c), (nr, nc) in islice(passos, n):
+                    _tentar_mover(lab, j, (nr - r, nc - c))
+
+            agendador = Agendador(args.fps, args.velocidade, args.duracao)
+            agendador.executar(len(caminho) - 1, avancar, lambda: desenhar(j.pos))
+            concluir_exportacao(args, gravador)
+            imprimir(f"[bold green]Pontos: {j.pontos} ({j.itens_coletados} itens)[/]",
+                     f"Pontos: {j.pontos} ({j.itens_coletados} itens)")
+            utils.animacao_vitoria_recursiva(20, fps=args.fps)
             continue
 
         if acao == "instrucoes":
-            utils.imprime_instrucoes("README.md")
+            utils.imprime_instrucoes("README.md", args.cache_dir)
             continue
 
-        # Jogar de fato
+        # Jogar de fato: uma fonte de entrada para a partida inteira
         j = iniciar_jogador(lab.entrada)
-        while True:
-            imprimir_labirinto(lab, j.pos, cor=args.color)
-            cmd = mover(lab, j)
-            if cmd == "sair":
-                break
-            # vitória?
-            if j.pos == lab.saida:
-                if console: console.print(f"[bold green]Parabéns, {nome}! Pontos: {j.pontos}[/]")
-                else: print(f"Parabéns, {nome}! Pontos: {j.pontos}")
-                utils.animacao_vitoria_recursiva(20)
-                break
+        render = renderizador_para(lab, cor=args.color, minimapa=args.minimapa)
+        # itens contados antes da partida: a reprodução recria o labirinto com eles
+        sessao = reproducao.Sessao.de_labirinto(lab, itens=len(lab.itens)) if args.gravar else None
+        desenhar, gravador = desenho_exportado(args, lab, render.desenhar)
+        resultado = asyncio.run(entrada.jogar(lab, j, desenhar, sessao=sessao))
+        concluir_exportacao(args, gravador)
+        if sessao is not None:
+            sessao.pontos = j.pontos
+            reproducao.salvar_sessao(sessao, args.gravar)
+        if resultado.motivo == "vitoria":
+            imprimir(f"[bold green]Parabéns, {nome}! Pontos: {j.pontos}[/]",
+                     f"Parabéns, {nome}! Pontos: {j.pontos}")
+            utils.animacao_vitoria_recursiva(20, fps=args.fps)
+
+def main():
+    args = parse_args()
+    if args.exportar:
+        from aventura_pkg.gravacao import FORMATOS
+        if Path(args.exportar).suffix.lower() not in FORMATOS:
+            sys.exit(f"--exportar: use uma destas extensões: {', '.join(FORMATOS)}")
+        if args.infinito:
+            sys.exit("--exportar: o mundo infinito não tem tamanho fixo e não pode ser gravado")
+    if args.gravar and args.carregar:
+        from aventura_pkg import serializacao
+        if serializacao.carregar(args.carregar).semente is None:
+            sys.exit("--gravar: o labirinto de --carregar não tem semente, então a partida "
+                     "não poderia ser reproduzida")
+    if args.batch and args.semente is not None:
+        try:
+            validar_semente(args.semente + args.batch - 1)
+        except ValueError as erro:
+            sys.exit(f"--batch: a última semente não cabe em 64 bits ({erro})")
+    if args.profile or args.profile_dir:
+        from aventura_pkg import perfil
+        with perfil.sessao(args.profile_dir):
+            executar_sessao(args)
+    else:
+        executar_sessao(args)
 
 if __name__ == "__main__":
     main()